@@ -17,6 +17,9 @@
 import streamlit as st
 import logging
 import traceback
+from datetime import date, datetime, time
+from streamlit.errors import StreamlitAPIException
+from core.lazy_import import timed_import, get_import_report
 
 # ✅ 페이지 설정
 st.set_page_config(page_title="ERP 차량 관리 시스템", layout="wide", page_icon="./images/favicon.ico")
@@ -24,42 +27,91 @@ st.set_page_config(page_title="ERP 차량 관리 시스템", layout="wide", page
 # 로그 설정
 logging.basicConfig(filename='error_log.txt', level=logging.ERROR)
 
-# ✅ 탭 UI 구성
-tabs = st.tabs([
-"통합 대시보드",  
-"생산 관리",  
-"재고 관리",  
-"판매 관리",  
-"AI 예측 시스템",  
-"AI 분석 시스템",  
-"데이터 뷰어",  
-"시스템 소개"
-])
-
-tab_modules = [
-    ("modules.dashboard", "dashboard_ui"), # 데쉬보드
-    ("modules.production", "production_ui"), # 생산
-    ("modules.inventory", "inventory_ui"), #재고
-    ("modules.export", "export_ui"),  # 수출관리
-    ("modules.prediction", "prediction_ui"), # 예측
-    ("modules.recommendations", "recommendations_ui"), #추천 
-    ("modules.data", "data_preview_ui"), # 인트로
-    ("modules.intro", "intro_ui") # 인트로
-
+# ✅ 페이지 구성 (라벨, 모듈 경로, UI 함수명)
+PAGES = [
+    ("통합 대시보드", "modules.dashboard", "dashboard_ui"), # 데쉬보드
+    ("생산 관리", "modules.production", "production_ui"), # 생산
+    ("재고 관리", "modules.inventory", "inventory_ui"), #재고
+    ("판매 관리", "modules.export", "export_ui"),  # 수출관리
+    ("AI 예측 시스템", "modules.prediction", "prediction_ui"), # 예측
+    ("AI 분석 시스템", "modules.recommendations", "recommendations_ui"), #추천 
+    ("데이터 뷰어", "modules.data", "data_preview_ui"), # 인트로
+    ("시스템 소개", "modules.intro", "intro_ui") # 인트로
 ]
 
-for i, (mod_path, ui_func_name) in enumerate(tab_modules):
-    with tabs[i]:
-        try:
-            module = __import__(mod_path, fromlist=[ui_func_name])
-            getattr(module, ui_func_name)()
-        except Exception as e:
-            error_message = f"[{mod_path}] 실행 중 오류 발생: {e}"
-            st.error(error_message)
-            
-            # 오류 상세 정보를 로그 파일에 기록
-            logging.error(f"Module {mod_path}에서 오류 발생: {traceback.format_exc()}")
-            st.text(f"오류에 대한 자세한 정보는 error_log.txt 파일에 기록되었습니다.")
+# ✅ 네비게이션 모드
+# - "lazy": 선택된 페이지의 모듈만 import/실행 (기본값)
+# - "tabs": 기존 st.tabs 방식, 모든 페이지를 매 rerun마다 실행
+NAVIGATION_MODE = "lazy"
+NAV_KEY = "active_page"
+PAGE_KEYS = "_page_widget_keys"   # 페이지 라벨 -> 그 페이지를 그리는 동안 생긴 위젯 키
+# 다시 대입할 위젯 값 타입 (selectbox/number_input/checkbox 등) - data_editor 편집 상태 같은 객체는 제외
+WIDGET_VALUE_TYPES = (str, int, float, bool, list, tuple, date, datetime, time, type(None))
+
+
+def render_page(mod_path, ui_func_name):
+    try:
+        module = timed_import(mod_path)
+        getattr(module, ui_func_name)()
+    except Exception as e:
+        error_message = f"[{mod_path}] 실행 중 오류 발생: {e}"
+        st.error(error_message)
+        
+        # 오류 상세 정보를 로그 파일에 기록
+        logging.error(f"Module {mod_path}에서 오류 발생: {traceback.format_exc()}")
+        st.text(f"오류에 대한 자세한 정보는 error_log.txt 파일에 기록되었습니다.")
+
+
+def track_page_keys(label, keys_before):
+    # 페이지를 그리는 동안 새로 생긴 키를 그 페이지 소유로 기록 (이미 사라진 키는 정리)
+    owned = st.session_state.setdefault(PAGE_KEYS, {})
+    keys = owned.get(label, set()) | (set(st.session_state.keys()) - keys_before)
+    owned[label] = {key for key in keys
+                    if key in st.session_state and isinstance(st.session_state[key], WIDGET_VALUE_TYPES)}
+
+
+def keep_widget_state(active_label):
+    # 렌더링되지 않은 페이지의 위젯 값은 Streamlit이 rerun 시 정리하므로,
+    # 다른 페이지에서 만든 값 위젯 키만 다시 대입해 페이지를 이동해도 유지되도록 한다.
+    # (현재 페이지 위젯은 그대로 두어야 기본값 + Session State 동시 지정 경고가 나지 않음)
+    owned = st.session_state.get(PAGE_KEYS, {})
+    active_keys = owned.get(active_label, set())
+    for label, keys in owned.items():
+        if label == active_label:
+            continue
+        for key in keys - active_keys:
+            if key not in st.session_state:
+                continue
+            try:
+                st.session_state[key] = st.session_state[key]
+            except StreamlitAPIException:
+                pass
+
+
+if NAVIGATION_MODE == "lazy":
+    labels = [label for label, _, _ in PAGES]
+    selected = st.radio("페이지 선택", labels, horizontal=True, key=NAV_KEY, label_visibility="collapsed")
+    keep_widget_state(selected)
+    _, mod_path, ui_func_name = PAGES[labels.index(selected)]
+    keys_before = set(st.session_state.keys())
+    try:
+        render_page(mod_path, ui_func_name)
+    finally:
+        # st.stop()으로 중간에 끝나도 그때까지 만든 위젯 키는 기록
+        track_page_keys(selected, keys_before)
+else:
+    tabs = st.tabs([label for label, _, _ in PAGES])
+    for i, (_, mod_path, ui_func_name) in enumerate(PAGES):
+        with tabs[i]:
+            render_page(mod_path, ui_func_name)
+
+# ✅ 모듈별 import 시간 리포트 (최초 로드된 모듈만 기록)
+with st.sidebar.expander("⏱ 모듈 로딩 시간", expanded=False):
+    import_report = get_import_report()
+    if import_report:
+        st.dataframe(import_report, use_container_width=True, hide_index=True)
+    else:
+        st.caption("기록된 모듈이 없습니다.")
 
 st.markdown("---")
 st.markdown("""
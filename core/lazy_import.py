@@ -0,0 +1,94 @@
+# core/lazy_import.py
+# ----------------------------
+# 무거운 라이브러리 지연 로딩 및 import 시간 측정
+# - TensorFlow / scikit-learn / huggingface_hub 등은 실제로 사용할 때 import
+# - 모듈별 import 소요 시간을 기록해 시작 시간 리포트 제공
+# 사용 예시 (CLI): python -m core.lazy_import
+# ----------------------------
+
+import importlib
+import subprocess
+import sys
+import threading
+import time
+
+# 모듈명 -> import 소요 시간(초), 프로세스 단위로 공유
+_import_times = {}
+_lock = threading.Lock()
+
+
+def timed_import(name: str):
+    """모듈을 import하고, 이번 호출에서 처음 로드된 경우 소요 시간을 기록"""
+    already_loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if not already_loaded:
+        with _lock:
+            _import_times.setdefault(name, time.perf_counter() - start)
+    return module
+
+
+class LazyModule:
+    """첫 속성 접근 시점에 실제 모듈을 import하는 프록시"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._load_lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._load_lock:
+                if self._module is None:
+                    self._module = timed_import(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
+
+
+def is_loaded(name: str) -> bool:
+    return name in sys.modules
+
+
+def get_import_report() -> list:
+    """기록된 import 시간을 느린 순서로 반환 [{"모듈": ..., "소요시간(초)": ...}]"""
+    with _lock:
+        items = sorted(_import_times.items(), key=lambda x: x[1], reverse=True)
+    return [{"모듈": name, "소요시간(초)": round(sec, 3)} for name, sec in items]
+
+
+def measure_cold_import(name: str) -> float:
+    """새 파이썬 프로세스에서 모듈 하나를 import하는 데 걸리는 시간(초)"""
+    code = (
+        "import time, importlib; s = time.perf_counter(); "
+        f"importlib.import_module({name!r}); print(time.perf_counter() - s)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1] if result.stderr else name)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    # Home.py 페이지 모듈 + 무거운 의존성의 콜드 스타트 import 비용 리포트
+    targets = [
+        "streamlit", "pandas", "matplotlib.pyplot", "sklearn.preprocessing",
+        "tensorflow", "huggingface_hub",
+        "modules.dashboard", "modules.production", "modules.inventory", "modules.export",
+        "modules.prediction", "modules.recommendations", "modules.data", "modules.intro",
+    ]
+    print(f"{'모듈':<28}{'import 시간(초)':>16}")
+    for target in targets:
+        try:
+            print(f"{target:<28}{measure_cold_import(target):>16.3f}")
+        except ImportError as e:
+            print(f"{target:<28}{'실패':>16}  ({e})")
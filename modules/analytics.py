@@ -8,6 +8,7 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import os
 import numpy as np
+from modules.data_registry import cached_by_version, load_merged
 
 # 연도/월 컬럼 추출 함수
 def extract_month_columns(df):
@@ -32,27 +33,12 @@ def apply_filters(df, year, brand):
         filtered_df = filtered_df[filtered_df["브랜드"] == brand]
     return filtered_df
 
-@st.cache_data
+@cached_by_version
 def load_data():
-    # 파일 로드
-    prod_h = pd.read_csv("data/processed/hyundai-by-plant.csv")
-    prod_k = pd.read_csv("data/processed/kia-by-plant.csv")
-    sales_h = pd.read_csv("data/processed/hyundai-by-car.csv")
-    sales_k = pd.read_csv("data/processed/kia-by-car.csv")
-    export_h = pd.read_csv("data/processed/hyundai-by-region.csv")
-    export_k = pd.read_csv("data/processed/kia-by-region.csv")
-
-    for df_, brand_ in [
-        (prod_h, "현대"), (prod_k, "기아"),
-        (sales_h, "현대"), (sales_k, "기아"),
-        (export_h, "현대"), (export_k, "기아")
-    ]:
-        df_["브랜드"] = brand_
-
-    # 병합
-    prod_df = pd.concat([prod_h, prod_k], ignore_index=True)
-    sales_df = pd.concat([sales_h, sales_k], ignore_index=True)
-    export_df = pd.concat([export_h, export_k], ignore_index=True)
+    # 공용 레지스트리의 병합 데이터에 연도 컬럼을 한 번만 추가
+    prod_df = extract_year_column(load_merged("plant").copy())
+    sales_df = extract_year_column(load_merged("car").copy())
+    export_df = extract_year_column(load_merged("region").copy())
 
     return prod_df, sales_df, export_df
 
@@ -157,11 +143,11 @@ def analytics_ui():
 
     # 월별 추이 분석 강화
     st.subheader(" 월별 생산-판매-수출 상관관계 분석")
-    # 월별 합계 계산 함수 정의
+    # 월별 합계 계산 함수 정의 (연도/브랜드 필터가 적용된 행 기준, 없는 월은 0)
     def sum_by_month(df_):
         existing_cols = [c for c in month_cols if c in df_.columns]
-        summed = df_[existing_cols].sum(numeric_only=True).reset_index(name="값").rename(columns={"index": "월"})
-        return summed
+        summed = df_[existing_cols].sum(numeric_only=True).reindex(month_cols, fill_value=0)
+        return summed.rename_axis("월").reset_index(name="값")
 
     prod_m = sum_by_month(prod_filtered).rename(columns={"값": "생산량"})
     sales_m = sum_by_month(sales_filtered).rename(columns={"값": "판매량"})
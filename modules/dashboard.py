@@ -7,6 +7,8 @@ from modules.dashboard_data_loader import load_and_merge_car_data, load_and_merg
 from modules.dashboard_news import fetch_naver_news, render_news_results
 from modules.dashboard_charts import render_hyundai_chart, render_kia_chart, render_export_map, render_top_bottom_summary
 from modules.dashboard_filter import render_filter_options
+from modules.dashboard_ranking import merge_region_name, top_bottom_regions
+from modules.data_long import query_long
 from datetime import datetime, timedelta
 import time
 from bs4 import BeautifulSoup
@@ -48,9 +50,7 @@ def dashboard_ui():
     if company != "전체":
         new_df_region = new_df_region[new_df_region["브랜드"] == company]
     else:
-        new_df_region["지역명"] = new_df_region["지역명"].apply(
-            lambda x: "동유럽 및 구소련" if "구소련" in x else ("유럽" if "유럽" in x else x)
-        )
+        new_df_region["지역명"] = new_df_region["지역명"].apply(merge_region_name)
 
     colA, colB, colC = st.columns([2.15, 1.85, 3.5])
     with colA:
@@ -70,27 +70,8 @@ def dashboard_ui():
 
     merged_df["총수출"] = merged_df[month_cols].sum(axis=1)
 
-    monthly_data = []
-    for month in month_cols:
-        mdata = merged_df[["지역명", month]].copy()
-        mdata.dropna(inplace=True)
-        mdata = mdata[mdata[month] > 0]
-        mdata["월"] = month
-        mdata.rename(columns={month: "수출량"}, inplace=True)
-        monthly_data.append(mdata)
-
-    monthly_df = pd.concat(monthly_data).reset_index(drop=True)
-    grouped_monthly = (
-        monthly_df.groupby(["월", "지역명"], as_index=False)["수출량"]
-        .sum()
-        .sort_values(["월", "수출량"], ascending=[True, False])
-    )
-
-    grouped_monthly["순위_top"] = grouped_monthly.groupby("월")["수출량"].rank(method="first", ascending=False).astype(int)
-    top_df = grouped_monthly[grouped_monthly["순위_top"] <= 3].sort_values(["월", "순위_top"])
-
-    grouped_monthly["순위_bottom"] = grouped_monthly.groupby("월")["수출량"].rank(method="first", ascending=True).astype(int)
-    bottom_df = grouped_monthly[grouped_monthly["순위_bottom"] <= 3].sort_values(["월", "순위_bottom"])
+    # 월별 Top 3 / Bottom 3 - 데이터 버전당 한 번 만든 순위 인덱스에서 슬라이스
+    top_df, bottom_df = top_bottom_regions(company, year, k=3)
 
     colD, colE = st.columns([1, 1])
     with colD:
@@ -133,14 +114,17 @@ def dashboard_ui():
         </div>
         """, unsafe_allow_html=True)
 
-        # 지역명별 월별 수출량
-        aggregated = merged_df.groupby("지역명")[month_cols].sum().reset_index()
-        line_df = aggregated.melt(
-            id_vars="지역명",
-            value_vars=month_cols,
-            var_name="월", value_name="수출량"
+        # 지역명별 월별 수출량 (long 저장소에서 해당 연도만 조회)
+        line_df = query_long("region", brand=company, year=year)
+        if company == "전체":
+            region_names = line_df["지역명"].map({name: merge_region_name(name) for name in line_df["지역명"].unique()})
+        else:
+            region_names = line_df["지역명"]
+        line_df = (
+            line_df.assign(지역명=region_names)
+            .groupby(["연월", "지역명"], as_index=False)["값"].sum()
+            .rename(columns={"연월": "월", "값": "수출량"})
         )
-        line_df.dropna(subset=["수출량"], inplace=True)
         line_df = line_df[line_df["수출량"] > 0]
 
         fig_line = px.line(
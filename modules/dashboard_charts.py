@@ -11,6 +11,7 @@ import pydeck as pdk
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from modules.data_registry import load_columns
 
 # 현대 도넛 차트
 
@@ -20,14 +21,13 @@ def render_hyundai_chart(year: int):
     <h4>현대 공장별 생산 비중</h4>
     """, unsafe_allow_html=True)
 
-    df = pd.read_csv("data/processed/hyundai-by-plant.csv")
-    df["브랜드"] = "현대"
+    # 해당 연도 12개월 컬럼만 로드 (키 컬럼은 category)
+    df = load_columns("현대", "plant", year=year)
     df = df.loc[df["공장명(국가)"] != "CKD (모듈형 조립 방식)", :]
 
     month_cols = [col for col in df.columns if str(year) in col and "-" in col]
-    df[month_cols] = df[month_cols].apply(pd.to_numeric, errors="coerce")
 
-    grouped = df.groupby("공장명(국가)")[month_cols].sum(numeric_only=True).reset_index()
+    grouped = df.groupby("공장명(국가)", observed=True)[month_cols].sum(numeric_only=True).reset_index()
     grouped["총생산"] = grouped[month_cols].sum(axis=1)
 
     if grouped.empty:
@@ -53,13 +53,12 @@ def render_kia_chart(year: int):
     <h4>기아 공장별 생산 비중</h4>
     """, unsafe_allow_html=True)
 
-    df = pd.read_csv("data/processed/kia-by-plant.csv")
-    df["브랜드"] = "기아"
+    # 해당 연도 12개월 컬럼만 로드 (키 컬럼은 category)
+    df = load_columns("기아", "plant", year=year)
 
     month_cols = [col for col in df.columns if str(year) in col and "-" in col]
-    df[month_cols] = df[month_cols].apply(pd.to_numeric, errors="coerce")
 
-    grouped = df.groupby("공장명(국가)")[month_cols].sum(numeric_only=True).reset_index()
+    grouped = df.groupby("공장명(국가)", observed=True)[month_cols].sum(numeric_only=True).reset_index()
     grouped["총생산"] = grouped[month_cols].sum(axis=1)
 
     if grouped.empty:
@@ -1,6 +1,6 @@
 import streamlit as st
 
-from modules.dashboard_kpi import calculate_kpis_by_car, calculate_kpis_by_plant, calculate_kpis_by_region, export_render_kpi_card, prods_render_kpi_card, sales_render_kpi_card
+from modules.dashboard_kpi import compute_kpis, export_render_kpi_card, prods_render_kpi_card, sales_render_kpi_card
 
 def render_filter_options(df_region, df_car, df_plant):
     st.markdown("""
@@ -19,41 +19,15 @@ def render_filter_options(df_region, df_car, df_plant):
     with col3:
         data = st.selectbox("데이터 유형", ["수출", "판매", "생산"], key="dashboard_data")
     st.markdown("---")
-    all_month_cols = [col for col in df_region.columns if col not in ("지역명", "대륙", "브랜드")]
-    month_cols = [col for col in df_region.columns if str(year) in col and "-" in col]
-    
-    new_df_region = df_region.copy()
-    new_df_region["총수출"] = new_df_region[month_cols].sum(axis=1, numeric_only=True)
-    if company != "전체":
-        new_df_region = new_df_region[new_df_region["브랜드"] == company]
-    new_df_region["총수출"] = new_df_region[month_cols].sum(axis=1, numeric_only=True)
-
-    new_df_plant = df_plant.copy()
-    new_df_plant["총생산"] = new_df_plant[month_cols].sum(axis=1, numeric_only=True)
-    if company != "전체":
-        new_df_plant = new_df_plant[new_df_plant["브랜드"] == company]
-    new_df_plant["총생산"] = new_df_plant[month_cols].sum(axis=1, numeric_only=True)
-
-    new_df_car = df_car.copy()
-    new_df_car["총판매"] = new_df_car[month_cols].sum(axis=1, numeric_only=True)
-    if company != "전체":
-        new_df_car = new_df_car[new_df_car["브랜드"] == company]
-    new_df_car["총판매"] = new_df_car[month_cols].sum(axis=1, numeric_only=True)
-
-    kpi_total_export, kpi_region_count, kpi_export_growth, kpi_top_region = calculate_kpis_by_region(new_df_region, month_cols,
-                                                                                                     all_month_cols, company,
-                                                                                                     year)
-    kpi_total_prods, kpi_plant_count, kpi_prods_growth, kpi_top_plant = calculate_kpis_by_plant(new_df_plant, month_cols,
-                                                                                 all_month_cols, company, year)
-    kpi_total_sales, kpi_car_count, kpi_sales_growth, kpi_top_car = calculate_kpis_by_car(new_df_car, month_cols,
-                                                                                          all_month_cols, company, year)
+    # 선택한 데이터 유형의 KPI만 조회 (데이터 버전/브랜드/연도별 메모이즈)
+    kpis = compute_kpis(data, company, year)
 
     if data == "수출":
-        export_render_kpi_card(kpi_total_export, kpi_region_count, kpi_export_growth, kpi_top_region)
+        export_render_kpi_card(*kpis)
     elif data == "생산":
-        prods_render_kpi_card(kpi_total_prods, kpi_plant_count, kpi_prods_growth, kpi_top_plant)
+        prods_render_kpi_card(*kpis)
     elif data == "판매":
-        sales_render_kpi_card(kpi_total_sales, kpi_car_count, kpi_sales_growth, kpi_top_car)
+        sales_render_kpi_card(*kpis)
 
     st.markdown("---")
 
@@ -5,97 +5,75 @@
 # - 동적 스타일링 및 인터랙티브 요소
 # ----------------------------
 
-import streamlit as st
+import numpy as np
 import pandas as pd
+import streamlit as st
 
-def calculate_kpis_by_region(df_region: pd.DataFrame, month_cols: list, all_month_cols: list, brand: str, year: int):
-    if brand != "전체":
-        df_region = df_region[df_region["브랜드"] == brand]
-
-    # 총 수출량
-    df_region["총수출"] = df_region[month_cols].sum(axis=1, numeric_only=True)
-    total_export = int(df_region[month_cols].sum().sum())
-
-    # 수출 지역/국가 수
-    active_export_df = df_region[df_region[month_cols].fillna(0).sum(axis=1) > 0]
-    region_count = active_export_df["지역명"].nunique()
-
-    # 전년 대비 수출 증가율
-    current_year = [col for col in all_month_cols if col.startswith(str(year))]
-    last_year = [col for col in all_month_cols if col.startswith(str(year - 1))]
-    if year == 2016:
-        export_growth = "-"
-    else:
-        current_sum = df_region[current_year].sum().sum()
-        last_sum = df_region[last_year].sum().sum()
-        ratio = (((current_sum - last_sum) / last_sum) * 100).round(2)
-        export_growth = f"{ratio}%" if last_sum > 0 else None
-
-    # 최다 수출 국가
-    top_region = df_region.loc[df_region["총수출"].idxmax(), "지역명"]
-
-
-    return total_export, region_count, export_growth, top_region
-
-
-def calculate_kpis_by_plant(df_plant: pd.DataFrame, month_cols: list, all_month_cols: list, brand: str, year: int):
-    if brand != "전체":
-        df_plant = df_plant[df_plant["브랜드"] == brand]
-
-    # 총 생산량
-    df_plant["총생산"] = df_plant[month_cols].sum(axis=1, numeric_only=True)
-    total_prods = int(df_plant[month_cols].sum().sum())
-
-    # 생산 공장 수
-    df_temp = df_plant[df_plant["총생산"] > 0]
-    plant_count = df_temp["공장명(국가)"].nunique()
-
-    # 전년 대비 생산 증가율
-    current_year = [col for col in all_month_cols if col.startswith(str(year))]
-    last_year = [col for col in all_month_cols if col.startswith(str(year - 1))]
-    if year == 2016:
-        prods_growth = "-"
-    else:
-        current_sum = df_plant[current_year].sum().sum()
-        last_sum = df_plant[last_year].sum().sum()
-        ratio = (((current_sum - last_sum) / last_sum) * 100).round(2)
-        prods_growth = f"{ratio}%" if last_sum > 0 else None
-
-    # 최다 생산 공장
-    top_plant = df_plant.loc[df_plant["총생산"].idxmax(), "공장명(국가)"]
-
-
-    return total_prods, plant_count, prods_growth, top_plant
-
-
-def calculate_kpis_by_car(df_car: pd.DataFrame, month_cols: list, all_month_cols: list, brand: str, year: int):
-    if brand != "전체":
-        df_car = df_car[df_car["브랜드"] == brand]
-    
-    # 총 판매량
-    df_car["총판매"] = df_car[month_cols].sum(axis=1, numeric_only=True)
-    total_sales = int(df_car[month_cols].sum().sum())
-
-    # 판매 차종 수
-    df_car["월별합"] = df_car[month_cols].sum(axis=1, numeric_only=True)
-    car_count = (df_car["월별합"] > 0).sum()
-
-    # 전년 대비 판매 증가율
-    current_year = [col for col in all_month_cols if col.startswith(str(year))]
-    last_year = [col for col in all_month_cols if col.startswith(str(year - 1))]
-    if year == 2016:
-        sales_growth = "-"
-    else:
-        current_sum = df_car[current_year].sum().sum()
-        last_sum = df_car[last_year].sum().sum()
-        ratio = (((current_sum - last_sum) / last_sum) * 100).round(2)
-        sales_growth = f"{ratio}%" if last_sum > 0 else None
-    
-    # 최다 판매 차종
-    top_car = df_car.loc[df_car["총판매"].idxmax(), "차종"]
-
-
-    return total_sales, car_count, sales_growth, top_car
+from modules.data_columnar import is_month_column
+from modules.data_cube import ALL_BRANDS, get_cube
+from modules.data_registry import BRANDS, cached_by_version, load_merged
+
+# 데이터 유형 -> (데이터 종류, 대표 엔티티 컬럼, 엔티티 수 집계 방식)
+# - "unique": 활성 행의 엔티티 컬럼 고유값 수, "rows": 활성 행 수
+KPI_SPECS = {
+    "수출": ("region", "지역명", "unique"),
+    "생산": ("plant", "공장명(국가)", "unique"),
+    "판매": ("car", "차종", "rows"),
+}
+
+@cached_by_version
+def _build_kpi_table(data_type: str) -> dict:
+    """(브랜드, 연도) -> (총량, 활성 엔티티 수, 전년 대비 증가율, 최다 엔티티)
+
+    데이터 유형 하나에 대해 모든 브랜드("전체" 포함) × 연도를 한 번에 계산한다.
+    """
+    kind, label_col, count_mode = KPI_SPECS[data_type]
+    df = load_merged(kind)
+    month_cols = [c for c in df.columns if is_month_column(c)]
+    col_years = np.array([int(c[:4]) for c in month_cols])
+    years = np.unique(col_years)
+
+    # 행 × 연도 합계 행렬 (연도 순으로 정렬한 뒤 reduceat으로 한 번에 합산)
+    order = np.argsort(col_years, kind="stable")
+    values = np.nan_to_num(df[month_cols].to_numpy(dtype="float64")[:, order])
+    starts = np.searchsorted(col_years[order], years)
+    row_year = np.add.reduceat(values, starts, axis=1)
+    labels = df[label_col].to_numpy()
+    brands = df["브랜드"].to_numpy()
+
+    table = {}
+    for brand in [ALL_BRANDS] + list(BRANDS):
+        mask = np.ones(len(df), dtype=bool) if brand == ALL_BRANDS else brands == brand
+        if not mask.any():
+            continue
+        sub = row_year[mask]
+        active = sub > 0
+        if count_mode == "rows":
+            counts = active.sum(axis=0)
+        else:
+            counts = pd.DataFrame(active).groupby(labels[mask]).any().sum(axis=0).to_numpy()
+        # 동률이면 원본 행 순서상 첫 행 (idxmax와 동일)
+        tops = labels[mask][sub.argmax(axis=0)]
+
+        yearly = get_cube().total(kind, brand=brand, by="연도")
+        for i, year in enumerate(years):
+            if i == 0:
+                growth = "-"
+            else:
+                current_sum = yearly.get(year, 0.0)
+                last_sum = yearly.get(years[i - 1], 0.0)
+                growth = f"{round((current_sum - last_sum) / last_sum * 100, 2)}%" if last_sum > 0 else None
+            table[(brand, int(year))] = (int(yearly.get(year, 0.0)), int(counts[i]), growth, tops[i])
+    return table
+
+
+@cached_by_version
+def compute_kpis(data_type: str, brand: str, year: int):
+    """선택한 데이터 유형의 KPI (총량, 엔티티 수, 전년 대비 증가율, 최다 엔티티)
+
+    데이터 버전 × 데이터 유형 × 브랜드 × 연도별로 메모이즈된다.
+    """
+    return _build_kpi_table(data_type).get((brand, int(year)), (0, 0, None, "-"))
 
 
 def export_render_kpi_card(total_export: int, region_count: int, export_growth: int, top_region: str):
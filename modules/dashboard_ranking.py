@@ -0,0 +1,68 @@
+# modules/dashboard_ranking.py
+# ----------------------------
+# 월별 지역 수출량 순위 인덱스
+# - 데이터 버전당 한 번, (브랜드, 연월)마다 수출량 내림차순 지역 목록을 만들어 둠 (브랜드 "전체" 포함)
+# - Top k / Bottom k는 월별 정렬 배열의 앞/뒤 슬라이스 (월 루프 + groupby.rank 두 번 대신)
+# - 수출량이 0이거나 없는 지역은 순위에서 제외, 같은 수출량이면 지역명 순
+# ----------------------------
+
+import numpy as np
+import pandas as pd
+
+from modules.data_cube import ALL_BRANDS
+from modules.data_long import load_long
+from modules.data_registry import cached_by_version
+
+
+def merge_region_name(name):
+    # 브랜드 통합(전체) 보기에서 현대/기아의 서로 다른 유럽 지역 구분을 합침
+    return "동유럽 및 구소련" if "구소련" in name else ("유럽" if "유럽" in name else name)
+
+
+@cached_by_version
+def region_ranking() -> dict:
+    """브랜드 -> {연월: (지역명 배열, 수출량 배열)} - 수출량 내림차순
+
+    반환값은 세션 간에 공유되므로 수정하지 말 것.
+    """
+    long_df = load_long("region")
+    long_df = long_df.loc[long_df["값"] > 0, ["브랜드", "지역명", "연월", "값"]]
+    names = {name: merge_region_name(name) for name in long_df["지역명"].unique()}
+    combined = long_df.assign(브랜드=ALL_BRANDS, 지역명=long_df["지역명"].map(names))
+    totals = (
+        pd.concat([long_df, combined], ignore_index=True)
+        .groupby(["브랜드", "연월", "지역명"], as_index=False)["값"].sum()
+        .sort_values(["브랜드", "연월", "값", "지역명"], ascending=[True, True, False, True], kind="stable")
+    )
+
+    brands = totals["브랜드"].to_numpy()
+    months = totals["연월"].to_numpy()
+    regions = totals["지역명"].to_numpy()
+    values = totals["값"].round().astype("int64").to_numpy()   # 원본과 같은 정수 대수
+    # (브랜드, 연월)이 바뀌는 위치로 구간을 나눠 월별 정렬 배열을 뷰로 보관
+    starts = np.flatnonzero(np.r_[True, (brands[1:] != brands[:-1]) | (months[1:] != months[:-1])])
+    ends = np.r_[starts[1:], len(totals)]
+    ranking = {}
+    for start, end in zip(starts, ends):
+        ranking.setdefault(brands[start], {})[months[start]] = (regions[start:end], values[start:end])
+    return ranking
+
+
+def top_bottom_regions(brand: str, year, k: int = 3):
+    """연도의 월별 수출량 Top k / Bottom k 지역
+
+    Returns:
+        (top_df, bottom_df) - 컬럼: 월, 지역명, 수출량, 순위_top / 순위_bottom (월, 순위 오름차순)
+    """
+    by_month = region_ranking().get(brand, {})
+    prefix = f"{year}-"
+    top_rows, bottom_rows = [], []
+    for month in sorted(m for m in by_month if m.startswith(prefix)):
+        regions, values = by_month[month]
+        for rank, (region, value) in enumerate(zip(regions[:k], values[:k]), start=1):
+            top_rows.append((month, region, value, rank))
+        for rank, (region, value) in enumerate(zip(regions[::-1][:k], values[::-1][:k]), start=1):
+            bottom_rows.append((month, region, value, rank))
+    top_df = pd.DataFrame(top_rows, columns=["월", "지역명", "수출량", "순위_top"])
+    bottom_df = pd.DataFrame(bottom_rows, columns=["월", "지역명", "수출량", "순위_bottom"])
+    return top_df, bottom_df
@@ -1,16 +1,15 @@
 import streamlit as st
-import pandas as pd
 import os
+from modules.data_registry import read_csv_cached
 
 # 파일 경로 함수
 def get_processed_path(filename):
     return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "processed", filename))
 
-# CSV 로드
-@st.cache_data
+# CSV 로드 (공용 레지스트리 캐시)
 def load_csv(filepath):
     try:
-        return pd.read_csv(filepath)
+        return read_csv_cached(filepath)
     except Exception as e:
         st.error(f"❗ {os.path.basename(filepath)} 로드 실패: {e}")
         return None
@@ -0,0 +1,134 @@
+# modules/data_columnar.py
+# ----------------------------
+# data/processed CSV -> Parquet 컬럼형 캐시
+# - 월 컬럼(YYYY-MM)은 int32, 키 컬럼(지역명/차종/공장명(국가)/거래 구분 등)은 category로 저장
+# - 컬럼 단위로 읽기 가능 (예: 특정 연도 12개월 컬럼만)
+# - CSV가 캐시보다 최신이면 자동으로 재생성, 캐시가 손상됐으면 한 번 다시 만들고, pyarrow가 없으면 CSV로 대체
+# 사용 예시 (CLI): python -m modules.data_columnar [--force]
+# ----------------------------
+
+import os
+import sys
+
+import pandas as pd
+
+from modules.data_registry import BRANDS, KINDS, PROCESSED_DIR, get_dataset_path
+
+CACHE_DIR = os.path.join(PROCESSED_DIR, ".cache")
+
+# category로 저장할 키 컬럼
+CATEGORY_COLUMNS = ["지역명", "대륙", "차종", "차량 유형", "공장명(국가)", "거래 구분"]
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+def is_month_column(col) -> bool:
+    col = str(col)
+    return len(col) == 7 and col[4] == "-" and col[:4].isdigit() and col[5:].isdigit()
+
+
+def get_cache_path(brand: str, kind: str) -> str:
+    return os.path.join(CACHE_DIR, f"{BRANDS[brand]}-by-{kind}.parquet")
+
+
+def to_typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV 원본을 저장용 타입으로 변환"""
+    df = df.copy()
+    for col in df.columns:
+        if is_month_column(col):
+            values = pd.to_numeric(df[col], errors="coerce")
+            # 결측치가 있거나 정수가 아닌 값이 있으면 float64 유지
+            if values.notna().all() and (values % 1 == 0).all():
+                df[col] = values.astype("int32")
+            else:
+                df[col] = values.astype("float64")
+        elif col in CATEGORY_COLUMNS:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def is_cache_fresh(brand: str, kind: str) -> bool:
+    cache_path = get_cache_path(brand, kind)
+    if not os.path.exists(cache_path):
+        return False
+    return os.path.getmtime(cache_path) >= os.path.getmtime(get_dataset_path(brand, kind))
+
+
+def build_one(brand: str, kind: str, force: bool = False) -> str:
+    """데이터셋 하나의 Parquet 캐시 생성 (최신이면 건너뜀)"""
+    cache_path = get_cache_path(brand, kind)
+    if not force and is_cache_fresh(brand, kind):
+        return cache_path
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    typed = to_typed_frame(pd.read_csv(get_dataset_path(brand, kind)))
+    # 동시에 여러 세션이 재생성해도 깨진 파일이 읽히지 않도록 임시 파일 후 교체
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    typed.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def build_columnar_cache(force: bool = False) -> list:
+    if not PARQUET_AVAILABLE:
+        raise ImportError("Parquet 캐시를 만들려면 pyarrow가 필요합니다. (pip install pyarrow)")
+    return [build_one(brand, kind, force=force) for brand in BRANDS for kind in KINDS]
+
+
+def select_columns(all_columns, columns=None, year=None) -> list:
+    """키 컬럼 + 요청한 컬럼(또는 해당 연도 월 컬럼)만 선택"""
+    key_cols = [c for c in all_columns if not is_month_column(c)]
+    if columns is not None:
+        wanted = set(columns)
+        return [c for c in all_columns if c in wanted]
+    if year is not None:
+        return key_cols + [c for c in all_columns if is_month_column(c) and c.startswith(f"{year}-")]
+    return list(all_columns)
+
+
+def _read_parquet(brand: str, kind: str, columns=None, year=None, force: bool = False) -> pd.DataFrame:
+    cache_path = build_one(brand, kind, force=force)
+    all_columns = pq.read_schema(cache_path).names
+    return pd.read_parquet(cache_path, columns=select_columns(all_columns, columns, year))
+
+
+def read_columnar(brand: str, kind: str, columns=None, year=None, categorical: bool = True) -> pd.DataFrame:
+    """타입이 지정된 데이터셋 로드
+
+    Args:
+        columns: 읽을 컬럼 목록 (지정 시 그 컬럼만 읽음)
+        year: 지정 시 키 컬럼 + 해당 연도 월 컬럼만 읽음
+        categorical: False면 키 컬럼을 일반 문자열(object)로 돌려줌
+    """
+    csv_path = get_dataset_path(brand, kind)
+    df = None
+    if PARQUET_AVAILABLE:
+        try:
+            df = _read_parquet(brand, kind, columns, year)
+        except pa.ArrowException:
+            # 손상되었거나 스키마가 맞지 않는 캐시는 한 번 다시 만들어 읽고, 그래도 안 되면 CSV로 대체
+            try:
+                df = _read_parquet(brand, kind, columns, year, force=True)
+            except (OSError, pa.ArrowException):
+                df = None
+        except OSError:
+            # 캐시 디렉토리에 쓸 수 없는 환경 등은 CSV로 대체
+            df = None
+    if df is None:
+        header = pd.read_csv(csv_path, nrows=0).columns
+        df = to_typed_frame(pd.read_csv(csv_path, usecols=select_columns(header, columns, year)))
+    if not categorical:
+        for col in df.columns:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype(object)
+    return df
+
+
+if __name__ == "__main__":
+    force = "--force" in sys.argv
+    for path in build_columnar_cache(force=force):
+        print(f"생성 완료: {os.path.relpath(path)}")
@@ -0,0 +1,100 @@
+# modules/data_cube.py
+# ----------------------------
+# 브랜드 × 엔티티 × 연도 × 월 사전 집계 큐브
+# - long 저장소(modules/data_long.py)를 기반으로 모든 집계 수준(브랜드 "전체", 연도/월 전체 포함)을 미리 합산
+# - 조회는 딕셔너리 조회 한 번 (예: cube.total(kind="region", brand="기아", year=2024, by="지역명"))
+# - 데이터 파일이 바뀔 때만 다시 계산
+# ----------------------------
+
+import itertools
+
+import pandas as pd
+
+from modules.data_long import load_long
+from modules.data_registry import cached_by_version
+
+KEY_LEVELS = ["브랜드", "연도", "월"]
+ALL_BRANDS = "전체"
+
+
+def _normalize_by(by) -> tuple:
+    if by is None:
+        return ()
+    if isinstance(by, str):
+        return (by,)
+    return tuple(by)
+
+
+@cached_by_version
+def _build_slices(kind: str, by: tuple) -> dict:
+    """(브랜드, 연도, 월) -> by 기준 합계 Series (by가 없으면 스칼라)
+
+    브랜드 "전체", 연도 None, 월 None은 해당 수준을 모두 합산한 값이다.
+    """
+    long_df = load_long(kind)
+    group_cols = KEY_LEVELS + [c for c in by if c not in KEY_LEVELS]
+    base = long_df.groupby(group_cols, observed=True)["값"].sum()
+
+    def shape(series):
+        # by에 지정한 순서대로 인덱스 정렬
+        if len(by) > 1:
+            series = series.reorder_levels(list(by))
+        return series
+
+    slices = {}
+    for roll_brand, roll_year, roll_month in itertools.product([False, True], repeat=3):
+        rolled = {"브랜드": roll_brand, "연도": roll_year, "월": roll_month}
+        # by에 포함된 수준은 합산하지 않고 결과 Series의 인덱스로 남김
+        keep = [c for c in group_cols if c in by or not rolled.get(c, False)]
+        key_levels = [c for c in KEY_LEVELS if not rolled[c]]
+        drop = [c for c in key_levels if c not in by]
+
+        def make_key(values):
+            values = dict(zip(key_levels, values))
+            return (values.get("브랜드", ALL_BRANDS), values.get("연도"), values.get("월"))
+
+        if not keep:
+            slices[make_key(())] = float(base.sum())
+            continue
+        agg = base if keep == group_cols else base.groupby(level=keep).sum()
+
+        if not key_levels:
+            slices[make_key(())] = shape(agg)
+            continue
+        level = key_levels if len(key_levels) > 1 else key_levels[0]
+        for key, grp in agg.groupby(level=level):
+            key = key if isinstance(key, tuple) else (key,)
+            if by:
+                slices[make_key(key)] = shape(grp.droplevel(drop) if drop else grp)
+            else:
+                slices[make_key(key)] = float(grp.sum())
+    return slices
+
+
+class AggregationCube:
+    """사전 집계 큐브 조회 인터페이스"""
+
+    def total(self, kind: str, brand: str = ALL_BRANDS, year=None, month=None, by=None):
+        """합계 조회
+
+        Args:
+            kind: "region" / "car" / "plant"
+            brand: "현대" / "기아" / "전체"
+            year, month: None이면 전체 기간 합계
+            by: 분해 기준 컬럼 (str 또는 list) - 예) "지역명", ["공장명(국가)", "연도", "월"]
+        Returns:
+            by가 없으면 float, 있으면 by 값을 인덱스로 하는 pd.Series
+        """
+        by = _normalize_by(by)
+        key = (brand or ALL_BRANDS, int(year) if year is not None else None, int(month) if month is not None else None)
+        result = _build_slices(kind, by).get(key)
+        if result is None:
+            return pd.Series(dtype="float64") if by else 0.0
+        return result
+
+
+_cube = AggregationCube()
+
+
+def get_cube() -> AggregationCube:
+    return _cube
@@ -0,0 +1,107 @@
+# modules/data_long.py
+# ----------------------------
+# 월별 시계열 long(tidy) 저장소
+# - 넓은 형태(YYYY-MM 컬럼 110여 개)의 데이터를 데이터 버전당 한 번만 long 형태로 변환
+# - 컬럼: 브랜드, 종류, 엔티티 키 컬럼, 엔티티, 기간(월 정수 인덱스), 연도, 월, 연월, 값
+# - (브랜드, 엔티티, 기간) 순으로 정렬되어 있어 시계열 하나는 슬라이스로 조회
+# ----------------------------
+
+import numpy as np
+import pandas as pd
+
+from modules.data_columnar import is_month_column
+from modules.data_registry import BRANDS, cached_by_version, load_dataset
+
+# 종류별 엔티티 키 컬럼 (데이터셋에 없는 컬럼은 건너뜀)
+ENTITY_KEYS = {
+    "region": ["지역명"],
+    "car": ["차종", "거래 구분"],
+    "plant": ["공장명(국가)", "차종", "거래 구분"],
+}
+
+
+def period_of(year: int, month: int) -> int:
+    """(연도, 월) -> 월 단위 정수 인덱스"""
+    return year * 12 + (month - 1)
+
+
+def period_to_label(period: int) -> str:
+    return f"{period // 12}-{period % 12 + 1:02d}"
+
+
+def _melt_one(df: pd.DataFrame, kind: str) -> pd.DataFrame:
+    month_cols = [c for c in df.columns if is_month_column(c)]
+    attr_cols = [c for c in df.columns if c not in month_cols]
+    key_cols = [c for c in ENTITY_KEYS[kind] if c in df.columns]
+
+    years = np.array([int(c[:4]) for c in month_cols])
+    months = np.array([int(c[5:7]) for c in month_cols])
+    n_rows, n_months = len(df), len(month_cols)
+
+    # 행 반복(np.repeat) + 월 정보 타일(np.tile)로 melt를 한 번에 구성
+    long_df = pd.DataFrame({col: np.repeat(df[col].to_numpy(), n_months) for col in attr_cols})
+    long_df["엔티티"] = np.repeat(
+        df[key_cols].astype(str).agg("-".join, axis=1).to_numpy(), n_months
+    )
+    long_df["연도"] = np.tile(years, n_rows)
+    long_df["월"] = np.tile(months, n_rows)
+    long_df["기간"] = long_df["연도"] * 12 + (long_df["월"] - 1)
+    long_df["연월"] = np.tile(np.array(month_cols, dtype=object), n_rows)
+    long_df["값"] = df[month_cols].to_numpy(dtype="float64").ravel()
+    return long_df
+
+
+@cached_by_version
+def load_long(kind: str) -> pd.DataFrame:
+    """종류(region/car/plant)별 long 테이블 (현대 + 기아, 결측값 제외)
+
+    반환값은 세션 간에 공유되므로 수정하지 말 것.
+    """
+    frames = [_melt_one(load_dataset(brand, kind), kind) for brand in BRANDS]
+    long_df = pd.concat(frames, ignore_index=True)
+    long_df = long_df[long_df["값"].notna()].assign(종류=kind)
+    front = ["브랜드", "종류"]
+    long_df = long_df[front + [c for c in long_df.columns if c not in front]]
+    long_df = long_df.sort_values(["브랜드", "엔티티", "기간"], kind="stable").reset_index(drop=True)
+    return long_df
+
+
+@cached_by_version
+def _series_index(kind: str) -> dict:
+    """(브랜드, 엔티티) -> long 테이블 행 범위(slice)"""
+    long_df = load_long(kind)
+    keys = list(zip(long_df["브랜드"], long_df["엔티티"]))
+    index = {}
+    start = 0
+    for i in range(1, len(keys) + 1):
+        if i == len(keys) or keys[i] != keys[start]:
+            index[keys[start]] = slice(start, i)
+            start = i
+    return index
+
+
+def get_series(kind: str, brand: str, entity: str) -> pd.DataFrame:
+    """엔티티 하나의 월별 시계열 (기간 오름차순)"""
+    rows = _series_index(kind).get((brand, entity))
+    if rows is None:
+        return load_long(kind).iloc[0:0]
+    return load_long(kind).iloc[rows]
+
+
+def query_long(kind: str, brand=None, year=None, **keys) -> pd.DataFrame:
+    """조건에 맞는 long 테이블 행 조회
+
+    Args:
+        brand: 브랜드명 (None 또는 "전체"면 전체)
+        year: 연도 (None이면 전체 기간)
+        keys: 엔티티 키 컬럼 조건, 예) query_long("plant", **{"공장명(국가)": "인도"})
+    """
+    long_df = load_long(kind)
+    mask = np.ones(len(long_df), dtype=bool)
+    if brand is not None and brand != "전체":
+        mask &= (long_df["브랜드"] == brand).to_numpy()
+    if year is not None:
+        mask &= (long_df["연도"] == int(year)).to_numpy()
+    for col, value in keys.items():
+        mask &= (long_df[col] == value).to_numpy()
+    return long_df[mask]
@@ -0,0 +1,173 @@
+# modules/data_registry.py
+# ----------------------------
+# data/processed 데이터셋 공용 레지스트리
+# - 현대/기아 × 지역별(region)/차종별(car)/공장별(plant) 6개 CSV를 프로세스당 한 번만 로드
+# - 브랜드 컬럼은 로드 시 한 번만 태깅
+# - 로드된 DataFrame은 모든 세션이 공유 (읽기 전용: 수정이 필요하면 .copy() 후 사용)
+# - 파일 수정 시각(mtime)이 바뀌면 자동으로 다시 로드
+# - 일부 컬럼만 필요한 화면은 load_columns()로 필요한 컬럼(예: 한 해 12개월)만 category 타입으로 로드
+# ----------------------------
+
+import functools
+import os
+import threading
+
+import pandas as pd
+
+PROCESSED_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "processed"))
+
+# 브랜드명 -> 파일명 접두사
+BRANDS = {"현대": "hyundai", "기아": "kia"}
+KINDS = ("region", "car", "plant")
+
+_lock = threading.RLock()
+_csv_cache = {}      # 절대경로 -> (mtime, DataFrame)
+_tagged_cache = {}   # (브랜드, 종류) -> (mtime, DataFrame)
+_merged_cache = {}   # 종류 -> (mtime 튜플, DataFrame)
+_projected_cache = {}   # (브랜드, 종류, 컬럼, 연도) -> (mtime, DataFrame)
+
+
+def get_dataset_path(brand: str, kind: str) -> str:
+    if brand not in BRANDS:
+        raise ValueError(f"알 수 없는 브랜드입니다: {brand}")
+    if kind not in KINDS:
+        raise ValueError(f"알 수 없는 데이터 종류입니다: {kind}")
+    return os.path.join(PROCESSED_DIR, f"{BRANDS[brand]}-by-{kind}.csv")
+
+
+def _mtime(path: str) -> float:
+    return os.path.getmtime(path)
+
+
+def _find_dataset(path: str):
+    for brand in BRANDS:
+        for kind in KINDS:
+            if get_dataset_path(brand, kind) == path:
+                return brand, kind
+    return None
+
+
+def read_csv_cached(path: str) -> pd.DataFrame:
+    """CSV를 mtime 기준으로 캐시해 읽기 (공유 객체 반환)
+
+    6개 처리 데이터셋 경로면 load_raw()와 같은 객체를 돌려준다.
+    """
+    path = os.path.abspath(path)
+    dataset = _find_dataset(path)
+    if dataset is not None:
+        return load_raw(*dataset)
+    mtime = _mtime(path)
+    with _lock:
+        cached = _csv_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        df = pd.read_csv(path)
+        _csv_cache[path] = (mtime, df)
+        return df
+
+
+def load_raw(brand: str, kind: str) -> pd.DataFrame:
+    """브랜드 컬럼이 없는 원본 형태 (예측 모델 입력 등)
+
+    Parquet 컬럼형 캐시(modules/data_columnar.py)를 거쳐 읽으며,
+    월 컬럼은 int32(결측치가 있으면 float64)로 고정된다.
+    """
+    from modules.data_columnar import read_columnar
+
+    path = get_dataset_path(brand, kind)
+    mtime = _mtime(path)
+    with _lock:
+        cached = _csv_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        df = read_columnar(brand, kind, categorical=False)
+        _csv_cache[path] = (mtime, df)
+        return df
+
+
+def load_columns(brand: str, kind: str, columns=None, year=None) -> pd.DataFrame:
+    """필요한 컬럼만 읽은 데이터셋 (키 컬럼은 category, 월 컬럼은 int32)
+
+    Args:
+        columns: 읽을 컬럼 목록
+        year: 지정 시 키 컬럼 + 해당 연도 월 컬럼만 읽음
+    """
+    from modules.data_columnar import read_columnar
+
+    path = get_dataset_path(brand, kind)
+    mtime = _mtime(path)
+    key = (brand, kind, tuple(columns) if columns is not None else None, year)
+    with _lock:
+        cached = _projected_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        df = read_columnar(brand, kind, columns=columns, year=year)
+        _projected_cache[key] = (mtime, df)
+        return df
+
+
+def load_dataset(brand: str, kind: str) -> pd.DataFrame:
+    """'브랜드' 컬럼이 태깅된 단일 브랜드 데이터셋"""
+    path = get_dataset_path(brand, kind)
+    mtime = _mtime(path)
+    key = (brand, kind)
+    with _lock:
+        cached = _tagged_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        df = load_raw(brand, kind).copy()
+        df["브랜드"] = brand
+        _tagged_cache[key] = (mtime, df)
+        return df
+
+
+def load_merged(kind: str) -> pd.DataFrame:
+    """현대 + 기아 병합 데이터셋 (현대 행이 먼저)"""
+    mtimes = tuple(_mtime(get_dataset_path(brand, kind)) for brand in BRANDS)
+    with _lock:
+        cached = _merged_cache.get(kind)
+        if cached is not None and cached[0] == mtimes:
+            return cached[1]
+        df = pd.concat([load_dataset(brand, kind) for brand in BRANDS], ignore_index=True)
+        _merged_cache[kind] = (mtimes, df)
+        return df
+
+
+def dataset_version() -> tuple:
+    """6개 데이터셋의 mtime 튜플 - 파생 데이터 캐시 키로 사용"""
+    return tuple(_mtime(get_dataset_path(brand, kind)) for brand in BRANDS for kind in KINDS)
+
+
+def cached_by_version(func):
+    """데이터셋 버전 + 인자 기준으로 결과를 프로세스 전역에 캐시하는 데코레이터
+
+    데이터 파일이 바뀌면 이전 버전의 결과는 버리고 다시 계산한다.
+    반환값은 세션 간에 공유되므로 호출하는 쪽에서 수정하지 않아야 한다.
+    """
+    cache = {}
+    cache_lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        version = dataset_version()
+        key = (version, args, tuple(sorted(kwargs.items())))
+        with cache_lock:
+            if key in cache:
+                return cache[key]
+        result = func(*args, **kwargs)
+        with cache_lock:
+            for stale in [k for k in cache if k[0] != version]:
+                del cache[stale]
+            cache[key] = result
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+def clear_cache():
+    with _lock:
+        _csv_cache.clear()
+        _tagged_cache.clear()
+        _merged_cache.clear()
+        _projected_cache.clear()
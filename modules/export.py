@@ -7,6 +7,9 @@ from datetime import datetime, timedelta
 import urllib3
 import re
 import ace_tools_open as tools
+from modules.data_cube import get_cube
+from modules.data_long import query_long
+from modules.data_registry import cached_by_version, read_csv_cached
 
 # 수출관리 
 
@@ -14,16 +17,16 @@ import ace_tools_open as tools
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
-# 데이터 로드 함수 - 캐시 처리
-@st.cache_data
+# 데이터 로드 함수 - 공용 레지스트리 캐시 사용
 def load_csv(path):
     try:
-        return pd.read_csv(path)
+        return read_csv_cached(path)
     except Exception as e:
         st.error(f"csv 파일 로드 중 오류 발생: {str(e)}")
         return None
 
-# 데이터 병합 함수 (수출 실적)
+# 데이터 병합 함수 (수출 실적) - 데이터 버전별로 한 번만 가공
+@cached_by_version
 def load_and_merge_export_data(hyundai_path="data/processed/hyundai-by-region.csv", 
                                 kia_path="data/processed/kia-by-region.csv"):
     df_h = load_csv(hyundai_path)
@@ -32,6 +35,9 @@ def load_and_merge_export_data(hyundai_path="data/processed/hyundai-by-region.cs
     if df_h is None or df_k is None:
         return None
 
+    df_h = df_h.copy()
+    df_k = df_k.copy()
+
     df_h["브랜드"] = "현대"
     df_k["브랜드"] = "기아"
     
@@ -87,6 +93,16 @@ def extract_year_column(df):
 
     return df
 
+# 브랜드/국가별 연도 총수출량 (연도 -> 수출량 Series)
+def get_yearly_exports(brand, country):
+    cube = get_cube()
+    all_years = cube.total("region", by="연도").index
+    by_region_year = cube.total("region", brand=brand, by=["지역명", "연도"])
+    if country not in by_region_year.index.get_level_values("지역명"):
+        return pd.Series(0.0, index=all_years)
+    # 값이 없는 연도는 0으로 채움
+    return by_region_year.loc[country].reindex(all_years, fill_value=0.0)
+
 # 필터링 UI 생성 함수
 def get_filter_values(df, key_prefix):
     col1, col2, col3 = st.columns(3)
@@ -154,10 +170,12 @@ def export_ui():
             avg_export = int(filtered[month_filter_cols].mean(numeric_only=True).mean(skipna=True))
             type_count = filtered["차량 구분"].nunique()
 
-            # 월별 수출량 차트
-            df_melted = filtered.melt(id_vars=["차량 구분"], value_vars=month_filter_cols, var_name="월", value_name="수출량")
-            df_melted.dropna(subset=["수출량"], inplace=True)
-            df_melted["월_숫자"] = df_melted["월"].apply(lambda x: int(x.split("-")[1]))
+            # 월별 수출량 차트 (long 저장소 조회, 결측값은 저장소에서 이미 제외)
+            df_melted = query_long("region", brand=brand, year=year, 지역명=country)
+            df_melted = df_melted.merge(filtered[["지역명", "차량 구분"]], on="지역명", how="left")
+            df_melted = df_melted[["차량 구분", "연월", "값", "월"]].rename(
+                columns={"연월": "월", "값": "수출량", "월": "월_숫자"}
+            )
 
             if not df_melted.empty:
                 # 라인차트
@@ -238,8 +256,12 @@ def export_ui():
         if grouped.empty:
             st.warning("선택한 조건에 해당하는 데이터가 없습니다.")
         else:
-            compare_df = grouped.groupby("지역명")[month_cols].sum(numeric_only=True).reset_index()
-            melted_df = compare_df.melt(id_vars=["지역명"], var_name="월", value_name="수출량")
+            melted_df = (
+                query_long("region", brand=brand)
+                .groupby(["기간", "연월", "지역명"], as_index=False)["값"].sum()
+                .drop(columns="기간")
+                .rename(columns={"연월": "월", "값": "수출량"})
+            )
 
             fig = px.bar(
                 melted_df,
@@ -292,19 +314,9 @@ def export_ui():
         if start_year >= end_year :
             st.error("시작 연도는 끝 연도보다 작아야 합니다.")
         else:
-            yearly = df[(df["브랜드"] == brand) & (df["지역명"] == country)]
-
-            # 연도 추출
-            all_years = sorted({col[:4] for col in df.columns if "-" in col and col[:4].isdigit()})
-
-            # 연도별 총수출량 컬럼 생성
-            total_export_by_year = {}
-
-            for y in all_years:
-                year_cols = [col for col in df.columns if col.startswith(y) and "-" in col]
-                if year_cols:
-                    total = yearly[year_cols].sum(numeric_only=True).sum()
-                    total_export_by_year[f"{y}-총수출"] = [int(total)]
+            # 연도별 총수출량 컬럼 생성 (사전 집계 큐브 조회)
+            yearly = get_yearly_exports(brand, country)
+            total_export_by_year = {f"{y}-총수출": [int(total)] for y, total in yearly.items()}
 
             # 데이터프레임으로 변환
             export_df = pd.DataFrame(total_export_by_year)
@@ -355,16 +367,9 @@ def export_ui():
         brand, year, country = get_filter_values(df, "export_4")
         goal = st.number_input(" 수출 목표 (대)", min_value=0, step=10000, value=200000)
 
-        # 1. 연도별 총수출량 컬럼 생성
-        all_years = sorted({col[:4] for col in df.columns if "-" in col and col[:4].isdigit()})
-        total_export_by_year = {}
-
-        for y in all_years:
-            year_cols = [col for col in df.columns if col.startswith(y) and "-" in col]
-            yearly_filtered = df[(df["브랜드"] == brand) & (df["지역명"] == country)]
-            if year_cols and not yearly_filtered.empty:
-                total = yearly_filtered[year_cols].sum(numeric_only=True).sum()
-                total_export_by_year[f"{y}-총수출"] = int(total)
+        # 1. 연도별 총수출량 컬럼 생성 (사전 집계 큐브 조회)
+        yearly = get_yearly_exports(brand, country)
+        total_export_by_year = {f"{y}-총수출": int(total) for y, total in yearly.items()}
 
         # 2. export_df 생성
         export_df = pd.DataFrame([total_export_by_year])
@@ -472,17 +477,8 @@ def export_ui():
                 key="t5_country"
             )
 
-        # 연도 목록
-        year_list = sorted({int(col[:4]) for col in df.columns if "-" in col and col[:4].isdigit()})
-
-        # 연도별 총수출량 계산
-        export_by_year = {}
-        for y in year_list:
-            year_cols = [col for col in df.columns if col.startswith(str(y))]
-            filtered = df[(df["브랜드"] == brand) & (df["지역명"] == country)]
-            if not filtered.empty:
-                total = filtered[year_cols].sum(numeric_only=True).sum()
-                export_by_year[y] = total
+        # 연도별 총수출량 계산 (사전 집계 큐브 조회)
+        export_by_year = get_yearly_exports(brand, country).to_dict()
 
         # 최소 2개 연도 이상 필요
         if start_year >= end_year:
@@ -0,0 +1,209 @@
+# modules/forecast_api.py
+# ----------------------------
+# 예측 HTTP API (Streamlit 없이 실행, 표준 라이브러리 http.server)
+# - GET  /health
+# - GET  /series/{종류}                                          시계열 이름 목록
+# - GET  /forecast/{종류}?name=미국&months=12&engine=lstm[&intervals=1]
+# - POST /forecast/batch  {"requests": [{"kind", "name", "months", "engine", "intervals"}, ...]}
+#   (항목마다 성공/실패를 따로 돌려줌, 생략한 값은 요청 최상위의 months/engine/intervals 또는 기본값)
+# - GET  /models/status                                          학습된 모델 수, 모델/예측 결과 캐시 현황
+# - 요청마다 스레드 하나(ThreadingHTTPServer), 배치 항목은 공용 스레드 풀에서 병렬 처리
+# - 예측은 modules/forecast_service.py 경유 → 모델 캐시/예측 결과 캐시를 프로세스 안의 모든 요청이 공유
+# 사용 예시 (CLI):
+#   python -m modules.forecast_api --port 8600 --workers 8
+#   curl "http://127.0.0.1:8600/forecast/region?name=%EB%AF%B8%EA%B5%AD&months=6&engine=holt_winters"
+# ----------------------------
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import numpy as np
+
+from modules.forecast_series import list_series
+from modules.forecast_service import VALUE_COLUMNS, ModelNotReadyError, get_forecast, model_status
+
+DEFAULT_PORT = 8600
+DEFAULT_ENGINE = "lstm"
+DEFAULT_MONTHS = 12
+MAX_BATCH_SIZE = 5000
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"JSON으로 변환할 수 없는 값입니다: {type(value).__name__}")
+
+
+def _flag(value) -> bool:
+    return str(value).lower() in ("1", "true", "yes")
+
+
+def forecast_item(kind: str, name: str, months=DEFAULT_MONTHS, engine: str = DEFAULT_ENGINE,
+                  intervals=False) -> dict:
+    """예측 한 건 -> 응답 dict (오류는 ApiError로 HTTP 상태와 함께 전달)"""
+    if not name:
+        raise ApiError(400, "name이 필요합니다")
+    try:
+        forecast = get_forecast(engine, kind, name, int(months), _flag(intervals))
+    except ModelNotReadyError as e:
+        raise ApiError(409, str(e))
+    except KeyError as e:
+        raise ApiError(404, e.args[0] if e.args else str(e))
+    except (TypeError, ValueError) as e:
+        raise ApiError(400, str(e))
+    return {"kind": kind, "name": name, "engine": engine, "months": int(months),
+            "forecast": forecast.to_dict(orient="records")}
+
+
+def _batch_entry(request: dict, defaults: dict) -> dict:
+    params = {**defaults, **request}
+    try:
+        return {"status": 200, **forecast_item(params.get("kind"), params.get("name"),
+                                               params.get("months", DEFAULT_MONTHS),
+                                               params.get("engine", DEFAULT_ENGINE),
+                                               params.get("intervals", False))}
+    except ApiError as e:
+        return {"status": e.status, "kind": params.get("kind"), "name": params.get("name"), "error": str(e)}
+    except Exception as e:
+        return {"status": 500, "kind": params.get("kind"), "name": params.get("name"), "error": str(e)}
+
+
+def forecast_batch(body: dict, executor: ThreadPoolExecutor) -> dict:
+    """여러 시계열 예측 - 요청 순서대로 결과 반환 (실패한 항목도 상태/오류와 함께 포함)"""
+    requests = body.get("requests")
+    if not isinstance(requests, list) or not requests:
+        raise ApiError(400, "requests 목록이 필요합니다")
+    if len(requests) > MAX_BATCH_SIZE:
+        raise ApiError(400, f"한 번에 최대 {MAX_BATCH_SIZE}건까지 요청할 수 있습니다: {len(requests)}건")
+    if not all(isinstance(request, dict) for request in requests):
+        raise ApiError(400, "requests의 각 항목은 객체여야 합니다")
+    defaults = {key: body[key] for key in ("kind", "months", "engine", "intervals") if key in body}
+    start = time.perf_counter()
+    results = list(executor.map(lambda request: _batch_entry(request, defaults), requests))
+    failed = sum(result["status"] != 200 for result in results)
+    return {"count": len(results), "failed": failed, "seconds": round(time.perf_counter() - start, 3),
+            "results": results}
+
+
+class ForecastRequestHandler(BaseHTTPRequestHandler):
+    server_version = "ForecastAPI/1.0"
+    quiet = False
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload, ensure_ascii=False, default=_json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, route):
+        try:
+            self._send_json(200, route())
+        except ApiError as e:
+            self._send_json(e.status, {"error": str(e)})
+        except Exception as e:
+            traceback.print_exc()
+            self._send_json(500, {"error": str(e)})
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, f"요청 본문이 너무 큽니다 (최대 {MAX_BODY_BYTES} bytes)")
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ApiError(400, f"JSON 형식 오류: {e}")
+        if not isinstance(body, dict):
+            raise ApiError(400, "요청 본문은 JSON 객체여야 합니다")
+        return body
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        def route():
+            if parts == ["health"]:
+                return {"status": "ok"}
+            if parts == ["models", "status"]:
+                return model_status()
+            if len(parts) == 2 and parts[0] == "series":
+                if parts[1] not in VALUE_COLUMNS:
+                    raise ApiError(404, f"알 수 없는 종류입니다: {parts[1]}")
+                return {"kind": parts[1], "names": list_series(parts[1])}
+            if len(parts) == 2 and parts[0] == "forecast":
+                return forecast_item(parts[1], query.get("name"), query.get("months", DEFAULT_MONTHS),
+                                     query.get("engine", DEFAULT_ENGINE), query.get("intervals", False))
+            raise ApiError(404, f"없는 경로입니다: {url.path}")
+
+        self._handle(route)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+
+        def route():
+            if url.path.rstrip("/") == "/forecast/batch":
+                return forecast_batch(self._read_json(), self.server.executor)
+            raise ApiError(404, f"없는 경로입니다: {url.path}")
+
+        self._handle(route)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(host: str = "127.0.0.1", port: int = DEFAULT_PORT, workers: int = None,
+                quiet: bool = False) -> ThreadingHTTPServer:
+    """API 서버 생성 (serve_forever()로 실행, server_close()로 종료 시 배치 스레드 풀도 정리)"""
+    handler = type("Handler", (ForecastRequestHandler,), {"quiet": quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.executor = ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 2),
+                                         thread_name_prefix="forecast-batch")
+    close = server.server_close
+
+    def server_close():
+        close()
+        server.executor.shutdown(wait=False, cancel_futures=True)
+
+    server.server_close = server_close
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="예측 HTTP API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="배치 예측 스레드 수 (기본: CPU 코어 수 × 2)")
+    parser.add_argument("--quiet", action="store_true", help="요청 로그 출력 안 함")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.workers, args.quiet)
+    print(f"예측 API 실행 중: http://{args.host}:{args.port} (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
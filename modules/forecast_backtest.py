@@ -0,0 +1,201 @@
+# modules/forecast_backtest.py
+# ----------------------------
+# 예측 모델 워크포워드(rolling-origin) 백테스트
+# - 현대/기아 전체 시계열(region/car/plant)을 마지막 folds개 시점에서 잘라 학습 → horizon개월 예측 → 실제값과 비교
+# - 모델군: 통계 엔진(계절 단순 / Holt-Winters / SARIMA-lite / SARIMAX-lite, 종류별 행렬 일괄) + 시계열별 LSTM(선택)
+# - 작업(통계: 브랜드×종류×모델, LSTM: 시계열)을 프로세스 풀에서 병렬 실행
+# - 시계열×모델×폴드별 MAPE/RMSE/학습·추론 시간을 CSV로 저장 → compare로 버전 간 비교
+# 사용 예시 (CLI):
+#   python -m modules.forecast_backtest run --label v1.2 [--families holt_winters lstm] [--workers 4]
+#   python -m modules.forecast_backtest compare models/backtest/backtest_v1.1.csv models/backtest/backtest_v1.2.csv
+# ----------------------------
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from modules.data_registry import BRANDS
+from modules.forecast_classic import CLASSIC_METHODS, forecast_matrix, series_matrix
+from modules.forecast_lstm import (DEFAULT_EPOCHS, DEFAULT_TIME_STEPS, forecast_lstm, init_worker_threads,
+                                   prepare_lstm_data, train_lstm_model)
+from modules.forecast_metrics import mape, rmse
+from modules.forecast_models import MODEL_KINDS, MODELS_DIR
+
+BACKTEST_DIR = os.path.join(MODELS_DIR, "backtest")
+FAMILIES = tuple(CLASSIC_METHODS) + ("lstm",)
+# LSTM은 시계열×폴드마다 학습하므로 기본값에서는 제외 (--families로 추가)
+DEFAULT_FAMILIES = tuple(CLASSIC_METHODS)
+DEFAULT_FOLDS = 3
+DEFAULT_HORIZON = 6
+
+RESULT_COLUMNS = ["브랜드", "종류", "이름", "모델", "폴드", "기준월", "MAPE", "RMSE", "학습(초)", "추론(초)"]
+
+
+def fold_cuts(n_months: int, folds: int = DEFAULT_FOLDS, horizon: int = DEFAULT_HORIZON) -> list:
+    """학습 구간 끝 위치(열 개수) 목록 - 마지막 폴드의 예측 구간이 데이터 끝과 맞도록 horizon 간격으로 배치"""
+    cuts = [n_months - horizon * (folds - i) for i in range(folds)]
+    return [cut for cut in cuts if cut > 0]
+
+
+def _rows(brand, kind, names, family, fold, cutoff, actual, predicted, train_seconds, infer_seconds):
+    mapes = np.atleast_1d(mape(actual, predicted))
+    rmses = np.atleast_1d(rmse(actual, predicted))
+    return [{
+        "브랜드": brand, "종류": kind, "이름": name, "모델": family, "폴드": fold,
+        "기준월": cutoff.strftime("%Y-%m"), "MAPE": float(mapes[i]), "RMSE": float(rmses[i]),
+        "학습(초)": train_seconds[i], "추론(초)": infer_seconds[i],
+    } for i, name in enumerate(names)]
+
+
+def backtest_classic(method: str, brand: str, kind: str, folds: int = DEFAULT_FOLDS,
+                     horizon: int = DEFAULT_HORIZON) -> list:
+    """통계 엔진 하나로 브랜드×종류의 모든 시계열을 폴드마다 일괄 적합/예측
+
+    통계 엔진은 예측 시점에 적합까지 하므로 적합+예측 시간을 시계열 수로 나눠 학습 시간에 기록한다.
+    """
+    names, dates, Y = series_matrix(kind, brand)
+    rows = []
+    for fold, cut in enumerate(fold_cuts(Y.shape[1], folds, horizon), start=1):
+        start = time.perf_counter()
+        predicted = forecast_matrix(Y[:, :cut], horizon, method, dates[:cut])
+        per_series = (time.perf_counter() - start) / max(1, len(names))
+        rows += _rows(brand, kind, names, method, fold, dates[cut - 1], Y[:, cut:cut + horizon], predicted,
+                      [per_series] * len(names), [0.0] * len(names))
+    return rows
+
+
+def backtest_lstm(brand: str, kind: str, name: str, folds: int = DEFAULT_FOLDS, horizon: int = DEFAULT_HORIZON,
+                  epochs: int = DEFAULT_EPOCHS) -> list:
+    """시계열 하나를 폴드마다 새로 학습한 LSTM으로 평가 (학습 데이터가 부족한 폴드는 NaN)"""
+    names, dates, Y = series_matrix(kind, brand)
+    values = pd.Series(Y[names.index(name)], index=dates)
+    rows = []
+    for fold, cut in enumerate(fold_cuts(len(dates), folds, horizon), start=1):
+        train_part = values.iloc[:cut].dropna().to_frame("y")
+        actual = values.iloc[cut:cut + horizon].to_numpy()
+        predicted = np.full(horizon, np.nan)
+        train_seconds = infer_seconds = np.nan
+        if len(train_part) > DEFAULT_TIME_STEPS + 1:
+            start = time.perf_counter()
+            X, y, scaler = prepare_lstm_data(train_part)
+            model, _ = train_lstm_model(X, y, epochs=epochs)
+            train_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            predicted = forecast_lstm(model, train_part, horizon, scaler).iloc[:, -1].to_numpy()
+            infer_seconds = time.perf_counter() - start
+        rows += _rows(brand, kind, [name], "lstm", fold, dates[cut - 1], actual[None, :], predicted[None, :],
+                      [train_seconds], [infer_seconds])
+    return rows
+
+
+def plan_tasks(families=DEFAULT_FAMILIES, kinds=MODEL_KINDS, brands=tuple(BRANDS)) -> list:
+    """[(함수, 인자 튜플)] - 통계 엔진은 브랜드×종류 단위, LSTM은 시계열 단위"""
+    tasks = []
+    for brand in brands:
+        for kind in kinds:
+            for family in families:
+                if family == "lstm":
+                    names, _, _ = series_matrix(kind, brand)
+                    tasks += [(backtest_lstm, (brand, kind, name)) for name in names]
+                else:
+                    tasks.append((backtest_classic, (family, brand, kind)))
+    return tasks
+
+
+def run_backtest(families=DEFAULT_FAMILIES, kinds=MODEL_KINDS, brands=tuple(BRANDS), folds: int = DEFAULT_FOLDS,
+                 horizon: int = DEFAULT_HORIZON, epochs: int = DEFAULT_EPOCHS, workers: int = None,
+                 log=print) -> pd.DataFrame:
+    """전체 백테스트 실행 -> 시계열×모델×폴드별 결과 DataFrame"""
+    unknown = set(families) - set(FAMILIES)
+    if unknown:
+        raise ValueError(f"알 수 없는 모델입니다: {', '.join(sorted(unknown))}")
+    workers = workers or max(1, os.cpu_count() or 1)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    tasks = plan_tasks(families, kinds, brands)
+    log(f"백테스트 작업 {len(tasks)}개 (폴드 {folds}개 × {horizon}개월, 워커 {workers}개)")
+
+    start = time.perf_counter()
+    rows, failed = [], 0
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_worker_threads, initargs=(threads,)) as executor:
+        futures = {}
+        for func, args in tasks:
+            extra = {"epochs": epochs} if func is backtest_lstm else {}
+            futures[executor.submit(func, *args, folds=folds, horizon=horizon, **extra)] = args
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                rows += future.result()
+            except Exception as e:
+                failed += 1
+                log(f"[{done}/{len(tasks)}] 실패 {futures[future]}: {e}")
+    log(f"완료: 결과 {len(rows)}행, 실패 작업 {failed}개 ({time.perf_counter() - start:.1f}초)")
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+
+def summarize(result: pd.DataFrame) -> pd.DataFrame:
+    """모델군별 요약 (MAPE/RMSE는 평가 가능한 시계열×폴드 기준)"""
+    result = result.assign(시계열=result["브랜드"] + "/" + result["종류"] + "/" + result["이름"])
+    return result.groupby("모델").agg(
+        시계열=("시계열", "nunique"),
+        평가=("MAPE", "count"),
+        MAPE_평균=("MAPE", "mean"),
+        MAPE_중앙값=("MAPE", "median"),
+        RMSE_평균=("RMSE", "mean"),
+        학습_합계초=("학습(초)", "sum"),
+        추론_합계초=("추론(초)", "sum"),
+    ).round(3)
+
+
+def compare_results(paths) -> pd.DataFrame:
+    """여러 백테스트 결과 CSV의 모델군별 요약을 나란히 비교 (행: 모델, 열: (지표, 결과 이름))"""
+    summaries = {}
+    for path in paths:
+        label = os.path.splitext(os.path.basename(path))[0].removeprefix("backtest_")
+        summaries[label] = summarize(pd.read_csv(path, encoding="utf-8-sig"))
+    combined = pd.concat(summaries, axis=1).swaplevel(axis=1)
+    metrics = next(iter(summaries.values())).columns
+    return combined.reindex(columns=pd.MultiIndex.from_product([metrics, list(summaries)]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="예측 모델 워크포워드 백테스트")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run", help="백테스트 실행 후 결과 CSV 저장")
+    run_p.add_argument("--families", nargs="+", choices=FAMILIES, default=list(DEFAULT_FAMILIES))
+    run_p.add_argument("--kinds", nargs="+", choices=MODEL_KINDS, default=list(MODEL_KINDS))
+    run_p.add_argument("--brands", nargs="+", choices=list(BRANDS), default=list(BRANDS))
+    run_p.add_argument("--folds", type=int, default=DEFAULT_FOLDS)
+    run_p.add_argument("--horizon", type=int, default=DEFAULT_HORIZON)
+    run_p.add_argument("--epochs", type=int, default=DEFAULT_EPOCHS, help="LSTM 학습 epoch 수")
+    run_p.add_argument("--workers", type=int, default=None, help="병렬 워커 수 (기본: CPU 코어 수)")
+    run_p.add_argument("--label", default=None, help="결과 이름 (기본: 실행 시각)")
+    run_p.add_argument("--output", default=None, help="결과 CSV 경로 (기본: models/backtest/backtest_{label}.csv)")
+    compare_p = sub.add_parser("compare", help="결과 CSV 여러 개의 모델군별 요약 비교")
+    compare_p.add_argument("paths", nargs="+")
+    args = parser.parse_args(argv)
+
+    pd.set_option("display.width", 200)
+    if args.command == "compare":
+        print(compare_results(args.paths).to_string())
+        return 0
+
+    result = run_backtest(args.families, args.kinds, args.brands, folds=args.folds, horizon=args.horizon,
+                          epochs=args.epochs, workers=args.workers)
+    label = args.label or time.strftime("%Y%m%d-%H%M%S")
+    output = args.output or os.path.join(BACKTEST_DIR, f"backtest_{label}.csv")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    result.to_csv(output, index=False, encoding="utf-8-sig")
+    print(summarize(result).to_string())
+    print(f"결과 저장: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
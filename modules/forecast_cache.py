@@ -0,0 +1,170 @@
+# modules/forecast_cache.py
+# ----------------------------
+# 예측 결과 캐시 (메모리 LRU + 디스크)
+# - 키: 엔진 × 종류 × 이름 × 입력 시계열 해시 × 모델 파일 버전(mtime) × 예측 개월 수 × 값 컬럼 × 옵션(예측 구간 등)
+# - 같은 요청은 재계산 없이 바로 반환 (세션/프로세스 재시작 후에도 디스크에서 복원)
+# - 데이터나 모델이 바뀌면 키가 달라져 자동으로 새로 계산하고, 같은 시계열의 이전 버전 결과 파일은 정리
+#   (파일 이름: 접두사_버전 키_옵션 키_예측 개월 수 - 옵션/개월 수가 다른 결과는 유지)
+# - invalidate_forecasts()로 명시적 무효화 (종류/이름 단위 또는 전체)
+# ----------------------------
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from modules.forecast_models import GLOBAL_KIND, MODELS_DIR, artifact_version
+from modules.forecast_series import series_hash
+
+FORECAST_CACHE_DIR = os.path.join(MODELS_DIR, ".forecast_cache")
+# 메모리에 보관할 예측 결과 수 (결과 하나는 최대 수십 행이라 작음)
+MAX_MEMORY_ENTRIES = 512
+
+_lock = threading.Lock()
+_entries = OrderedDict()   # 키 -> 예측 DataFrame
+_stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha1("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()[:16]
+
+
+def model_version(engine: str, kind: str, name: str):
+    """엔진별 모델 버전 (통계 엔진은 모델 파일이 없어 코드 상수 + 경제지표 파일 버전, 모델 파일이 없으면 None)"""
+    if engine == "lstm":
+        return artifact_version(kind, name)
+    if engine == "global":
+        from modules.forecast_global import GLOBAL_NAME
+        return artifact_version(GLOBAL_KIND, GLOBAL_NAME)
+    from modules.forecast_classic import exog_version
+    return ("classic", exog_version(engine))
+
+
+def _engine_tag(engine: str) -> str:
+    # 파일 이름을 "_"로 나눠 조건을 비교하므로 엔진 키의 "_"는 "-"로 바꿈
+    return engine.replace("_", "-")
+
+
+def _series_prefix(engine: str, kind: str, name: str) -> str:
+    return f"{_engine_tag(engine)}_{kind}_{_digest(name)}"
+
+
+def _cache_path(prefix: str, key: str) -> str:
+    return os.path.join(FORECAST_CACHE_DIR, f"{prefix}_{key}.pkl")
+
+
+def _remember(key, forecast):
+    with _lock:
+        _entries[key] = forecast
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_MEMORY_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def _prune_disk(prefix: str, version_key: str):
+    # 같은 시계열의 이전 데이터/모델 버전 결과 파일 정리 (옵션/예측 개월 수만 다른 결과는 유지)
+    if not os.path.isdir(FORECAST_CACHE_DIR):
+        return
+    for file_name in os.listdir(FORECAST_CACHE_DIR):
+        if file_name.startswith(prefix + "_") and not file_name.startswith(f"{prefix}_{version_key}_"):
+            try:
+                os.remove(os.path.join(FORECAST_CACHE_DIR, file_name))
+            except OSError:
+                pass
+
+
+def _write_disk(path: str, forecast: pd.DataFrame):
+    os.makedirs(FORECAST_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        forecast.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def cached_forecast(engine: str, kind: str, name: str, series: pd.DataFrame, forecast_months: int,
+                    value_col: str, compute, options: dict = None) -> pd.DataFrame:
+    """캐시에 있으면 반환, 없으면 compute()로 계산해 메모리/디스크에 저장
+
+    options: 결과에 영향을 주는 추가 설정 (예: 예측 구간 표본 수/수준) - 파일 키에 포함, 버전 정리 기준에는 제외
+
+    반환된 DataFrame은 공유 객체이므로 수정하지 말 것 (필요하면 copy()).
+    """
+    version = model_version(engine, kind, name)
+    if version is None:
+        # 모델 파일이 없으면 캐시하지 않음
+        return compute()
+    prefix = _series_prefix(engine, kind, name)
+    version_key = _digest(series_hash(series), version, value_col)
+    options_key = _digest(sorted((options or {}).items()))[:8]
+    key = f"{version_key}_{options_key}_{int(forecast_months)}"
+    path = _cache_path(prefix, key)
+
+    with _lock:
+        forecast = _entries.get(path)
+        if forecast is not None:
+            _entries.move_to_end(path)
+            _stats["hits"] += 1
+            return forecast
+
+    if os.path.exists(path):
+        try:
+            forecast = pd.read_pickle(path)
+        except Exception:
+            forecast = None   # 손상된 파일은 다시 계산해서 덮어씀
+        if forecast is not None:
+            with _lock:
+                _stats["disk_hits"] += 1
+            _remember(path, forecast)
+            return forecast
+
+    with _lock:
+        _stats["misses"] += 1
+    forecast = compute()
+    _remember(path, forecast)
+    _prune_disk(prefix, version_key)
+    _write_disk(path, forecast)
+    return forecast
+
+
+def invalidate_forecasts(kind: str = None, name: str = None, engine: str = None) -> int:
+    """조건에 맞는 예측 결과를 메모리/디스크에서 삭제 -> 삭제한 파일 수 (인자가 없으면 전체)"""
+    def matches(file_name):
+        parts = file_name.split("_")
+        if engine is not None and parts[0] != _engine_tag(engine):
+            return False
+        if kind is not None and parts[1] != kind:
+            return False
+        if name is not None and parts[2] != _digest(name):
+            return False
+        return True
+
+    with _lock:
+        for path in [p for p in _entries if matches(os.path.basename(p))]:
+            del _entries[path]
+
+    removed = 0
+    if os.path.isdir(FORECAST_CACHE_DIR):
+        for file_name in os.listdir(FORECAST_CACHE_DIR):
+            if file_name.endswith(".pkl") and matches(file_name):
+                try:
+                    os.remove(os.path.join(FORECAST_CACHE_DIR, file_name))
+                    removed += 1
+                except OSError:
+                    pass
+    return removed
+
+
+def get_forecast_cache_stats() -> dict:
+    with _lock:
+        lookups = _stats["hits"] + _stats["disk_hits"] + _stats["misses"]
+        hits = _stats["hits"] + _stats["disk_hits"]
+        return {
+            **_stats,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "entries": len(_entries),
+        }
@@ -0,0 +1,198 @@
+# modules/forecast_classic.py
+# ----------------------------
+# NumPy 기반 고전 시계열 예측 엔진 (TensorFlow/학습 불필요)
+# - 계절 단순(seasonal naive) / Holt-Winters(가법) / SARIMA-lite((p,0,0)(0,1,0)12)
+# - SARIMAX-lite: SARIMA-lite + 경제지표 시차 피처(modules/forecast_features.py)를 외생 회귀항으로 추가
+# - 종류(region/car/plant)의 모든 시계열을 (시계열 수, 기간) 행렬 하나로 한 번에 적합/예측
+# - 결측(NaN) 시점은 상태만 이어 가고 오차 계산에서 제외
+# - 결과는 데이터 버전 × 종류 × 방법 × 예측 구간별로 캐시
+# ----------------------------
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from modules.data_registry import cached_by_version
+from modules.forecast_features import feature_matrix, indicator_version
+from modules.forecast_lstm import make_forecast_frame
+from modules.forecast_series import FORECAST_BRAND, _series_table, list_series
+
+SEASON = 12
+
+# 방법 키 -> 화면 표시 이름
+CLASSIC_METHODS = {
+    "holt_winters": "Holt-Winters",
+    "seasonal_naive": "계절 단순",
+    "sarima_lite": "SARIMA-lite",
+    "sarimax_lite": "SARIMAX-lite (경제지표)",
+}
+# 외생 변수(경제지표 피처)를 쓰는 방법 - 예측 시 월 인덱스가 필요
+EXOG_METHODS = ("sarimax_lite",)
+
+# Holt-Winters 평활 계수 후보 (시계열마다 한 단계 앞 예측 오차가 가장 작은 조합 선택)
+HW_ALPHAS = (0.1, 0.3, 0.5, 0.8)
+HW_BETAS = (0.0, 0.05, 0.2)
+HW_GAMMAS = (0.05, 0.2, 0.5)
+
+AR_ORDER = 3
+# 외생 회귀 계수 릿지 강도 (외생 변수 제곱합 평균 대비) - 지표 기간이 짧아 과적합 방지
+EXOG_RIDGE = 0.5
+
+
+def series_matrix(kind: str, brand: str = FORECAST_BRAND):
+    """(이름 목록, 월 DatetimeIndex, 값 행렬(시계열 수, 기간)) - 결측은 NaN"""
+    table = _series_table(kind, brand)
+    names = list_series(kind, brand)
+    return names, table.columns, table.loc[names].to_numpy(dtype="float64")
+
+
+def seasonal_naive(Y: np.ndarray, horizon: int, season: int = SEASON) -> np.ndarray:
+    """마지막 한 시즌 값을 그대로 반복 (결측은 0)"""
+    last_season = np.nan_to_num(Y[:, -season:])
+    reps = -(-horizon // season)
+    return np.tile(last_season, (1, reps))[:, :horizon]
+
+
+def _holt_winters_pass(Y, alpha, beta, gamma, season):
+    """모든 시계열에 같은 계수로 한 번 적합 -> (오차 제곱합, 최종 level, trend, season 상태)"""
+    n, T = Y.shape
+    valid = ~np.isnan(Y)
+    first = np.where(valid.any(axis=1), valid.argmax(axis=1), 0)
+    level = np.nan_to_num(Y[np.arange(n), first])
+    trend = np.zeros(n)
+    seasonal = np.zeros((n, season))
+    sse = np.zeros(n)
+    for t in range(T):
+        s = t % season
+        pred = level + trend + seasonal[:, s]
+        obs = Y[:, t]
+        ok = valid[:, t]
+        # 첫 관측 후 한 시즌은 초기화 구간으로 보고 오차에서 제외
+        counted = ok & (t >= first + season)
+        sse += np.where(counted, (obs - pred) ** 2, 0.0)
+        obs = np.where(ok, obs, pred)
+        new_level = alpha * (obs - seasonal[:, s]) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        seasonal[:, s] = gamma * (obs - new_level) + (1 - gamma) * seasonal[:, s]
+        level = new_level
+    return sse, level, trend, seasonal
+
+
+def holt_winters(Y: np.ndarray, horizon: int, season: int = SEASON) -> np.ndarray:
+    """가법 Holt-Winters - 계수 후보를 모든 시계열에 동시에 적합하고 시계열별로 최적 조합 선택"""
+    n, T = Y.shape
+    best_sse = np.full(n, np.inf)
+    best = None
+    for alpha, beta, gamma in itertools.product(HW_ALPHAS, HW_BETAS, HW_GAMMAS):
+        sse, level, trend, seasonal = _holt_winters_pass(Y, alpha, beta, gamma, season)
+        better = sse < best_sse
+        if best is None:
+            best = [level, trend, seasonal]
+        else:
+            best[0] = np.where(better, level, best[0])
+            best[1] = np.where(better, trend, best[1])
+            best[2] = np.where(better[:, None], seasonal, best[2])
+        best_sse = np.where(better, sse, best_sse)
+    level, trend, seasonal = best
+    steps = np.arange(1, horizon + 1)
+    season_idx = (T + steps - 1) % season
+    return level[:, None] + trend[:, None] * steps[None, :] + seasonal[:, season_idx]
+
+
+def sarima_lite(Y: np.ndarray, horizon: int, order: int = AR_ORDER, season: int = SEASON,
+                exog: np.ndarray = None) -> np.ndarray:
+    """계절 차분(12개월) 후 AR(order)을 시계열별 최소제곱으로 적합 (정규방정식 일괄 풀이)
+
+    exog: (기간 + horizon, 변수 수) 외생 변수 (모든 시계열 공통, 미래 구간 포함)
+    - 주어지면 계절 차분한 값을 회귀항으로 추가 (SARIMAX-lite, 계수는 릿지로 축소)
+    """
+    n, T = Y.shape
+    Z = Y[:, season:] - Y[:, :-season]                     # 계절 차분, 결측 전파
+    rows = Z.shape[1] - order
+    if rows <= order + 1:
+        return seasonal_naive(Y, horizon, season)
+    # 설계 행렬 (n, rows, order + 1 [+ 변수 수]): 상수항 + 시차 1..order [+ 계절 차분한 외생 변수]
+    lags = np.stack([Z[:, order - k:order - k + rows] for k in range(1, order + 1)], axis=2)
+    design = np.concatenate([np.ones((n, rows, 1)), lags], axis=2)
+    n_ar = order + 1
+    if exog is not None:
+        exog_diff = exog[season:] - exog[:-season]         # 행 j = 시점 j + season
+        design = np.concatenate([design, np.broadcast_to(exog_diff[order:order + rows], (n, rows, exog.shape[1]))],
+                                axis=2)
+    target = Z[:, order:]
+    weight = (~np.isnan(target) & ~np.isnan(lags).any(axis=2)).astype("float64")
+    design = np.nan_to_num(design) * weight[:, :, None]
+    target = np.nan_to_num(target) * weight
+    gram = np.einsum("nri,nrj->nij", design, design) + 1e-6 * np.eye(design.shape[2])
+    if exog is not None:
+        exog_scale = np.diagonal(gram[:, n_ar:, n_ar:], axis1=1, axis2=2).mean(axis=1)
+        gram[:, n_ar:, n_ar:] += EXOG_RIDGE * exog_scale[:, None, None] * np.eye(exog.shape[1])
+    coef = np.linalg.solve(gram, np.einsum("nri,nr->ni", design, target)[:, :, None])[:, :, 0]
+    # 적합에 쓸 시점이 부족하면 계절 단순 예측과 같아지도록 계수를 0으로
+    coef[weight.sum(axis=1) < 2 * (order + 1)] = 0.0
+    # 재귀 예측이 발산하지 않도록 sum|phi| < 1 (정상성 충분조건)이 되게 AR 계수 축소
+    phi_sum = np.abs(coef[:, 1:n_ar]).sum(axis=1)
+    coef[:, 1:n_ar] *= np.minimum(1.0, 0.98 / np.maximum(phi_sum, 1e-12))[:, None]
+
+    history_z = np.nan_to_num(Z[:, -order:])
+    history_y = np.nan_to_num(Y[:, -season:])
+    out = np.empty((n, horizon))
+    for h in range(horizon):
+        z_next = coef[:, 0] + np.einsum("nk,nk->n", coef[:, 1:n_ar], history_z[:, ::-1])
+        if exog is not None:
+            z_next += coef[:, n_ar:] @ exog_diff[T - season + h]
+        y_next = z_next + history_y[:, h % season] if h < season else z_next + out[:, h - season]
+        out[:, h] = y_next
+        history_z = np.concatenate([history_z[:, 1:], z_next[:, None]], axis=1)
+    return out
+
+
+METHOD_FUNCS = {
+    "holt_winters": holt_winters,
+    "seasonal_naive": seasonal_naive,
+    "sarima_lite": sarima_lite,
+    "sarimax_lite": sarima_lite,
+}
+
+
+def forecast_matrix(Y: np.ndarray, horizon: int, method: str = "holt_winters", dates=None) -> np.ndarray:
+    """(시계열 수, 기간) 행렬 -> (시계열 수, horizon) 예측값 (판매량이므로 음수는 0으로)
+
+    dates: Y의 열에 해당하는 월 인덱스 (외생 변수를 쓰는 방법에 필요, 마지막 달 이후 지표는 사용하지 않음)
+    """
+    if method not in METHOD_FUNCS:
+        raise ValueError(f"알 수 없는 예측 방법입니다: {method}")
+    if method in EXOG_METHODS:
+        if dates is None:
+            raise ValueError(f"{method} 예측에는 월 인덱스(dates)가 필요합니다")
+        exog = feature_matrix(dates, horizon).to_numpy(dtype="float64")
+        return np.clip(METHOD_FUNCS[method](Y, horizon, exog=exog), 0, None)
+    return np.clip(METHOD_FUNCS[method](Y, horizon), 0, None)
+
+
+def exog_version(method: str):
+    """방법이 쓰는 외생 변수 파일 버전 (결과 캐시 키용, 외생 변수를 쓰지 않으면 None)"""
+    return indicator_version() if method in EXOG_METHODS else None
+
+
+@cached_by_version
+def _forecast_all(kind: str, horizon: int, method: str, brand: str, feature_version) -> pd.DataFrame:
+    names, dates, Y = series_matrix(kind, brand)
+    future = pd.date_range(start=dates[-1] + pd.DateOffset(months=1), periods=horizon, freq='MS')
+    return pd.DataFrame(forecast_matrix(Y, horizon, method, dates), index=names, columns=future)
+
+
+def forecast_all(kind: str, horizon: int, method: str = "holt_winters", brand: str = FORECAST_BRAND) -> pd.DataFrame:
+    """종류의 모든 시계열 예측 (행: 시계열 이름, 열: 예측 월) - 데이터/지표 버전별 캐시"""
+    return _forecast_all(kind, horizon, method, brand, exog_version(method))
+
+
+def forecast_classic(kind: str, name: str, forecast_months: int, method: str = "holt_winters",
+                     value_col: str = '예측 판매량', brand: str = FORECAST_BRAND) -> pd.DataFrame:
+    """시계열 하나 예측 -> 연도/월/예측값 DataFrame (LSTM 경로와 같은 형태)"""
+    predictions = forecast_all(kind, int(forecast_months), method, brand)
+    if name not in predictions.index:
+        raise KeyError(f"시계열을 찾을 수 없습니다: {kind} / {name}")
+    last_date = predictions.columns[0] - pd.DateOffset(months=1)
+    return make_forecast_frame(last_date, predictions.loc[name].to_numpy(), value_col)
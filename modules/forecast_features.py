@@ -0,0 +1,141 @@
+# modules/forecast_features.py
+# ----------------------------
+# 외생 경제지표 피처 저장소 (extra_data)
+# - 기준금리 / 원·달러 환율 / 경제심리지수 / 뉴스심리지수 / 제조업 BSI(매출실적, 수출전망) / 실질 GDP를
+#   판매 데이터와 같은 월 인덱스로 정렬 (분기 자료는 분기 마지막 달 값으로 두고 다음 분기까지 앞값 채움)
+# - 시차(lag) 피처: 지표별 FEATURE_LAGS개월 전 값 (표준화)
+#   기준월(학습 구간 마지막 달) 이후 지표는 쓰지 않고 기준월 값을 유지 → 미래 구간/백테스트에서 정보 누출 없음
+#   지표 자료가 시작되기 전 기간은 첫 값으로 채움 (계절 차분하면 0이 되어 회귀에 영향 없음)
+# - 지표 로드/정렬 결과는 지표 파일 버전 × 기간 × 시차별로 캐시
+# - 통계 엔진 SARIMAX-lite(modules/forecast_classic.py)가 외생 변수로 사용
+# 사용 예시 (CLI): python -m modules.forecast_features   # 지표별 기간 + 피처 생성 시간
+# ----------------------------
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from modules.data_registry import cached_by_version
+
+EXTRA_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "extra_data"))
+
+# 지표 이름 -> (extra_data 기준 경로, 행 선택 조건 {컬럼: 값})
+# processed/ 폴더는 2023년부터 잘라 둔 사본이므로 같은 지표의 2021년부터 원본을 사용
+INDICATORS = {
+    "기준금리": ("raw/금융 환경 관련/한국은행 기준금리 및 여수신금리(2021~2025 월별).csv",
+             {"계정항목": "한국은행 기준금리"}),
+    "원달러환율": ("merge_needed/raw/주요국 통화의 대원화환율(월별_2021.01~2025.02).csv",
+              {"계정항목": "원/미국달러(매매기준율)", "측정항목": "평균자료"}),
+    "경제심리지수": ("raw/소비 심리 관련/경제심리지수.csv", {"계정항목": "경제심리지수(원계열)"}),
+    "뉴스심리지수": ("raw/소비 심리 관련/뉴스심리지수(실험적 통계).csv", {"계정항목": "뉴스심리지수"}),
+    "매출실적BSI": ("raw/실제 판매 관련/기업경기조사(매출액가중 실적)_21110637.csv", {"BSI코드": "매출실적BSI"}),
+    "수출전망BSI": ("raw/재고 관련/기업경기조사(매출액가중 전망).csv", {"BSI코드": "수출전망BSI"}),
+    "실질GDP": ("raw/경제 성장 관련/경제활동별 GDP 및 GNI(계절조정, 실질, 분기).csv",
+              {"계정항목": "국내총생산(시장가격, GDP)"}),
+}
+
+# 지표 발표 시차를 감안해 1개월 전 / 분기 단위 3개월 전 값을 피처로 사용
+FEATURE_LAGS = (1, 3)
+
+
+def indicator_version() -> tuple:
+    """지표 파일 mtime 튜플 - 피처/예측 결과 캐시 키로 사용"""
+    return tuple(os.path.getmtime(os.path.join(EXTRA_DATA_DIR, path)) for path, _ in INDICATORS.values())
+
+
+def _period_to_month(period: str) -> pd.Timestamp:
+    """'2024/01' -> 2024-01, '2024/Q1' -> 2024-03 (분기 자료는 분기가 끝나야 알 수 있으므로 마지막 달)"""
+    year, part = period.split("/")
+    month = int(part[1:]) * 3 if part.startswith("Q") else int(part)
+    return pd.Timestamp(year=int(year), month=month, day=1)
+
+
+def read_indicator(path: str, row_filter: dict) -> pd.Series:
+    """지표 CSV(한국은행 ECOS 형식: 행=항목, 열=기간)에서 한 행을 월 인덱스 Series로"""
+    df = pd.read_csv(os.path.join(EXTRA_DATA_DIR, path), encoding="utf-8-sig")
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in row_filter.items():
+        mask &= (df[col].astype(str).str.strip() == value).to_numpy()
+    if mask.sum() != 1:
+        raise ValueError(f"지표 행을 하나로 특정할 수 없습니다: {path} {row_filter} ({mask.sum()}행)")
+    periods = [c for c in df.columns if c[:4].isdigit() and "/" in c]
+    values = pd.to_numeric(df.loc[mask, periods].iloc[0], errors="coerce")
+    values.index = [_period_to_month(p) for p in periods]
+    return values.dropna().astype("float64")
+
+
+@cached_by_version
+def _load_indicators(version: tuple) -> pd.DataFrame:
+    table = pd.DataFrame({name: read_indicator(path, row_filter) for name, (path, row_filter) in INDICATORS.items()})
+    months = pd.date_range(table.index.min(), table.index.max(), freq="MS")
+    return table.reindex(months).ffill()
+
+
+def load_indicators() -> pd.DataFrame:
+    """월별 지표 표 (행: 월, 열: 지표, 분기 자료는 앞값 채움) - 공유 객체이므로 수정하지 말 것"""
+    return _load_indicators(indicator_version())
+
+
+@cached_by_version
+def _feature_matrix(start: pd.Timestamp, periods: int, horizon: int, lags: tuple, version: tuple) -> pd.DataFrame:
+    indicators = _load_indicators(version)
+    end = start + pd.DateOffset(months=periods - 1)
+    span = pd.date_range(start - pd.DateOffset(months=max(lags)), periods=periods + horizon + max(lags), freq="MS")
+    # 기준월 이후 지표는 버리고 앞값 유지, 자료 시작 전은 첫 값으로 채움
+    known = indicators.loc[:end]
+    aligned = known.reindex(known.index.union(span)).ffill().bfill().reindex(span)
+    in_history = span <= end
+    mean = aligned[in_history].mean()
+    std = aligned[in_history].std().replace(0, 1).fillna(1)
+    aligned = ((aligned - mean) / std).fillna(0.0)
+
+    features = pd.concat({f"{name}_lag{lag}": aligned[name].shift(lag)
+                          for lag in lags for name in aligned.columns}, axis=1)
+    return features.iloc[max(lags):]
+
+
+def feature_matrix(dates: pd.DatetimeIndex, horizon: int = 0, lags=FEATURE_LAGS) -> pd.DataFrame:
+    """판매 월 인덱스(연속된 월) + 미래 horizon개월에 맞춘 시차 피처
+
+    Returns:
+        DataFrame (행: len(dates) + horizon개월, 열: '지표_lagK', 학습 구간 기준 표준화) - 공유 객체
+    """
+    return _feature_matrix(pd.Timestamp(dates[0]), len(dates), int(horizon), tuple(lags), indicator_version())
+
+
+def coverage() -> pd.DataFrame:
+    """지표별 자료 기간 (시작 월, 마지막 월, 관측 수)"""
+    rows = []
+    for name, (path, row_filter) in INDICATORS.items():
+        values = read_indicator(path, row_filter)
+        rows.append({"지표": name, "시작": values.index.min().strftime("%Y-%m"),
+                     "마지막": values.index.max().strftime("%Y-%m"), "관측 수": len(values), "파일": path})
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="외생 경제지표 피처 확인 및 생성 시간 측정")
+    parser.add_argument("--start", default="2016-01", help="판매 데이터 시작 월")
+    parser.add_argument("--end", default="2025-02", help="판매 데이터 마지막 월 (기준월)")
+    parser.add_argument("--horizon", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    pd.set_option("display.width", 200)
+    print(coverage().to_string(index=False))
+    dates = pd.date_range(args.start, args.end, freq="MS")
+    start = time.perf_counter()
+    features = feature_matrix(dates, args.horizon)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    feature_matrix(dates, args.horizon)
+    cached = time.perf_counter() - start
+    print(f"피처 행렬 {features.shape[0]}개월 × {features.shape[1]}개 - 생성 {cold * 1000:.1f}ms, 캐시 {cached * 1000:.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
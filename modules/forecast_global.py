@@ -0,0 +1,272 @@
+# modules/forecast_global.py
+# ----------------------------
+# 글로벌 다중 시계열 LSTM (선택 기능)
+# - 시계열마다 .h5를 따로 두는 대신, 현대/기아 전체 시계열을 모델 하나로 학습
+# - 시계열 ID / 브랜드 ID 임베딩 + 시계열별 min-max 정규화
+# - 산출물 하나: models/lstm_global_all_model.h5 + lstm_global_all_scaler.pkl(메타 정보)
+# - compare_with_local(): 같은 학습 구간에서 시계열별 모델과 예측 정확도/시간 비교
+# 사용 예시 (CLI):
+#   python -m modules.forecast_global train
+#   python -m modules.forecast_global compare --kinds region --holdout 12 [--max-series 20]
+# ----------------------------
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.lazy_import import lazy_import
+from modules.data_registry import BRANDS
+from modules.forecast_lstm import (DEFAULT_EPOCHS, DEFAULT_TIME_STEPS, forecast_lstm, forecast_scaled_batch,
+                                   make_forecast_frame, prepare_lstm_data, train_lstm_model)
+from modules.forecast_metrics import mape, rmse
+from modules.forecast_models import GLOBAL_KIND, MODEL_KINDS, load_artifacts, model_exists, save_artifacts
+from modules.forecast_series import FORECAST_BRAND, list_series, load_series
+from modules.forecast_windows import stack_windows
+
+tf = lazy_import("tensorflow")
+
+GLOBAL_NAME = "all"
+GLOBAL_UNITS = 64
+GLOBAL_EPOCHS = 200
+GLOBAL_BATCH_SIZE = 256
+SERIES_EMBEDDING_DIM = 8
+BRAND_EMBEDDING_DIM = 2
+
+
+def catalog(kinds=MODEL_KINDS, brands=tuple(BRANDS)) -> list:
+    """학습 대상 시계열 키 목록 [(브랜드, 종류, 이름)]"""
+    return [(brand, kind, name) for brand in brands for kind in kinds for name in list_series(kind, brand)]
+
+
+def _series_values(key, until=None) -> pd.Series:
+    brand, kind, name = key
+    y = load_series(kind, name, brand)["y"]
+    return y[y.index <= until] if until is not None else y
+
+
+def build_training_set(keys, time_steps: int = DEFAULT_TIME_STEPS, until=None) -> dict:
+    """시계열별 정규화 후 윈도우를 하나의 학습 텐서로 쌓기
+
+    Returns:
+        {"X", "y", "series_id", "brand_id", "mins", "scales", "keys", "last_dates", "last_windows"}
+        (last_windows: 시계열별 마지막 time_steps 구간, 정규화된 값)
+    """
+    brands = list(BRANDS)
+    scaled_parts = []
+    mins = np.zeros(len(keys), dtype="float32")
+    scales = np.ones(len(keys), dtype="float32")
+    last_windows = np.zeros((len(keys), time_steps), dtype="float32")
+    last_dates = []
+    for i, key in enumerate(keys):
+        y = _series_values(key, until)
+        values = y.to_numpy(dtype="float32")
+        last_dates.append(y.index[-1] if len(y) else None)
+        if len(values):
+            mins[i] = values.min()
+            value_range = values.max() - mins[i]
+            scales[i] = value_range if value_range > 0 else 1.0
+        scaled = (values - mins[i]) / scales[i]
+        if len(scaled) >= time_steps:
+            last_windows[i] = scaled[-time_steps:]
+        scaled_parts.append(scaled)
+    X, y, series_id = stack_windows(scaled_parts, time_steps)
+    brand_ids = np.array([brands.index(key[0]) for key in keys], dtype="int32")
+    return {
+        "X": X,
+        "y": y,
+        "series_id": series_id,
+        "brand_id": brand_ids[series_id],
+        "mins": mins,
+        "scales": scales,
+        "keys": list(keys),
+        "last_dates": last_dates,
+        "last_windows": last_windows,
+    }
+
+
+def build_global_model(n_series: int, n_brands: int, time_steps: int = DEFAULT_TIME_STEPS,
+                       units: int = GLOBAL_UNITS):
+    window = tf.keras.layers.Input(shape=(time_steps, 1), name="window")
+    series_id = tf.keras.layers.Input(shape=(1,), dtype="int32", name="series_id")
+    brand_id = tf.keras.layers.Input(shape=(1,), dtype="int32", name="brand_id")
+
+    hidden = tf.keras.layers.LSTM(units=units, activation='relu')(window)
+    series_emb = tf.keras.layers.Flatten()(tf.keras.layers.Embedding(n_series, SERIES_EMBEDDING_DIM)(series_id))
+    brand_emb = tf.keras.layers.Flatten()(tf.keras.layers.Embedding(n_brands, BRAND_EMBEDDING_DIM)(brand_id))
+    x = tf.keras.layers.Concatenate()([hidden, series_emb, brand_emb])
+    x = tf.keras.layers.Dense(32, activation='relu')(x)
+    output = tf.keras.layers.Dense(1)(x)
+
+    model = tf.keras.Model(inputs=[window, series_id, brand_id], outputs=output)
+    model.compile(optimizer='adam', loss='mse')
+    return model
+
+
+def train_global_model(kinds=MODEL_KINDS, time_steps: int = DEFAULT_TIME_STEPS, epochs: int = GLOBAL_EPOCHS,
+                       until=None, save: bool = True, log=print):
+    """전체 시계열로 글로벌 모델 학습
+
+    Returns:
+        (model, meta) - meta: 시계열 키/정규화 값/마지막 윈도우 등 예측에 필요한 정보
+    """
+    start = time.perf_counter()
+    data = build_training_set(catalog(kinds), time_steps=time_steps, until=until)
+    log(f"학습 데이터: 시계열 {len(data['keys'])}개, 윈도우 {len(data['X'])}개 ({time.perf_counter() - start:.2f}초)")
+
+    model = build_global_model(len(data["keys"]), len(BRANDS), time_steps=time_steps)
+    # 검증 분할이 특정 시계열에 몰리지 않도록 섞은 뒤 마지막 10%를 검증용으로 사용
+    order = np.random.default_rng(0).permutation(len(data["X"]))
+    early_stopping = tf.keras.callbacks.EarlyStopping(monitor="val_loss", patience=10, restore_best_weights=True)
+    history = model.fit(
+        [data["X"][order], data["series_id"][order], data["brand_id"][order]], data["y"][order],
+        epochs=epochs, batch_size=GLOBAL_BATCH_SIZE, validation_split=0.1, verbose=0,
+        callbacks=[early_stopping],
+    )
+    seconds = time.perf_counter() - start
+    meta = {
+        "keys": data["keys"],
+        "index": {key: i for i, key in enumerate(data["keys"])},
+        "brands": list(BRANDS),
+        "mins": data["mins"],
+        "scales": data["scales"],
+        "time_steps": time_steps,
+        "epochs_run": len(history.history["loss"]),
+        "val_loss": float(min(history.history["val_loss"])),
+        "train_seconds": seconds,
+    }
+    log(f"학습 완료: {meta['epochs_run']} epoch, val_loss {meta['val_loss']:.4f}, {seconds:.1f}초")
+    if save:
+        save_artifacts(GLOBAL_KIND, GLOBAL_NAME, model, meta)
+    return model, meta
+
+
+def global_model_exists() -> bool:
+    return model_exists(GLOBAL_KIND, GLOBAL_NAME)
+
+
+def input_windows(history, rows, meta) -> np.ndarray:
+    """시계열별 실적(원래 단위)의 마지막 time_steps 구간을 학습 때의 min/scale로 정규화 -> (시계열 수, time_steps)
+
+    실적이 time_steps보다 짧으면 앞쪽은 0으로 채움 (학습 시 마지막 윈도우와 같은 방식).
+    """
+    time_steps = meta["time_steps"]
+    windows = np.zeros((len(rows), time_steps), dtype="float32")
+    for i, (values, row) in enumerate(zip(history, rows)):
+        tail = np.asarray(values, dtype="float32")[-time_steps:]
+        if len(tail):
+            windows[i, time_steps - len(tail):] = (tail - meta["mins"][row]) / meta["scales"][row]
+    return windows
+
+
+def forecast_global_batch(keys, horizon: int, model=None, meta=None, history=None) -> np.ndarray:
+    """여러 시계열을 한 번의 배치 롤아웃으로 예측 -> (시계열 수, horizon) 원래 단위 값
+
+    history: 키별 실적 값 목록 (생략하면 현재 데이터) - 학습 이후에 추가된 달도 입력 윈도우에 반영됨
+    """
+    if model is None:
+        model, meta = load_artifacts(GLOBAL_KIND, GLOBAL_NAME)
+    missing = [key for key in keys if key not in meta["index"]]
+    if missing:
+        raise KeyError(f"글로벌 모델에 없는 시계열입니다: {missing[:3]}")
+    if history is None:
+        history = [_series_values(key) for key in keys]
+    rows = np.array([meta["index"][key] for key in keys], dtype="int32")
+    brand_ids = np.array([meta["brands"].index(key[0]) for key in keys], dtype="int32")
+    scaled = forecast_scaled_batch(model, input_windows(history, rows, meta), horizon,
+                                   extra_inputs=(rows[:, None], brand_ids[:, None]))
+    return scaled * meta["scales"][rows, None] + meta["mins"][rows, None]
+
+
+def forecast_global(kind: str, name: str, forecast_months: int, value_col: str = '예측 판매량',
+                    brand: str = FORECAST_BRAND, series: pd.DataFrame = None) -> pd.DataFrame:
+    """글로벌 모델로 시계열 하나 예측 -> 연도/월/예측값 DataFrame (시계열별 모델과 같은 형태)
+
+    series('y' 컬럼, 생략하면 현재 데이터)의 마지막 구간에서 이어서 예측하고 날짜도 그 마지막 달 기준.
+    """
+    model, meta = load_artifacts(GLOBAL_KIND, GLOBAL_NAME)
+    key = (brand, kind, name)
+    y = load_series(kind, name, brand)["y"] if series is None else series["y"]
+    values = forecast_global_batch([key], forecast_months, model, meta, history=[y.to_numpy()])[0]
+    return make_forecast_frame(y.index[-1], values, value_col)
+
+
+def compare_with_local(kinds=("region",), holdout: int = 12, max_series: int = None,
+                       local_epochs: int = DEFAULT_EPOCHS, global_epochs: int = GLOBAL_EPOCHS, log=print) -> pd.DataFrame:
+    """마지막 holdout개월을 가리고 학습한 글로벌 모델 vs 시계열별 모델 정확도 비교 (현대 시계열 대상)
+
+    Returns:
+        시계열별 MAPE/RMSE/학습·추론 시간 DataFrame
+    """
+    keys = [(FORECAST_BRAND, kind, name) for kind in kinds for name in list_series(kind)]
+    keys = [key for key in keys if len(_series_values(key)) > DEFAULT_TIME_STEPS + holdout]
+    if max_series:
+        keys = keys[:max_series]
+    cutoffs = {key: _series_values(key).index[-holdout - 1] for key in keys}
+    actual = np.stack([_series_values(key).to_numpy()[-holdout:] for key in keys])
+
+    # 글로벌 모델은 전체 시계열(기아 포함)로 학습하되 같은 시점까지만 사용
+    until = min(cutoffs.values())
+    g_model, g_meta = train_global_model(kinds, epochs=global_epochs, until=until, save=False, log=log)
+    start = time.perf_counter()
+    g_pred = forecast_global_batch(keys, holdout, g_model, g_meta,
+                                   history=[_series_values(key, cutoffs[key]) for key in keys])
+    g_infer = time.perf_counter() - start
+
+    rows = []
+    for i, key in enumerate(keys):
+        _, kind, name = key
+        train_part = load_series(kind, name)
+        train_part = train_part[train_part.index <= cutoffs[key]]
+        start = time.perf_counter()
+        X, y, scaler = prepare_lstm_data(train_part)
+        local_model, _ = train_lstm_model(X, y, epochs=local_epochs)
+        local_train = time.perf_counter() - start
+        start = time.perf_counter()
+        local_pred = forecast_lstm(local_model, train_part, holdout, scaler).iloc[:, -1].to_numpy()
+        local_infer = time.perf_counter() - start
+        rows.append({
+            "종류": kind, "이름": name,
+            "글로벌 MAPE": float(mape(actual[i], g_pred[i])), "글로벌 RMSE": float(rmse(actual[i], g_pred[i])),
+            "개별 MAPE": float(mape(actual[i], local_pred)), "개별 RMSE": float(rmse(actual[i], local_pred)),
+            "개별 학습(초)": round(local_train, 2), "개별 추론(초)": round(local_infer, 4),
+        })
+        log(f"[{i + 1}/{len(keys)}] {kind}/{name}: 글로벌 MAPE {rows[-1]['글로벌 MAPE']:.1f}% / "
+            f"개별 MAPE {rows[-1]['개별 MAPE']:.1f}%")
+
+    result = pd.DataFrame(rows)
+    log(f"글로벌: 학습 {g_meta['train_seconds']:.1f}초(전체), 추론 {g_infer:.3f}초(전체 배치) / "
+        f"개별: 학습 {result['개별 학습(초)'].sum():.1f}초, 추론 {result['개별 추론(초)'].sum():.3f}초")
+    log(f"평균 MAPE - 글로벌 {result['글로벌 MAPE'].mean():.2f}% / 개별 {result['개별 MAPE'].mean():.2f}%")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="글로벌 다중 시계열 LSTM")
+    sub = parser.add_subparsers(dest="command", required=True)
+    train_p = sub.add_parser("train", help="전체 시계열로 글로벌 모델 학습 후 models/에 저장")
+    train_p.add_argument("--kinds", nargs="+", choices=MODEL_KINDS, default=list(MODEL_KINDS))
+    train_p.add_argument("--epochs", type=int, default=GLOBAL_EPOCHS)
+    compare_p = sub.add_parser("compare", help="시계열별 모델과 정확도 비교")
+    compare_p.add_argument("--kinds", nargs="+", choices=MODEL_KINDS, default=["region"])
+    compare_p.add_argument("--holdout", type=int, default=12)
+    compare_p.add_argument("--max-series", type=int, default=None)
+    compare_p.add_argument("--local-epochs", type=int, default=DEFAULT_EPOCHS)
+    compare_p.add_argument("--output", default=None, help="비교 결과 CSV 저장 경로")
+    args = parser.parse_args(argv)
+
+    if args.command == "train":
+        train_global_model(args.kinds, epochs=args.epochs)
+    else:
+        result = compare_with_local(args.kinds, holdout=args.holdout, max_series=args.max_series,
+                                    local_epochs=args.local_epochs)
+        if args.output:
+            result.to_csv(args.output, index=False, encoding="utf-8-sig")
+        print(result.to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+# modules/forecast_hierarchy.py
+# ----------------------------
+# 계층 예측 + 정합화(reconciliation): 지역 → 대륙 → 브랜드 → 전체
+# - 모든 노드(현대/기아 전체 지역, 대륙 합계, 브랜드 합계, 전체 합계)의 월별 시계열을 합산 행렬 S로 한 번에 구성
+# - 통계 엔진(modules/forecast_classic.py)으로 모든 노드를 한 배치로 예측한 뒤
+#   합산 행렬 기반 정합화(bottom-up / OLS / WLS)로 부모 = 자식 합이 되도록 보정
+# - 서유럽/동유럽(2021년까지)과 유럽 (자회사)/(유통업체)(2022년부터)는 기간이 겹치지 않으므로 모두 지역 노드로 포함
+# - 결과는 데이터 버전 × 설정별로 캐시
+# ----------------------------
+
+import numpy as np
+import pandas as pd
+
+from modules.data_registry import BRANDS, cached_by_version, load_raw
+from modules.forecast_classic import exog_version, forecast_matrix
+from modules.forecast_series import _series_table
+
+TOTAL = "전체"
+NODE_COLUMNS = ["레벨", "브랜드", "대륙", "지역명"]
+
+# 대륙 컬럼이 없는 데이터셋(기아)의 지역 → 대륙 (현대 데이터의 대륙 구분을 따름)
+REGION_CONTINENTS = {
+    "미국": "북미", "캐나다": "북미", "멕시코": "북미",
+    "유럽연합+EFTA": "유럽", "동유럽 및 구소련": "유럽",
+    "중남미": "기타", "중동 및 아프리카": "기타", "아시아 및 태평양": "기타", "인도": "기타", "중국": "기타",
+}
+# 데이터의 대륙 컬럼을 브랜드 간에 맞추는 보정 (현대 "러시아 및 구소련"은 원본에서 "기타",
+# 기아 "동유럽 및 구소련"은 "유럽" - 같은 지역이므로 대륙 합계가 비교되도록 둘 다 "유럽")
+CONTINENT_OVERRIDES = {"러시아 및 구소련": "유럽", "동유럽 및 구소련": "유럽"}
+
+RECONCILIATION_METHODS = {
+    "wls": "WLS (구조 가중)",
+    "ols": "OLS",
+    "bottom_up": "Bottom-up",
+}
+
+
+def region_continents(brand: str) -> dict:
+    df = load_raw(brand, "region")
+    continents = dict(zip(df["지역명"], df["대륙"])) if "대륙" in df.columns else REGION_CONTINENTS
+    return {**continents, **CONTINENT_OVERRIDES}
+
+
+@cached_by_version
+def build_hierarchy(brands=tuple(BRANDS)) -> dict:
+    """계층 구조와 노드별 월별 실적
+
+    Returns:
+        {"nodes": 노드 정보 DataFrame(레벨/브랜드/대륙/지역명), "S": 합산 행렬 (노드 수, 지역 수),
+         "history": 노드별 월별 실적 (노드 수, 기간), "dates": 월 DatetimeIndex}
+    """
+    leaves, leaf_values, dates = [], [], None
+    for brand in brands:
+        table = _series_table("region", brand)
+        continents = region_continents(brand)
+        dates = table.columns if dates is None else dates.union(table.columns)
+        for region in table.index:
+            leaves.append((brand, continents.get(region, "기타"), region))
+            leaf_values.append(table.loc[region])
+    leaf_matrix = pd.DataFrame(leaf_values).reindex(columns=dates).fillna(0).to_numpy(dtype="float64")
+
+    nodes = [(TOTAL, TOTAL, "", "")]
+    for brand in brands:
+        nodes.append(("브랜드", brand, "", ""))
+        for continent in sorted({c for b, c, _ in leaves if b == brand}):
+            nodes.append(("대륙", brand, continent, ""))
+    nodes += [("지역", brand, continent, region) for brand, continent, region in leaves]
+
+    # 노드가 어떤 지역(leaf)을 포함하는지 표시하는 합산 행렬
+    S = np.zeros((len(nodes), len(leaves)))
+    for i, (level, brand, continent, _) in enumerate(nodes):
+        for j, (leaf_brand, leaf_continent, _) in enumerate(leaves):
+            if (level == TOTAL or (level == "브랜드" and brand == leaf_brand)
+                    or (level == "대륙" and (brand, continent) == (leaf_brand, leaf_continent))):
+                S[i, j] = 1
+    S[len(nodes) - len(leaves):] = np.eye(len(leaves))
+
+    return {
+        "nodes": pd.DataFrame(nodes, columns=NODE_COLUMNS),
+        "S": S,
+        "history": S @ leaf_matrix,
+        "dates": dates,
+    }
+
+
+def reconciliation_matrix(S: np.ndarray, method: str = "wls") -> np.ndarray:
+    """정합화 행렬 G (지역 수, 노드 수) - 지역 예측 = G @ 노드 예측, 정합 예측 = S @ 지역 예측
+
+    ols: 모든 노드 같은 가중치 / wls: 노드가 포함한 지역 수에 반비례하는 가중치 / bottom_up: 지역 예측만 사용
+    """
+    n_nodes, n_leaves = S.shape
+    if method == "bottom_up":
+        return np.hstack([np.zeros((n_leaves, n_nodes - n_leaves)), np.eye(n_leaves)])
+    if method == "ols":
+        weights = np.ones(n_nodes)
+    elif method == "wls":
+        weights = 1.0 / S.sum(axis=1)
+    else:
+        raise ValueError(f"알 수 없는 정합화 방법입니다: {method}")
+    SW = S.T * weights                       # Sᵀ W⁻¹ (W는 대각 행렬)
+    return np.linalg.solve(SW @ S, SW)
+
+
+def reconcile(base: np.ndarray, S: np.ndarray, method: str = "wls") -> np.ndarray:
+    """노드별 예측 (노드 수, horizon) -> 정합 예측 (노드 수, horizon)
+
+    지역 예측을 0 이상 정수(대수)로 맞춘 뒤 다시 합산하므로 정합성(부모 = 자식 합)은 그대로 유지된다.
+    """
+    leaves = np.clip(np.round(reconciliation_matrix(S, method) @ base), 0, None)
+    return S @ leaves
+
+
+def forecast_hierarchy(horizon: int, method: str = "holt_winters", reconciliation: str = "wls",
+                       brands=tuple(BRANDS), include_base: bool = False) -> pd.DataFrame:
+    """전체 계층 예측 -> 노드 정보 + 월별 정합 예측 DataFrame (열: 레벨/브랜드/대륙/지역명/YYYY-MM...)
+
+    include_base=True면 정합화 전 예측(구분='개별')도 함께 반환한다 (구분='정합').
+    """
+    return _forecast_hierarchy(horizon, method, reconciliation, tuple(brands), include_base, exog_version(method))
+
+
+@cached_by_version
+def _forecast_hierarchy(horizon, method, reconciliation, brands, include_base, feature_version) -> pd.DataFrame:
+    hierarchy = build_hierarchy(brands)
+    base = forecast_matrix(hierarchy["history"], horizon, method, hierarchy["dates"])
+    reconciled = reconcile(base, hierarchy["S"], reconciliation)
+
+    future = pd.date_range(start=hierarchy["dates"][-1] + pd.DateOffset(months=1), periods=horizon, freq="MS")
+    month_cols = list(future.strftime("%Y-%m"))
+    frames = [("정합", reconciled)] + ([("개별", base)] if include_base else [])
+    return pd.concat([
+        pd.concat([hierarchy["nodes"].assign(구분=label),
+                   pd.DataFrame(values.round(), columns=month_cols)], axis=1)
+        for label, values in frames
+    ], ignore_index=True)
+
+
+def coherence_gap(forecast: pd.DataFrame) -> float:
+    """부모 노드 예측과 자식 노드 합의 최대 차이 (정합 예측이면 0에 가까움)"""
+    month_cols = [c for c in forecast.columns if c not in NODE_COLUMNS + ["구분"]]
+    values = forecast[month_cols].to_numpy(dtype="float64")
+    level = forecast["레벨"].to_numpy()
+    total = values[level == TOTAL].sum(axis=0)
+    gaps = [np.abs(total - values[level == "브랜드"].sum(axis=0)).max()]
+    for brand in forecast.loc[level == "브랜드", "브랜드"]:
+        in_brand = forecast["브랜드"].to_numpy() == brand
+        brand_total = values[(level == "브랜드") & in_brand].sum(axis=0)
+        gaps.append(np.abs(brand_total - values[(level == "대륙") & in_brand].sum(axis=0)).max())
+        gaps.append(np.abs(brand_total - values[(level == "지역") & in_brand].sum(axis=0)).max())
+    return float(max(gaps))
@@ -0,0 +1,231 @@
+# modules/forecast_jobs.py
+# ----------------------------
+# 예측 모델 백그라운드 학습 작업 큐
+# - 학습은 별도 워커 프로세스 풀에서 실행 (Streamlit 스크립트 실행을 막지 않음)
+# - submit_training_job()은 작업 ID를 돌려주고, get_job()으로 상태/진행률 조회
+# - 같은 (종류, 이름)에 대한 대기/실행 중 작업이 있으면 새로 만들지 않고 공유
+# - 학습 결과는 models/에 원자적으로 저장 (modules/forecast_models.save_artifacts)
+# ----------------------------
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from modules.forecast_lstm import (DEFAULT_EPOCHS, DEFAULT_TIME_STEPS, DEFAULT_UNITS, LOSS_THRESHOLD,
+                                   prepare_lstm_data, train_lstm_model)
+from modules.forecast_models import append_lineage, load_config, save_artifacts
+from modules.forecast_series import load_series, series_hash
+
+# 동시에 학습할 워커 프로세스 수 (TensorFlow가 프로세스마다 여러 스레드를 쓰므로 적게 유지)
+TRAINING_WORKERS = max(1, min(2, (os.cpu_count() or 1) // 2))
+# 완료된 작업 기록 보관 개수
+MAX_FINISHED_JOBS = 200
+
+ACTIVE_STATUSES = ("queued", "running")
+
+_lock = threading.Lock()
+_jobs = {}        # 작업 ID -> 작업 정보 dict
+_active = {}      # (종류, 이름) -> 대기/실행 중 작업 ID
+_executor = None
+_progress_queue = None
+_listener_stop = None
+
+# 워커 프로세스 안에서만 설정됨
+_worker_queue = None
+
+
+# ----------------------------
+# 워커 프로세스 쪽
+# ----------------------------
+def _init_worker(progress_queue):
+    global _worker_queue
+    _worker_queue = progress_queue
+
+
+def _report(job_id, **fields):
+    _worker_queue.put((job_id, fields))
+
+
+def training_config(kind: str, name: str, epochs: int = None) -> dict:
+    """학습 설정 - 튜닝 결과(models/..._config.json)가 있으면 사용, 없으면 기본값 (epochs를 주면 우선)"""
+    tuned = load_config(kind, name) or {}
+    return {
+        "time_steps": tuned.get("time_steps", DEFAULT_TIME_STEPS),
+        "units": tuned.get("units", DEFAULT_UNITS),
+        "learning_rate": tuned.get("learning_rate"),
+        "epochs": epochs or tuned.get("epochs", DEFAULT_EPOCHS),
+        # 튜닝한 epoch 수를 끝까지 학습하도록 튜닝 설정은 loss 임계값 0.0을 저장함
+        "loss_threshold": tuned.get("loss_threshold", LOSS_THRESHOLD),
+    }
+
+
+def lineage_record(event: str, series, scaler, **fields) -> dict:
+    """학습 이력 한 건 (event: train / update)"""
+    return {
+        "event": event,
+        "trained_until": series.index[-1].strftime("%Y-%m"),
+        "data_hash": series_hash(series),
+        "scaler_min": float(scaler.data_min_[0]),
+        "scaler_max": float(scaler.data_max_[0]),
+        "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        **fields,
+    }
+
+
+def train_series_model(kind: str, name: str, epochs: int = None, on_epoch=None) -> dict:
+    """시계열 하나의 LSTM 학습 + models/에 저장 (백그라운드 작업/일괄 사전 학습 공용)"""
+    config = training_config(kind, name, epochs)
+    series = load_series(kind, name)
+    X, y, scaler = prepare_lstm_data(series, time_steps=config["time_steps"])
+    model, log = train_lstm_model(X, y, units=config["units"], epochs=config["epochs"],
+                                  learning_rate=config["learning_rate"], loss_threshold=config["loss_threshold"],
+                                  on_epoch=on_epoch)
+    save_artifacts(kind, name, model, scaler, cache=False)
+    append_lineage(kind, name, lineage_record("train", series, scaler, config=config,
+                                              epochs_run=log["epochs_run"]))
+    return {
+        "data_hash": series_hash(series),
+        "config": config,
+        "epochs_run": log["epochs_run"],
+        "early_stopped": log["early_stopped"],
+        "final_loss": log["losses"][-1] if log["losses"] else None,
+        "total_seconds": log["total_seconds"],
+    }
+
+
+def run_training(job_id: str, kind: str, name: str, epochs: int = None) -> dict:
+    """백그라운드 학습 작업 본체 (워커 프로세스에서 실행)"""
+    _report(job_id, status="running", started_at=time.time())
+
+    def on_epoch(epoch, total, loss, seconds):
+        _report(job_id, epoch=epoch, epochs=total, loss=loss, progress=epoch / total)
+
+    return train_series_model(kind, name, epochs=epochs, on_epoch=on_epoch)
+
+
+# ----------------------------
+# 앱(부모 프로세스) 쪽
+# ----------------------------
+def _drain_progress(progress_queue, stop):
+    # 워커가 보낸 진행 상황을 작업 정보에 반영 (풀을 버리면 stop이 설정되어 종료)
+    try:
+        while not stop.is_set():
+            try:
+                job_id, fields = progress_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError, ValueError):
+                return
+            with _lock:
+                job = _jobs.get(job_id)
+                if job is not None and job["status"] in ACTIVE_STATUSES:
+                    job.update(fields)
+    finally:
+        progress_queue.close()
+
+
+def _get_executor():
+    global _executor, _progress_queue, _listener_stop
+    if _executor is None:
+        # TensorFlow가 로드된 프로세스를 fork하지 않도록 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        _progress_queue = context.Queue()
+        _listener_stop = threading.Event()
+        _executor = ProcessPoolExecutor(
+            max_workers=TRAINING_WORKERS,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(_progress_queue,),
+        )
+        threading.Thread(target=_drain_progress, args=(_progress_queue, _listener_stop),
+                         name="forecast-job-progress", daemon=True).start()
+    return _executor
+
+
+def _discard_executor(executor):
+    # 깨진 풀과 그 풀의 진행 상황 수신 스레드/큐를 정리 (다음 제출 때 새로 만듦, _lock 안에서 호출)
+    # 같은 풀의 다른 작업이 늦게 실패해도 이미 새로 만든 풀은 버리지 않음
+    global _executor, _progress_queue, _listener_stop
+    if executor is not _executor:
+        return
+    _listener_stop.set()
+    _executor.shutdown(wait=False)
+    _executor = _progress_queue = _listener_stop = None
+
+
+def _prune_finished():
+    finished = [job_id for job_id, job in _jobs.items() if job["status"] not in ACTIVE_STATUSES]
+    for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del _jobs[job_id]
+
+
+def _on_done(job_id, future, executor):
+    with _lock:
+        job = _jobs[job_id]
+        _active.pop((job["kind"], job["name"]), None)
+        job["finished_at"] = time.time()
+        if future.cancelled():
+            job["status"] = "failed"
+            job["error"] = "작업이 취소되었습니다"
+            _prune_finished()
+            return
+        error = future.exception()
+        if error is not None:
+            job["status"] = "failed"
+            job["error"] = str(error)
+            if isinstance(error, BrokenProcessPool):
+                # 워커가 비정상 종료되면 풀을 버리고 다음 제출 때 새로 만듦
+                _discard_executor(executor)
+        else:
+            job["status"] = "done"
+            job["progress"] = 1.0
+            job["result"] = future.result()
+        _prune_finished()
+
+
+def submit_training_job(kind: str, name: str, epochs: int = None) -> str:
+    """학습 작업 제출 -> 작업 ID (같은 시계열의 진행 중 작업이 있으면 그 ID)"""
+    key = (kind, name)
+    with _lock:
+        job_id = _active.get(key)
+        if job_id is not None:
+            return job_id
+        job_id = uuid.uuid4().hex[:12]
+        _jobs[job_id] = {
+            "id": job_id, "kind": kind, "name": name, "status": "queued",
+            "progress": 0.0, "epoch": 0, "epochs": epochs or DEFAULT_EPOCHS, "loss": None,
+            "submitted_at": time.time(), "started_at": None, "finished_at": None,
+            "error": None, "result": None,
+        }
+        try:
+            executor = _get_executor()
+            future = executor.submit(run_training, job_id, kind, name, epochs)
+        except Exception:
+            del _jobs[job_id]
+            raise
+        _active[key] = job_id
+    future.add_done_callback(lambda f: _on_done(job_id, f, executor))
+    return job_id
+
+
+def get_job(job_id: str):
+    """작업 정보 사본 (없으면 None)"""
+    with _lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+
+def find_active_job(kind: str, name: str):
+    with _lock:
+        job_id = _active.get((kind, name))
+        return dict(_jobs[job_id]) if job_id is not None else None
+
+
+def list_jobs() -> list:
+    with _lock:
+        return [dict(job) for job in _jobs.values()]
@@ -0,0 +1,293 @@
+# modules/forecast_lstm.py
+# ----------------------------
+# LSTM 예측 모델 공용 모듈
+# - 지역별/차종별/공장별 예측 탭이 같은 모델 구성과 학습 루프를 사용
+# - 학습은 한 번만 수행: epoch마다 진행률 콜백 호출, loss 임계값에 도달하면 조기 종료
+# - 다중 시점 예측은 컴파일된 롤아웃으로 한 번에 실행 (여러 윈도우를 배치로 처리)
+# - 예측 구간: 한 단계 앞 잔차를 재표집해 여러 경로를 배치 롤아웃 한 번으로 생성 (residual bootstrap)
+# 사용 예시 (벤치마크 CLI): python -m modules.forecast_lstm [모델 경로]
+# ----------------------------
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.lazy_import import lazy_import
+from modules.forecast_windows import series_windows, sliding_windows
+
+# TensorFlow는 학습/예측 시점에만 로드
+tf = lazy_import("tensorflow")
+
+DEFAULT_UNITS = 50
+DEFAULT_EPOCHS = 600
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_TIME_STEPS = 12
+LOSS_THRESHOLD = 0.01
+
+# 예측 구간 (residual bootstrap)
+INTERVAL_SAMPLES = 200
+MAX_INTERVAL_SAMPLES = 1000   # 경로 수 상한 (지연 시간 제한)
+INTERVAL_LEVEL = 0.8
+INTERVAL_COLUMNS = ('예측 하한', '예측 상한')
+
+
+def init_worker_threads(threads: int):
+    """학습 워커 프로세스 초기화 - 워커마다 TensorFlow 연산 스레드 수를 나눠 가져 코어를 과점유하지 않도록 설정
+
+    사전 학습/튜닝/증분 갱신/백테스트 CLI의 ProcessPoolExecutor initializer로 사용
+    (TensorFlow가 없는 환경에서는 통계 엔진만 돌 수 있도록 아무것도 하지 않음).
+    """
+    try:
+        import tensorflow
+    except ImportError:
+        return
+    tensorflow.config.threading.set_intra_op_parallelism_threads(threads)
+    tensorflow.config.threading.set_inter_op_parallelism_threads(1)
+
+
+def prepare_lstm_data(series, time_steps=DEFAULT_TIME_STEPS):
+    """(X (N, time_steps, 1), y (N, 1), scaler) - 캐시된 공유 객체이므로 수정하지 말 것 (윈도우는 읽기 전용 뷰)"""
+    windows = series_windows(series, time_steps)
+    return windows["X"], windows["y"], windows["scaler"]
+
+
+def build_lstm_model(input_shape, units: int = DEFAULT_UNITS, learning_rate: float = None):
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input(shape=input_shape),
+        tf.keras.layers.LSTM(units=units, activation='relu'),
+        tf.keras.layers.Dense(1)
+    ])
+    optimizer = tf.keras.optimizers.Adam(learning_rate=learning_rate) if learning_rate else 'adam'
+    model.compile(optimizer=optimizer, loss='mse')
+    return model
+
+
+def make_progress_callback(epochs: int, on_epoch=None, loss_threshold: float = LOSS_THRESHOLD):
+    """epoch별 loss/소요 시간 기록 + 진행률 보고 + loss 임계값 조기 종료 콜백
+
+    on_epoch(epoch, epochs, loss, seconds)는 epoch이 끝날 때마다 호출된다.
+    """
+
+    class TrainingProgress(tf.keras.callbacks.Callback):
+        def __init__(self):
+            super().__init__()
+            self.losses = []
+            self.epoch_seconds = []
+            self.early_stopped = False
+            self._epoch_start = None
+
+        def on_epoch_begin(self, epoch, logs=None):
+            self._epoch_start = time.perf_counter()
+
+        def on_epoch_end(self, epoch, logs=None):
+            seconds = time.perf_counter() - self._epoch_start
+            current_loss = (logs or {}).get('loss')
+            self.losses.append(current_loss)
+            self.epoch_seconds.append(seconds)
+            if on_epoch is not None:
+                on_epoch(epoch + 1, epochs, current_loss, seconds)
+            if current_loss is not None and current_loss <= loss_threshold:
+                self.early_stopped = True
+                self.model.stop_training = True
+
+    return TrainingProgress()
+
+
+def train_lstm_model(X, y, units: int = DEFAULT_UNITS, epochs: int = DEFAULT_EPOCHS,
+                     batch_size: int = DEFAULT_BATCH_SIZE, on_epoch=None,
+                     loss_threshold: float = LOSS_THRESHOLD, learning_rate: float = None,
+                     validation_data=None, patience: int = None):
+    """LSTM 모델 학습 (단일 fit 호출)
+
+    validation_data=(X_val, y_val)와 patience를 주면 검증 loss 기준으로 조기 종료하고
+    가장 좋았던 epoch의 가중치로 되돌린다.
+
+    Returns:
+        (model, log) - log: {"losses", "val_losses", "epoch_seconds", "epochs_run", "early_stopped", "total_seconds"}
+    """
+    model = build_lstm_model((X.shape[1], X.shape[2]), units=units, learning_rate=learning_rate)
+    progress = make_progress_callback(epochs, on_epoch=on_epoch, loss_threshold=loss_threshold)
+    callbacks = [progress]
+    if validation_data is not None and patience:
+        callbacks.append(tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=patience,
+                                                          restore_best_weights=True))
+
+    start = time.perf_counter()
+    history = model.fit(X, y, epochs=epochs, batch_size=batch_size, verbose=0, callbacks=callbacks,
+                        validation_data=validation_data)
+    log = {
+        "losses": progress.losses,
+        "val_losses": history.history.get('val_loss', []),
+        "epoch_seconds": progress.epoch_seconds,
+        "epochs_run": len(progress.losses),
+        "early_stopped": progress.early_stopped or len(progress.losses) < epochs,
+        "total_seconds": time.perf_counter() - start,
+    }
+    return model, log
+
+
+# ----------------------------
+# 다중 시점(재귀) 예측
+# - 예측 구간 전체를 tf.function 하나로 컴파일해 한 번의 호출로 실행 (시점마다 predict 호출 X)
+# - 입력은 (배치, time_steps) 윈도우: 같은 모델을 쓰는 여러 시계열/시작점을 한 번에 예측
+# ----------------------------
+
+_rollout_fns = {}   # (id(model), horizon, 추가 입력 수, 잡음 여부) -> (model, 컴파일된 함수)
+MAX_ROLLOUT_FNS = 32  # 모델 객체를 붙잡고 있으므로 개수 제한 (오래된 것부터 제거)
+
+
+def _get_rollout_fn(model, horizon: int, n_extra: int = 0, with_noise: bool = False):
+    key = (id(model), horizon, n_extra, with_noise)
+    cached = _rollout_fns.get(key)
+    if cached is not None and cached[0] is model:
+        return cached[1]
+
+    @tf.function(reduce_retracing=True)
+    def rollout(window, *extra):
+        # window: (배치, time_steps, 1) - 파이썬 루프는 그래프 안에서 horizon번 펼쳐짐
+        # extra: 시점마다 그대로 전달되는 추가 입력 (예: 글로벌 모델의 시계열/브랜드 ID)
+        # with_noise면 extra[0]은 (배치, horizon) 잡음: 시점마다 예측값에 더한 뒤 다음 입력으로 사용
+        if with_noise:
+            noise, extra = extra[0], extra[1:]
+        steps = []
+        for t in range(horizon):
+            pred = model([window, *extra], training=False) if extra else model(window, training=False)
+            if with_noise:
+                pred = pred + noise[:, t:t + 1]
+            steps.append(pred)
+            window = tf.concat([window[:, 1:, :], tf.expand_dims(pred, -1)], axis=1)
+        return tf.concat(steps, axis=1)
+
+    while len(_rollout_fns) >= MAX_ROLLOUT_FNS:
+        _rollout_fns.pop(next(iter(_rollout_fns)))
+    _rollout_fns[key] = (model, rollout)
+    return rollout
+
+
+def forecast_scaled_batch(model, windows, horizon: int, extra_inputs=(), noise=None):
+    """스케일된 입력 윈도우 배치 -> 스케일된 예측값 (배치, horizon)
+
+    Args:
+        windows: (배치, time_steps) 또는 (배치, time_steps, 1) 배열
+        extra_inputs: 모델의 추가 입력 배열 목록 (각각 배치 크기만큼)
+        noise: (배치, horizon) 배열 - 시점마다 예측값에 더할 잡음 (예측 구간 표본 경로용)
+    """
+    windows = np.asarray(windows, dtype="float32")
+    if windows.ndim == 2:
+        windows = windows[:, :, None]
+    extra = [tf.constant(np.asarray(x)) for x in extra_inputs]
+    if noise is not None:
+        extra.insert(0, tf.constant(np.asarray(noise, dtype="float32")))
+    rollout = _get_rollout_fn(model, horizon, len(extra_inputs), with_noise=noise is not None)
+    # 결과를 담을 버퍼를 미리 할당해 두고 컴파일된 롤아웃 결과를 한 번에 복사
+    out = np.empty((windows.shape[0], horizon), dtype="float32")
+    out[:] = rollout(tf.constant(windows), *extra).numpy()
+    return out
+
+
+def forecast_lstm(model, series, forecast_months, scaler, time_steps=None, value_col='예측 판매량'):
+    """단일 시계열 미래 예측 -> 연도/월/예측값 DataFrame (time_steps를 주지 않으면 모델 입력 길이 사용)"""
+    time_steps = time_steps or model.input_shape[1]
+    data = scaler.transform(series['y'].values.reshape(-1, 1))
+    window = data[-time_steps:, 0][None, :]
+    forecast_scaled = forecast_scaled_batch(model, window, forecast_months).reshape(-1, 1)
+    forecast_values = scaler.inverse_transform(forecast_scaled)
+    return make_forecast_frame(series.index[-1], forecast_values.flatten(), value_col)
+
+
+def one_step_residuals(model, series, scaler, time_steps=None):
+    """학습 구간 한 단계 앞 예측 잔차 (스케일된 값) - 모든 윈도우를 모델 호출 한 번으로 예측"""
+    time_steps = time_steps or model.input_shape[1]
+    data = scaler.transform(series['y'].values.reshape(-1, 1))[:, 0].astype("float32")
+    windows, targets = sliding_windows(data, time_steps)
+    predicted = model(tf.constant(np.ascontiguousarray(windows)[:, :, None]), training=False).numpy()[:, 0]
+    return targets - predicted
+
+
+def forecast_lstm_intervals(model, series, forecast_months, scaler, samples: int = INTERVAL_SAMPLES,
+                            level: float = INTERVAL_LEVEL, time_steps=None, value_col='예측 판매량',
+                            seed: int = 0) -> pd.DataFrame:
+    """예측값 + 예측 구간(하한/상한) DataFrame
+
+    한 단계 앞 잔차를 시점마다 재표집해 더한 경로 samples개를 배치 롤아웃 한 번으로 만들고,
+    시점별 분위수로 구간을 정한다. samples는 MAX_INTERVAL_SAMPLES로 제한.
+    """
+    time_steps = time_steps or model.input_shape[1]
+    samples = int(min(max(samples, 1), MAX_INTERVAL_SAMPLES))
+    forecast = forecast_lstm(model, series, forecast_months, scaler, time_steps=time_steps, value_col=value_col)
+
+    residuals = one_step_residuals(model, series, scaler, time_steps)
+    rng = np.random.default_rng(seed)
+    noise = rng.choice(residuals, size=(samples, forecast_months))
+    data = scaler.transform(series['y'].values.reshape(-1, 1))[:, 0]
+    windows = np.repeat(data[-time_steps:][None, :], samples, axis=0)
+    paths = forecast_scaled_batch(model, windows, forecast_months, noise=noise)
+    paths = scaler.inverse_transform(paths.reshape(-1, 1)).reshape(samples, forecast_months)
+
+    tail = (1 - level) / 2
+    forecast[INTERVAL_COLUMNS[0]] = np.maximum(np.quantile(paths, tail, axis=0), 0)
+    forecast[INTERVAL_COLUMNS[1]] = np.quantile(paths, 1 - tail, axis=0)
+    return forecast
+
+
+def make_forecast_frame(last_date, values, value_col: str) -> pd.DataFrame:
+    future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), periods=len(values), freq='MS')
+    return pd.DataFrame({
+        '연도': future_dates.year,
+        '월': future_dates.month,
+        value_col: values
+    })
+
+
+def forecast_stepwise(model, window, horizon: int):
+    """기존 방식(시점마다 model.predict 호출) - 벤치마크 비교용"""
+    last_sequence = np.asarray(window, dtype="float32").reshape(-1, 1)
+    time_steps = len(last_sequence)
+    predictions = []
+    for _ in range(horizon):
+        pred = model.predict(last_sequence.reshape(1, time_steps, 1), verbose=0)
+        predictions.append(pred[0, 0])
+        last_sequence = np.append(last_sequence[1:], pred, axis=0)
+    return np.array(predictions)
+
+
+def benchmark_forecast(model, horizons=(1, 6, 12, 24), batch_sizes=(1, 64), repeat: int = 3,
+                       time_steps: int = DEFAULT_TIME_STEPS) -> list:
+    """예측 구간별 지연 시간 비교 (기존 시점별 predict vs 컴파일된 배치 롤아웃)
+
+    Returns:
+        [{"방식", "배치", "예측 구간", "소요시간(초)", "시점당(ms)"}, ...]
+    """
+    rng = np.random.default_rng(0)
+    rows = []
+    for horizon in horizons:
+        window = rng.random(time_steps, dtype="float32")
+        start = time.perf_counter()
+        forecast_stepwise(model, window, horizon)
+        seconds = time.perf_counter() - start
+        rows.append({"방식": "시점별 predict", "배치": 1, "예측 구간": horizon,
+                     "소요시간(초)": round(seconds, 4), "시점당(ms)": round(seconds / horizon * 1000, 3)})
+
+        for batch in batch_sizes:
+            windows = rng.random((batch, time_steps), dtype="float32")
+            forecast_scaled_batch(model, windows, horizon)  # 첫 호출은 그래프 컴파일 (측정 제외)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                forecast_scaled_batch(model, windows, horizon)
+            seconds = (time.perf_counter() - start) / repeat
+            rows.append({"방식": "컴파일 롤아웃", "배치": batch, "예측 구간": horizon,
+                         "소요시간(초)": round(seconds, 4), "시점당(ms)": round(seconds / horizon * 1000, 3)})
+    return rows
+
+
+if __name__ == "__main__":
+    import glob
+    import sys
+
+    paths = sys.argv[1:] or sorted(glob.glob("models/lstm_*_model.h5"))[:1]
+    if not paths:
+        sys.exit("벤치마크할 모델이 없습니다. (models/lstm_*_model.h5)")
+    bench_model = tf.keras.models.load_model(paths[0], compile=False)
+    print(f"모델: {paths[0]}")
+    print(pd.DataFrame(benchmark_forecast(bench_model)).to_string(index=False))
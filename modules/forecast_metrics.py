@@ -0,0 +1,30 @@
+# modules/forecast_metrics.py
+# ----------------------------
+# 예측 정확도 지표
+# - 여러 시계열을 (시계열 수, 예측 구간) 배열로 한 번에 계산
+# - 결측(NaN) 시점은 계산에서 제외
+# ----------------------------
+
+import numpy as np
+
+
+def mape(actual, predicted, axis=-1):
+    """평균 절대 백분율 오차(%) - 실제값이 0이거나 결측인 시점은 제외 (남는 시점이 없으면 NaN)"""
+    actual = np.asarray(actual, dtype="float64")
+    predicted = np.asarray(predicted, dtype="float64")
+    mask = (actual != 0) & ~np.isnan(actual) & ~np.isnan(predicted)
+    errors = np.where(mask, np.abs((actual - predicted) / np.where(mask, actual, 1.0)), 0.0)
+    counts = mask.sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, errors.sum(axis=axis) / counts * 100, np.nan)
+
+
+def rmse(actual, predicted, axis=-1):
+    """평균 제곱근 오차 - 결측 시점은 제외 (남는 시점이 없으면 NaN)"""
+    actual = np.asarray(actual, dtype="float64")
+    predicted = np.asarray(predicted, dtype="float64")
+    squared = (actual - predicted) ** 2
+    mask = ~np.isnan(squared)
+    counts = mask.sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, np.sqrt(np.where(mask, squared, 0.0).sum(axis=axis) / counts), np.nan)
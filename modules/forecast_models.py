@@ -0,0 +1,226 @@
+# modules/forecast_models.py
+# ----------------------------
+# 저장된 LSTM 모델/스케일러 공용 캐시
+# - models/lstm_{region|car|plant}_{이름}_model.h5 + _scaler.pkl을 프로세스당 한 번만 로드 (모든 세션 공유)
+# - 메모리 예산을 넘으면 가장 오래 사용하지 않은 모델부터 제거 (LRU)
+# - 파일 수정 시각(mtime)이 바뀌면 자동으로 다시 로드
+# - 적중/미스/제거 횟수 집계
+# - 튜닝으로 찾은 시계열별 학습 설정(_config.json), 학습/갱신 이력(_lineage.json)도 같은 폴더에 저장
+# ----------------------------
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+
+from core.lazy_import import lazy_import
+
+tf = lazy_import("tensorflow")
+
+MODELS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "models"))
+MODEL_KINDS = ("region", "car", "plant")
+# 전체 시계열을 하나로 학습한 글로벌 모델 (modules/forecast_global.py, 스케일러 자리에 메타 정보 저장)
+GLOBAL_KIND = "global"
+
+# 캐시 메모리 예산 (모델 가중치 기준 추정치)
+MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+
+_lock = threading.RLock()
+_entries = OrderedDict()   # (종류, 이름) -> {"mtimes", "model", "scaler", "bytes"}
+_load_locks = {}           # (종류, 이름) -> Lock (같은 모델을 여러 세션이 동시에 로드하지 않도록)
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def get_model_path(kind: str, name: str) -> str:
+    if kind not in MODEL_KINDS + (GLOBAL_KIND,):
+        raise ValueError(f"알 수 없는 모델 종류입니다: {kind}")
+    return os.path.join(MODELS_DIR, f"lstm_{kind}_{name}_model.h5")
+
+
+def get_scaler_path(kind: str, name: str) -> str:
+    if kind not in MODEL_KINDS + (GLOBAL_KIND,):
+        raise ValueError(f"알 수 없는 모델 종류입니다: {kind}")
+    return os.path.join(MODELS_DIR, f"lstm_{kind}_{name}_scaler.pkl")
+
+
+def get_config_path(kind: str, name: str) -> str:
+    """튜닝으로 찾은 학습 설정 (modules/forecast_tuning.py)"""
+    if kind not in MODEL_KINDS + (GLOBAL_KIND,):
+        raise ValueError(f"알 수 없는 모델 종류입니다: {kind}")
+    return os.path.join(MODELS_DIR, f"lstm_{kind}_{name}_config.json")
+
+
+def get_lineage_path(kind: str, name: str) -> str:
+    """모델 학습/갱신 이력 (학습 기준월, 데이터 해시, 스케일러 범위)"""
+    if kind not in MODEL_KINDS + (GLOBAL_KIND,):
+        raise ValueError(f"알 수 없는 모델 종류입니다: {kind}")
+    return os.path.join(MODELS_DIR, f"lstm_{kind}_{name}_lineage.json")
+
+
+def model_exists(kind: str, name: str) -> bool:
+    return os.path.exists(get_model_path(kind, name)) and os.path.exists(get_scaler_path(kind, name))
+
+
+def _artifact_mtimes(kind: str, name: str) -> tuple:
+    return (os.path.getmtime(get_model_path(kind, name)), os.path.getmtime(get_scaler_path(kind, name)))
+
+
+def artifact_version(kind: str, name: str):
+    """모델/스케일러 파일 버전 (수정 시각 튜플, 파일이 없으면 None) - 예측 결과 캐시 키에 사용"""
+    if not model_exists(kind, name):
+        return None
+    return _artifact_mtimes(kind, name)
+
+
+def _estimate_bytes(model) -> int:
+    # 가중치(float32) 크기 + 그래프/객체 오버헤드 여유분
+    return model.count_params() * 4 + 1024 * 1024
+
+
+def _evict_over_budget():
+    total = sum(entry["bytes"] for entry in _entries.values())
+    # 방금 넣은 항목(맨 뒤)은 남겨 둠
+    while total > MEMORY_BUDGET_BYTES and len(_entries) > 1:
+        _, entry = _entries.popitem(last=False)
+        total -= entry["bytes"]
+        _stats["evictions"] += 1
+
+
+def _put(key, mtimes, model, scaler):
+    with _lock:
+        _entries[key] = {"mtimes": mtimes, "model": model, "scaler": scaler, "bytes": _estimate_bytes(model)}
+        _entries.move_to_end(key)
+        _evict_over_budget()
+
+
+def load_artifacts(kind: str, name: str):
+    """(model, scaler) 반환 - 캐시에 최신 버전이 있으면 디스크를 읽지 않음
+
+    반환된 모델/스케일러는 세션 간에 공유되므로 수정(재학습 등)하지 말 것.
+    """
+    key = (kind, name)
+    mtimes = _artifact_mtimes(kind, name)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry["mtimes"] == mtimes:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            return entry["model"], entry["scaler"]
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+
+    with load_lock:
+        # 다른 세션이 먼저 로드했으면 그 결과 사용
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None and entry["mtimes"] == mtimes:
+                _entries.move_to_end(key)
+                _stats["hits"] += 1
+                return entry["model"], entry["scaler"]
+            _stats["misses"] += 1
+        model = tf.keras.models.load_model(get_model_path(kind, name), compile=False)
+        scaler = joblib.load(get_scaler_path(kind, name))
+        _put(key, mtimes, model, scaler)
+        return model, scaler
+
+
+def _tmp_path(path: str) -> str:
+    # 확장자는 유지 (Keras는 확장자로 저장 형식을 정함)
+    root, ext = os.path.splitext(path)
+    return f"{root}.{os.getpid()}-{threading.get_ident()}.tmp{ext}"
+
+
+def atomic_save_model(model, path: str):
+    """임시 파일에 저장한 뒤 os.replace로 교체 (쓰다 만 파일이 읽히지 않음)"""
+    tmp_path = _tmp_path(path)
+    try:
+        model.save(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def atomic_dump(obj, path: str):
+    tmp_path = _tmp_path(path)
+    try:
+        joblib.dump(obj, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def save_artifacts(kind: str, name: str, model, scaler, cache: bool = True):
+    """학습한 모델/스케일러 저장 후 캐시에 바로 등록 (cache=False면 저장만)
+
+    모델이 있으면 스케일러도 있다고 보고 읽으므로 스케일러부터 교체한다.
+    """
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    atomic_dump(scaler, get_scaler_path(kind, name))
+    atomic_save_model(model, get_model_path(kind, name))
+    if cache:
+        _put((kind, name), _artifact_mtimes(kind, name), model, scaler)
+
+
+def _read_json(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(obj, path: str):
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    tmp_path = _tmp_path(path)
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_config(kind: str, name: str):
+    """시계열별 학습 설정 dict (튜닝하지 않았으면 None)"""
+    return _read_json(get_config_path(kind, name))
+
+
+def save_config(kind: str, name: str, config: dict):
+    _write_json(config, get_config_path(kind, name))
+
+
+# 이력 파일에 남길 최대 기록 수 (오래된 것부터 삭제)
+MAX_LINEAGE_RECORDS = 100
+
+
+def load_lineage(kind: str, name: str) -> list:
+    """학습/갱신 기록 목록 (오래된 순, 기록이 없으면 빈 목록)"""
+    return _read_json(get_lineage_path(kind, name)) or []
+
+
+def append_lineage(kind: str, name: str, record: dict):
+    """학습(train) / 증분 갱신(update) 기록 추가 - 모델 파일을 저장한 뒤 호출"""
+    records = load_lineage(kind, name) + [record]
+    _write_json(records[-MAX_LINEAGE_RECORDS:], get_lineage_path(kind, name))
+
+
+def get_cache_stats() -> dict:
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+            "models": len(_entries),
+            "bytes": sum(entry["bytes"] for entry in _entries.values()),
+            "budget_bytes": MEMORY_BUDGET_BYTES,
+        }
+
+
+def clear_cache():
+    with _lock:
+        _entries.clear()
+        for name in _stats:
+            _stats[name] = 0
@@ -0,0 +1,125 @@
+# modules/forecast_plots.py
+# ----------------------------
+# 예측 그래프 렌더링
+# - 화면 표시: Plotly 인터랙티브 차트 (실적 + 예측 + 예측 구간 + 예측 시작점)
+# - 이미지(PNG, 300dpi): matplotlib로 같은 예측 내용당 한 번만 그려 메모리에 캐시 (LRU, 모든 세션 공유)
+#   다운로드 버튼과 파일 저장이 같은 바이트를 사용, 디스크(images/result/)에는 요청할 때만 저장
+# - pyplot 전역 상태를 쓰지 않는 Figure 객체로 그려 여러 세션에서 동시에 호출해도 안전
+# ----------------------------
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.graph_objects as go
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from modules.forecast_lstm import INTERVAL_COLUMNS, INTERVAL_LEVEL
+
+RESULT_IMAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "images", "result"))
+PNG_DPI = 300
+MAX_PLOT_ENTRIES = 64
+
+_lock = threading.Lock()
+_png_cache = OrderedDict()   # 내용 해시 -> PNG 바이트
+_stats = {"hits": 0, "misses": 0}
+
+
+def forecast_index(forecast_df: pd.DataFrame) -> pd.DatetimeIndex:
+    return pd.to_datetime(forecast_df['연도'].astype(str) + '-' + forecast_df['월'].astype(str))
+
+
+def forecast_figure(series, forecast_df, value_col: str, title: str, actual_label: str, y_label: str,
+                    engine_label: str) -> go.Figure:
+    """화면 표시용 인터랙티브 차트"""
+    index = forecast_index(forecast_df)
+    fig = go.Figure()
+    if INTERVAL_COLUMNS[0] in forecast_df:
+        fig.add_trace(go.Scatter(x=index, y=forecast_df[INTERVAL_COLUMNS[1]], mode='lines', line=dict(width=0),
+                                 showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(x=index, y=forecast_df[INTERVAL_COLUMNS[0]], mode='lines', line=dict(width=0),
+                                 fill='tonexty', fillcolor='rgba(255, 0, 0, 0.15)',
+                                 name=f'{INTERVAL_LEVEL:.0%} 예측 구간'))
+    fig.add_trace(go.Scatter(x=series.index, y=series['y'], mode='lines', name=actual_label,
+                             line=dict(color='black')))
+    fig.add_trace(go.Scatter(x=index, y=forecast_df[value_col], mode='lines+markers', name=f'{engine_label} 예측',
+                             line=dict(color='red', dash='dash')))
+    fig.add_vline(x=series.index[-1], line=dict(color='gray', dash='dot'))
+    fig.update_layout(title=title, xaxis_title="날짜", yaxis_title=y_label, hovermode='x unified',
+                      legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+                      margin=dict(l=10, r=10, t=60, b=10))
+    return fig
+
+
+def _content_key(series, forecast_df, *labels) -> str:
+    digest = hashlib.sha1()
+    digest.update(pd.util.hash_pandas_object(series['y'], index=True).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(forecast_df, index=False).to_numpy().tobytes())
+    digest.update(repr(tuple(forecast_df.columns) + labels).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _render_png(series, forecast_df, value_col, title, actual_label, y_label, engine_label) -> bytes:
+    index = forecast_index(forecast_df)
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(series.index, series['y'], label=actual_label, color='black')
+    ax.plot(index, forecast_df[value_col].values, label=f'{engine_label} 예측', color='red', linestyle='--')
+    if INTERVAL_COLUMNS[0] in forecast_df:
+        ax.fill_between(index, forecast_df[INTERVAL_COLUMNS[0]], forecast_df[INTERVAL_COLUMNS[1]],
+                        color='red', alpha=0.15, label=f'{INTERVAL_LEVEL:.0%} 예측 구간')
+    ax.axvline(x=series.index[-1], color='gray', linestyle=':', label='예측 시작점')
+    ax.set_title(title)
+    ax.set_xlabel("날짜")
+    ax.set_ylabel(y_label)
+    ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=PNG_DPI)
+    return buffer.getvalue()
+
+
+def forecast_png(series, forecast_df, value_col: str, title: str, actual_label: str, y_label: str,
+                 engine_label: str) -> bytes:
+    """예측 그래프 PNG 바이트 - 같은 실적/예측/제목이면 다시 그리지 않음"""
+    labels = (value_col, title, actual_label, y_label, engine_label, PNG_DPI)
+    key = _content_key(series, forecast_df, *labels)
+    with _lock:
+        png = _png_cache.get(key)
+        if png is not None:
+            _png_cache.move_to_end(key)
+            _stats["hits"] += 1
+            return png
+        _stats["misses"] += 1
+    png = _render_png(series, forecast_df, value_col, title, actual_label, y_label, engine_label)
+    with _lock:
+        _png_cache[key] = png
+        while len(_png_cache) > MAX_PLOT_ENTRIES:
+            _png_cache.popitem(last=False)
+    return png
+
+
+def save_png(png: bytes, filename: str) -> str:
+    """PNG 바이트를 images/result/에 저장 (임시 파일 후 교체) -> 저장 경로"""
+    os.makedirs(RESULT_IMAGE_DIR, exist_ok=True)
+    path = os.path.join(RESULT_IMAGE_DIR, filename)
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+def get_plot_cache_stats() -> dict:
+    with _lock:
+        return {**_stats, "entries": len(_png_cache), "bytes": sum(len(png) for png in _png_cache.values())}
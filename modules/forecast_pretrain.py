@@ -0,0 +1,159 @@
+# modules/forecast_pretrain.py
+# ----------------------------
+# 예측 모델 일괄 사전 학습 (CLI)
+# - 지역(region) / 차종-거래 구분(car) / 공장-차종-거래 구분(plant) 전체 시계열을 CPU 코어 수만큼 병렬 학습
+# - 데이터 해시가 manifest와 같고 모델 파일이 있으면 건너뜀
+# - models/manifest.json에 시계열별 데이터 해시, 학습 시간, epoch 수, 최종 loss 기록
+# 사용 예시: python -m modules.forecast_pretrain --workers 4 [--kinds region car] [--force]
+# ----------------------------
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from modules.forecast_jobs import train_series_model, training_config
+from modules.forecast_lstm import DEFAULT_TIME_STEPS, DEFAULT_UNITS, LOSS_THRESHOLD, init_worker_threads
+from modules.forecast_models import MODEL_KINDS, MODELS_DIR, model_exists
+from modules.forecast_series import is_active_series, list_series, load_series, series_hash
+
+MANIFEST_PATH = os.path.join(MODELS_DIR, "manifest.json")
+
+
+def manifest_key(kind: str, name: str) -> str:
+    return f"{kind}/{name}"
+
+
+def load_manifest() -> dict:
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: dict):
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def _same_config(entry: dict, config: dict) -> bool:
+    # 설정 기록이 없는 예전 manifest 항목은 기본 설정으로 학습한 것으로 간주
+    stored = entry.get("config") or {"time_steps": DEFAULT_TIME_STEPS, "units": DEFAULT_UNITS,
+                                     "learning_rate": None, "epochs": entry.get("epochs")}
+    return {"loss_threshold": LOSS_THRESHOLD, **stored} == config
+
+
+def plan_series(kinds, manifest: dict, force: bool = False, include_inactive: bool = False,
+                epochs: int = None) -> tuple:
+    """학습 대상 / 건너뛸 대상 분류
+
+    Returns:
+        (todo, skipped) - todo: [(kind, name, data_hash)], skipped: [(kind, name, 사유)]
+    """
+    todo, skipped = [], []
+    for kind in kinds:
+        for name in list_series(kind):
+            series = load_series(kind, name)
+            config = training_config(kind, name, epochs)
+            if len(series) <= max(DEFAULT_TIME_STEPS, config["time_steps"]):
+                skipped.append((kind, name, "데이터 부족"))
+                continue
+            if not include_inactive and not is_active_series(series):
+                skipped.append((kind, name, "최근 실적 없음"))
+                continue
+            data_hash = series_hash(series)
+            entry = manifest.get(manifest_key(kind, name), {})
+            # 튜닝 등으로 학습 설정이 바뀐 경우에도 다시 학습
+            if (not force and entry.get("data_hash") == data_hash and _same_config(entry, config)
+                    and model_exists(kind, name)):
+                skipped.append((kind, name, "변경 없음"))
+                continue
+            todo.append((kind, name, data_hash))
+    return todo, skipped
+
+
+def pretrain(kinds=MODEL_KINDS, workers: int = None, epochs: int = None,
+             force: bool = False, include_inactive: bool = False, log=print) -> dict:
+    """전체 시계열 사전 학습 후 manifest 갱신
+
+    Returns:
+        {"trained": n, "failed": n, "skipped": n, "seconds": 전체 소요 시간}
+    """
+    workers = workers or max(1, os.cpu_count() or 1)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    manifest = load_manifest()
+    todo, skipped = plan_series(kinds, manifest, force=force, include_inactive=include_inactive, epochs=epochs)
+    log(f"학습 대상 {len(todo)}개 / 건너뜀 {len(skipped)}개 (워커 {workers}개, 워커당 스레드 {threads}개)")
+
+    start = time.perf_counter()
+    trained = failed = 0
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_worker_threads, initargs=(threads,)) as executor:
+        futures = {executor.submit(train_series_model, kind, name, epochs): (kind, name)
+                   for kind, name, _ in todo}
+        for done, future in enumerate(as_completed(futures), start=1):
+            kind, name = futures[future]
+            key = manifest_key(kind, name)
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                manifest[key] = {**manifest.get(key, {}), "status": "failed", "error": str(e),
+                                 "updated_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+                log(f"[{done}/{len(todo)}] 실패 {key}: {e}")
+            else:
+                trained += 1
+                manifest[key] = {
+                    "status": "trained",
+                    "data_hash": result["data_hash"],
+                    "config": result["config"],
+                    "epochs": result["config"]["epochs"],
+                    "epochs_run": result["epochs_run"],
+                    "early_stopped": result["early_stopped"],
+                    "final_loss": result["final_loss"],
+                    "train_seconds": round(result["total_seconds"], 2),
+                    "trained_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                }
+                loss = f"{result['final_loss']:.4f}" if result["final_loss"] is not None else "-"
+                log(f"[{done}/{len(todo)}] 완료 {key}: {result['epochs_run']} epoch, "
+                    f"loss {loss}, {result['total_seconds']:.1f}초")
+            # 중간에 중단돼도 완료된 결과는 남도록 매번 저장
+            save_manifest(manifest)
+
+    seconds = time.perf_counter() - start
+    log(f"완료: 학습 {trained}개, 실패 {failed}개, 건너뜀 {len(skipped)}개 ({seconds:.1f}초)")
+    return {"trained": trained, "failed": failed, "skipped": len(skipped), "seconds": seconds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="예측 모델 일괄 사전 학습")
+    parser.add_argument("--kinds", nargs="+", choices=MODEL_KINDS, default=list(MODEL_KINDS))
+    parser.add_argument("--workers", type=int, default=None, help="병렬 워커 수 (기본: CPU 코어 수)")
+    parser.add_argument("--epochs", type=int, default=None, help="학습 epoch 수 (기본: 튜닝 설정 또는 600)")
+    parser.add_argument("--force", action="store_true", help="데이터가 같아도 다시 학습")
+    parser.add_argument("--include-inactive", action="store_true", help="최근 실적이 없는 시계열도 학습")
+    parser.add_argument("--dry-run", action="store_true", help="학습 대상만 출력")
+    args = parser.parse_args(argv)
+
+    if args.dry_run:
+        todo, skipped = plan_series(args.kinds, load_manifest(), force=args.force,
+                                    include_inactive=args.include_inactive, epochs=args.epochs)
+        for kind, name, _ in todo:
+            print(f"학습 예정 {manifest_key(kind, name)}")
+        print(f"학습 대상 {len(todo)}개 / 건너뜀 {len(skipped)}개")
+        return 0
+
+    summary = pretrain(args.kinds, workers=args.workers, epochs=args.epochs, force=args.force,
+                       include_inactive=args.include_inactive)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# modules/forecast_series.py
+# ----------------------------
+# 예측 대상 시계열 카탈로그
+# - 예측 화면과 같은 규칙으로 시계열 이름을 만들고 월별 시계열('y')을 추출 (기본: 현대)
+#   region: 지역명 / car: 차종-거래 구분 / plant: 공장명(국가)-차종-거래 구분
+# - 데이터 파일이 바뀔 때만 다시 계산 (반환값은 공유 객체이므로 수정하지 말 것)
+# ----------------------------
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from modules.data_columnar import is_month_column
+from modules.data_registry import cached_by_version, load_raw
+
+FORECAST_BRAND = "현대"
+
+# 종류별 이름 구성 컬럼
+NAME_COLUMNS = {
+    "region": ["지역명"],
+    "car": ["차종", "거래 구분"],
+    "plant": ["공장명(국가)", "차종", "거래 구분"],
+}
+
+# 지역별 예측 목록에서 제외하는 지역 (상위 지역과 중복 집계)
+EXCLUDED_REGIONS = ("서유럽", "동유럽")
+
+
+def make_series_names(df: pd.DataFrame, kind: str) -> pd.Series:
+    # 데이터셋에 없는 컬럼은 건너뜀 (예: 기아 공장별 데이터에는 거래 구분이 없음)
+    cols = [c for c in NAME_COLUMNS[kind] if c in df.columns]
+    names = df[cols[0]].astype(str)
+    for col in cols[1:]:
+        names = names + "-" + df[col].astype(str).str.zfill(2)
+    return names
+
+
+@cached_by_version
+def _series_table(kind: str, brand: str = FORECAST_BRAND) -> pd.DataFrame:
+    """이름 -> 월별 값 (행: 시계열 이름, 열: 월 Timestamp)
+
+    같은 이름이 여러 행이면 (예: 차량 유형만 다른 행) 합산한다.
+    """
+    df = load_raw(brand, kind)
+    month_cols = [c for c in df.columns if is_month_column(c)]
+    values = df[month_cols].apply(pd.to_numeric, errors="coerce")
+    values.index = make_series_names(df, kind)
+    table = values.groupby(level=0, sort=True).sum(min_count=1)
+    table.columns = pd.to_datetime(table.columns, format="%Y-%m")
+    return table
+
+
+def list_series(kind: str, brand: str = FORECAST_BRAND) -> list:
+    names = list(_series_table(kind, brand).index)
+    if kind == "region":
+        names = [n for n in names if n not in EXCLUDED_REGIONS]
+    return names
+
+
+@cached_by_version
+def _load_series(kind: str, name: str, brand: str) -> pd.DataFrame:
+    table = _series_table(kind, brand)
+    if name not in table.index:
+        raise KeyError(f"시계열을 찾을 수 없습니다: {kind} / {name}")
+    series = table.loc[name].to_frame("y")
+    series = series.asfreq("MS")
+    return series.dropna()
+
+
+def load_series(kind: str, name: str, brand: str = FORECAST_BRAND) -> pd.DataFrame:
+    """월별 시계열 (DatetimeIndex, 'y' 컬럼, 결측 제외) - 데이터 버전별로 한 번만 만들고 사본 반환"""
+    return _load_series(kind, name, brand).copy()
+
+
+def series_hash(series: pd.DataFrame) -> str:
+    """시계열 내용(날짜 + 값) 해시 - 데이터가 바뀌었는지 판단하는 데 사용"""
+    digest = hashlib.sha1()
+    digest.update(series.index.asi8.tobytes())
+    digest.update(np.ascontiguousarray(series["y"].to_numpy(dtype="float64")).tobytes())
+    return digest.hexdigest()
+
+
+def is_active_series(series: pd.DataFrame, recent_months: int = 6) -> bool:
+    """최근 N개월 값이 모두 0이면 단종/생산 중단으로 간주"""
+    return series["y"].iloc[-recent_months:].sum() > 0
+
@@ -0,0 +1,80 @@
+# modules/forecast_service.py
+# ----------------------------
+# 화면(Streamlit) 없이 쓰는 예측 공용 로직
+# - 엔진(lstm / global / 통계 엔진) × 종류 × 이름 -> 연도/월/예측값 DataFrame
+# - 모델 캐시(modules/forecast_models.py)와 예측 결과 캐시(modules/forecast_cache.py)를 그대로 사용
+# - 예측 화면(modules/prediction.py)과 HTTP API(modules/forecast_api.py)가 함께 사용
+# ----------------------------
+
+from modules.forecast_cache import cached_forecast, get_forecast_cache_stats
+from modules.forecast_classic import CLASSIC_METHODS, forecast_classic
+from modules.forecast_global import forecast_global, global_model_exists
+from modules.forecast_lstm import INTERVAL_LEVEL, INTERVAL_SAMPLES, forecast_lstm, forecast_lstm_intervals
+from modules.forecast_models import MODEL_KINDS, get_cache_stats, load_artifacts, model_exists
+from modules.forecast_series import list_series, load_series
+
+ENGINES = ("lstm", "global") + tuple(CLASSIC_METHODS)
+# 종류별 예측값 컬럼 이름 (예측 화면과 동일)
+VALUE_COLUMNS = {"region": "예측 수출량", "car": "예측 판매량", "plant": "예측 판매량"}
+MAX_FORECAST_MONTHS = 24
+
+
+class ModelNotReadyError(LookupError):
+    """선택한 엔진의 학습된 모델이 아직 없음"""
+
+
+def compute_forecast(method, kind, name, series, forecast_months, value_col, intervals=False):
+    if method in CLASSIC_METHODS:
+        return forecast_classic(kind, name, forecast_months, method=method, value_col=value_col)
+    if method == "global":
+        return forecast_global(kind, name, forecast_months, value_col=value_col, series=series)
+    lstm_model, scaler = load_artifacts(kind, name)
+    if intervals:
+        return forecast_lstm_intervals(lstm_model, series, forecast_months, scaler, samples=INTERVAL_SAMPLES,
+                                       level=INTERVAL_LEVEL, value_col=value_col)
+    return forecast_lstm(lstm_model, series, forecast_months, scaler, value_col=value_col)
+
+
+def get_forecast(engine: str, kind: str, name: str, forecast_months: int = 12, intervals: bool = False,
+                 series=None, value_col: str = None):
+    """예측 -> 연도/월/예측값 DataFrame (예측 구간은 시계열별 LSTM에서만 계산)
+
+    같은 데이터/모델/예측 기간이면 저장된 결과를 그대로 사용한다.
+
+    Raises:
+        ValueError: 알 수 없는 엔진/종류, 범위를 벗어난 예측 개월 수
+        KeyError: 없는 시계열
+        ModelNotReadyError: 학습된 모델이 없음
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"알 수 없는 예측 엔진입니다: {engine} (가능: {', '.join(ENGINES)})")
+    if kind not in VALUE_COLUMNS:
+        raise ValueError(f"알 수 없는 종류입니다: {kind} (가능: {', '.join(VALUE_COLUMNS)})")
+    forecast_months = int(forecast_months)
+    if not 1 <= forecast_months <= MAX_FORECAST_MONTHS:
+        raise ValueError(f"예측 개월 수는 1~{MAX_FORECAST_MONTHS} 사이여야 합니다: {forecast_months}")
+    series = load_series(kind, name) if series is None else series
+    value_col = value_col or VALUE_COLUMNS[kind]
+    intervals = intervals and engine == "lstm"
+    if engine == "global" and not global_model_exists():
+        raise ModelNotReadyError("글로벌 모델이 없습니다. 먼저 `python -m modules.forecast_global train`으로 학습해주세요.")
+    if engine == "lstm" and not model_exists(kind, name):
+        raise ModelNotReadyError(f"학습된 모델이 없습니다: {kind}/{name}")
+    options = {"interval_samples": INTERVAL_SAMPLES, "interval_level": INTERVAL_LEVEL} if intervals else None
+    return cached_forecast(engine, kind, name, series, forecast_months, value_col,
+                           lambda: compute_forecast(engine, kind, name, series, forecast_months, value_col, intervals),
+                           options=options)
+
+
+def model_status() -> dict:
+    """종류별 학습된 시계열 모델 수, 글로벌 모델 유무, 모델/예측 결과 캐시 현황"""
+    models = {}
+    for kind in MODEL_KINDS:
+        names = list_series(kind)
+        models[kind] = {"series": len(names), "trained": sum(model_exists(kind, name) for name in names)}
+    return {
+        "models": models,
+        "global_model": global_model_exists(),
+        "model_cache": get_cache_stats(),
+        "forecast_cache": get_forecast_cache_stats(),
+    }
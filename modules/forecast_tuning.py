@@ -0,0 +1,213 @@
+# modules/forecast_tuning.py
+# ----------------------------
+# 시계열별 LSTM 하이퍼파라미터 탐색 (CLI)
+# - 탐색 범위: 입력 윈도우 길이(time_steps) × LSTM 유닛 수 × 학습률 × 최대 epoch
+# - 마지막 VALIDATION_MONTHS개월을 검증 구간으로 떼어 학습하고, 검증 loss 기준 조기 종료
+# - (시계열, 설정) 시도를 프로세스 풀에서 병렬 실행, 결과는 models/tuning_trials.json에 캐시
+#   (데이터 해시/검증 개월 수/patience가 같은 시도는 다시 실행하지 않음)
+# - 시계열별 최적 설정(loss 임계값 조기 종료 없이 최적 epoch 수만큼 학습)을 models/lstm_{종류}_{이름}_config.json에 저장 → 이후 학습(백그라운드/사전 학습)에 사용
+# 사용 예시 (CLI):
+#   python -m modules.forecast_tuning --kinds region --workers 4 [--names 미국 인도] [--retrain]
+# ----------------------------
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from modules.forecast_jobs import train_series_model
+from modules.forecast_lstm import init_worker_threads, prepare_lstm_data, train_lstm_model
+from modules.forecast_metrics import mape, rmse
+from modules.forecast_models import MODEL_KINDS, MODELS_DIR, save_config
+from modules.forecast_series import is_active_series, list_series, load_series, series_hash
+from modules.forecast_windows import sliding_windows
+
+TRIALS_PATH = os.path.join(MODELS_DIR, "tuning_trials.json")
+
+SEARCH_SPACE = {
+    "time_steps": (6, 12, 18),
+    "units": (32, 50, 64),
+    "learning_rate": (0.001, 0.005),
+    "epochs": (300, 600),
+}
+VALIDATION_MONTHS = 12
+PATIENCE = 30
+
+
+def search_configs(space: dict = SEARCH_SPACE) -> list:
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[k] for k in keys))]
+
+
+def trial_key(kind: str, name: str, data_hash: str, config: dict, validation_months: int = VALIDATION_MONTHS,
+              patience: int = PATIENCE) -> str:
+    # 검증 점수에 영향을 주는 값은 모두 키에 포함 (검증 구간이 다르면 다른 시도)
+    return (f"{kind}/{name}/{data_hash[:12]}/val{int(validation_months)}-pat{int(patience)}/"
+            + json.dumps(config, sort_keys=True))
+
+
+def load_trials() -> dict:
+    if not os.path.exists(TRIALS_PATH):
+        return {}
+    with open(TRIALS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_trials(trials: dict):
+    os.makedirs(MODELS_DIR, exist_ok=True)
+    tmp_path = f"{TRIALS_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(trials, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, TRIALS_PATH)
+
+
+def split_validation(series, time_steps: int, validation_months: int = VALIDATION_MONTHS):
+    """(X_train, y_train, X_val, y_val, scaler) - 스케일러는 학습 구간에만 맞춰 검증 구간 정보가 새지 않게 함"""
+    train_part = series.iloc[:-validation_months]
+    X, y, scaler = prepare_lstm_data(train_part, time_steps=time_steps)
+    scaled = scaler.transform(series['y'].values.reshape(-1, 1))[:, 0]
+    windows, targets = sliding_windows(scaled, time_steps)
+    return X, y, windows[-validation_months:, :, None], targets[-validation_months:, None], scaler
+
+
+def run_trial(kind: str, name: str, config: dict, validation_months: int = VALIDATION_MONTHS,
+              patience: int = PATIENCE) -> dict:
+    """설정 하나로 학습 → 검증 구간 한 단계 앞 예측 성능 (워커 프로세스에서 실행)"""
+    series = load_series(kind, name)
+    X, y, X_val, y_val, scaler = split_validation(series, config["time_steps"], validation_months)
+    model, log = train_lstm_model(X, y, units=config["units"], epochs=config["epochs"],
+                                  learning_rate=config["learning_rate"], loss_threshold=0.0,
+                                  validation_data=(X_val, y_val), patience=patience)
+    predicted = scaler.inverse_transform(model.predict(X_val, verbose=0)).ravel()
+    actual = scaler.inverse_transform(y_val).ravel()
+    val_losses = log["val_losses"]
+    return {
+        "val_loss": float(min(val_losses)),
+        "best_epoch": int(np.argmin(val_losses)) + 1,
+        "epochs_run": log["epochs_run"],
+        "val_mape": float(mape(actual, predicted)),
+        "val_rmse": float(rmse(actual, predicted)),
+        "seconds": round(log["total_seconds"], 2),
+    }
+
+
+def tunable_series(kinds, names=None, validation_months: int = VALIDATION_MONTHS,
+                   space: dict = SEARCH_SPACE) -> list:
+    """[(종류, 이름, 시계열)] - 최근 실적이 있고 가장 긴 윈도우로도 학습/검증 구간을 만들 수 있는 시계열"""
+    min_length = max(space["time_steps"]) * 2 + validation_months
+    selected = []
+    for kind in kinds:
+        for name in list_series(kind):
+            if names and name not in names:
+                continue
+            series = load_series(kind, name)
+            if len(series) >= min_length and is_active_series(series):
+                selected.append((kind, name, series))
+    return selected
+
+
+def best_trial(results: list) -> tuple:
+    """[(설정, 결과)] 중 검증 loss가 가장 낮은 것 (같으면 유닛 수가 적은 쪽)"""
+    return min(results, key=lambda item: (item[1]["val_loss"], item[0]["units"]))
+
+
+def tune(kinds=MODEL_KINDS, names=None, space: dict = SEARCH_SPACE, workers: int = None,
+         validation_months: int = VALIDATION_MONTHS, patience: int = PATIENCE, force: bool = False,
+         retrain: bool = False, log=print) -> dict:
+    """하이퍼파라미터 탐색 후 시계열별 최적 설정 저장
+
+    Returns:
+        {"종류/이름": 최적 설정(+검증 성능)}
+    """
+    workers = workers or max(1, os.cpu_count() or 1)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    configs = search_configs(space)
+    trials = load_trials()
+    targets = tunable_series(kinds, names, validation_months, space)
+
+    pending = []
+    for kind, name, series in targets:
+        data_hash = series_hash(series)
+        for config in configs:
+            key = trial_key(kind, name, data_hash, config, validation_months, patience)
+            if force or key not in trials:
+                pending.append((key, kind, name, config))
+    log(f"대상 시계열 {len(targets)}개 × 설정 {len(configs)}개 - 실행할 시도 {len(pending)}개 "
+        f"(캐시 {len(targets) * len(configs) - len(pending)}개, 워커 {workers}개)")
+
+    start = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_worker_threads, initargs=(threads,)) as executor:
+        futures = {executor.submit(run_trial, kind, name, config, validation_months, patience):
+                   (key, kind, name)
+                   for key, kind, name, config in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            key, kind, name = futures[future]
+            try:
+                trials[key] = future.result()
+            except Exception as e:
+                log(f"[{done}/{len(pending)}] 실패 {kind}/{name}: {e}")
+                continue
+            log(f"[{done}/{len(pending)}] {kind}/{name}: val_loss {trials[key]['val_loss']:.4f}, "
+                f"MAPE {trials[key]['val_mape']:.1f}%")
+            # 중간에 중단돼도 끝난 시도는 남도록 매번 저장
+            save_trials(trials)
+
+        best_configs = {}
+        for kind, name, series in targets:
+            data_hash = series_hash(series)
+            keys = {trial_key(kind, name, data_hash, config, validation_months, patience): config
+                    for config in configs}
+            results = [(config, trials[key]) for key, config in keys.items() if key in trials]
+            if not results:
+                continue
+            config, result = best_trial(results)
+            # 전체 데이터로 다시 학습할 때는 검증 loss가 가장 낮았던 epoch 수만큼만 학습
+            # (시도와 같이 loss 임계값 조기 종료는 끔)
+            best = {**config, "epochs": result["best_epoch"], "loss_threshold": 0.0, "val_loss": result["val_loss"],
+                    "val_mape": result["val_mape"], "val_rmse": result["val_rmse"], "data_hash": data_hash,
+                    "tuned_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+            save_config(kind, name, best)
+            best_configs[f"{kind}/{name}"] = best
+            log(f"최적 설정 {kind}/{name}: time_steps {config['time_steps']}, units {config['units']}, "
+                f"lr {config['learning_rate']}, epochs {best['epochs']} (MAPE {result['val_mape']:.1f}%)")
+
+        if retrain:
+            retrain_futures = {executor.submit(train_series_model, kind, name): f"{kind}/{name}"
+                               for kind, name, _ in targets if f"{kind}/{name}" in best_configs}
+            for future in as_completed(retrain_futures):
+                try:
+                    future.result()
+                    log(f"재학습 완료 {retrain_futures[future]}")
+                except Exception as e:
+                    log(f"재학습 실패 {retrain_futures[future]}: {e}")
+
+    log(f"완료: 최적 설정 {len(best_configs)}개 저장 ({time.perf_counter() - start:.1f}초)")
+    return best_configs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시계열별 LSTM 하이퍼파라미터 탐색")
+    parser.add_argument("--kinds", nargs="+", choices=MODEL_KINDS, default=list(MODEL_KINDS))
+    parser.add_argument("--names", nargs="+", default=None, help="특정 시계열만 탐색")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 워커 수 (기본: CPU 코어 수)")
+    parser.add_argument("--validation-months", type=int, default=VALIDATION_MONTHS)
+    parser.add_argument("--patience", type=int, default=PATIENCE, help="검증 loss 조기 종료 patience")
+    parser.add_argument("--force", action="store_true", help="캐시된 시도를 무시하고 다시 실행")
+    parser.add_argument("--retrain", action="store_true", help="최적 설정으로 전체 데이터 재학습 후 models/에 저장")
+    args = parser.parse_args(argv)
+
+    tune(args.kinds, names=args.names, workers=args.workers, validation_months=args.validation_months,
+         patience=args.patience, force=args.force, retrain=args.retrain)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
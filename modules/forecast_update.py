@@ -0,0 +1,186 @@
+# modules/forecast_update.py
+# ----------------------------
+# 새 달 데이터가 추가됐을 때 저장된 LSTM 모델 증분 갱신 (CLI)
+# - 학습 이력(models/..._lineage.json)의 마지막 학습 기준월 이후에 새로 생긴 달을 감지
+# - 저장된 모델을 이어서 몇 epoch만 미세 조정 (새 달 + 직전 REPLAY_MONTHS개월 윈도우, 낮은 학습률)
+# - 새 값이 스케일러의 기존 min/max 범위 안이면 기존 스케일러 그대로 미세 조정
+#   범위를 벗어나면 과거 값의 변환까지 모두 바뀌므로 미세 조정 대신 전체 재학습 (train_series_model)
+# - 갱신 기록(이전 기준월, 새 달 수, loss)을 이력에 추가하고 사전 학습 manifest의 데이터 해시도 갱신
+# 사용 예시 (CLI):
+#   python -m modules.forecast_update --dry-run
+#   python -m modules.forecast_update --workers 4 [--kinds region] [--assume-until 2025-01]
+# ----------------------------
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import joblib
+import pandas as pd
+
+from core.lazy_import import lazy_import
+from modules.forecast_jobs import lineage_record, train_series_model
+from modules.forecast_lstm import DEFAULT_BATCH_SIZE, init_worker_threads
+from modules.forecast_models import (MODEL_KINDS, append_lineage, get_model_path, get_scaler_path, load_lineage,
+                                     model_exists, save_artifacts)
+from modules.forecast_pretrain import load_manifest, manifest_key, save_manifest
+from modules.forecast_series import list_series, load_series, series_hash
+from modules.forecast_windows import sliding_windows
+
+tf = lazy_import("tensorflow")
+
+UPDATE_EPOCHS = 20
+UPDATE_LEARNING_RATE = 1e-4
+# 새 달만으로 학습하면 이전 패턴을 잊으므로 직전 기간 윈도우도 함께 사용
+REPLAY_MONTHS = 24
+
+
+def trained_until(kind: str, name: str, assume_until: str = None):
+    """모델의 마지막 학습 기준월 (이력이 없으면 assume_until, 그것도 없으면 None)"""
+    lineage = load_lineage(kind, name)
+    if lineage:
+        return pd.Timestamp(lineage[-1]["trained_until"])
+    return pd.Timestamp(assume_until) if assume_until else None
+
+
+def plan_updates(kinds=MODEL_KINDS, assume_until: str = None) -> tuple:
+    """갱신 대상 / 건너뛸 대상 분류
+
+    Returns:
+        (todo, skipped) - todo: [(kind, name, 새 달 수)], skipped: [(kind, name, 사유)]
+    """
+    todo, skipped = [], []
+    for kind in kinds:
+        for name in list_series(kind):
+            if not model_exists(kind, name):
+                skipped.append((kind, name, "모델 없음"))
+                continue
+            until = trained_until(kind, name, assume_until)
+            if until is None:
+                skipped.append((kind, name, "학습 이력 없음"))
+                continue
+            new_months = int((load_series(kind, name).index > until).sum())
+            if new_months == 0:
+                skipped.append((kind, name, "새 데이터 없음"))
+                continue
+            todo.append((kind, name, new_months))
+    return todo, skipped
+
+
+def update_series_model(kind: str, name: str, epochs: int = UPDATE_EPOCHS, assume_until: str = None,
+                        learning_rate: float = UPDATE_LEARNING_RATE, replay_months: int = REPLAY_MONTHS) -> dict:
+    """시계열 하나의 저장된 모델을 새 달 데이터로 미세 조정 후 models/에 저장"""
+    series = load_series(kind, name)
+    until = trained_until(kind, name, assume_until)
+    if until is None:
+        raise ValueError(f"학습 이력이 없습니다: {kind}/{name} (--assume-until로 기준월 지정)")
+    new_months = int((series.index > until).sum())
+    if new_months == 0:
+        return {"data_hash": series_hash(series), "new_months": 0, "retrained": False,
+                "final_loss": None, "total_seconds": 0.0}
+
+    scaler = joblib.load(get_scaler_path(kind, name))
+    new_values = series['y'].values[-new_months:]
+    if new_values.min() < scaler.data_min_[0] or new_values.max() > scaler.data_max_[0]:
+        # 범위를 넓히면 과거 값의 변환도 모두 바뀌어 최근 윈도우만의 미세 조정으로는 맞출 수 없음
+        result = train_series_model(kind, name)
+        return {"data_hash": result["data_hash"], "new_months": new_months, "retrained": True,
+                "final_loss": result["final_loss"], "total_seconds": result["total_seconds"]}
+
+    # 앱의 모델 캐시(공유 객체)를 건드리지 않도록 디스크에서 새로 로드
+    model = tf.keras.models.load_model(get_model_path(kind, name), compile=False)
+    time_steps = model.input_shape[1]
+    scaled = scaler.transform(series['y'].values.reshape(-1, 1))[:, 0]
+    windows, targets = sliding_windows(scaled, time_steps)
+    first_window = max(0, len(series) - new_months - replay_months - time_steps)
+    X, y = windows[first_window:, :, None], targets[first_window:, None]
+
+    start = time.perf_counter()
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=learning_rate), loss='mse')
+    history = model.fit(X, y, epochs=epochs, batch_size=DEFAULT_BATCH_SIZE, verbose=0)
+    total_seconds = time.perf_counter() - start
+    final_loss = float(history.history['loss'][-1])
+
+    save_artifacts(kind, name, model, scaler, cache=False)
+    append_lineage(kind, name, lineage_record(
+        "update", series, scaler, previous_until=until.strftime("%Y-%m"), new_months=new_months,
+        epochs_run=epochs, final_loss=final_loss,
+    ))
+    return {
+        "data_hash": series_hash(series),
+        "new_months": new_months,
+        "retrained": False,
+        "final_loss": final_loss,
+        "total_seconds": total_seconds,
+    }
+
+
+def update_models(kinds=MODEL_KINDS, workers: int = None, epochs: int = UPDATE_EPOCHS,
+                  assume_until: str = None, log=print) -> dict:
+    """새 달이 생긴 모든 모델 증분 갱신
+
+    Returns:
+        {"updated": n, "failed": n, "skipped": n, "seconds": 전체 소요 시간}
+    """
+    workers = workers or max(1, os.cpu_count() or 1)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    todo, skipped = plan_updates(kinds, assume_until)
+    log(f"갱신 대상 {len(todo)}개 / 건너뜀 {len(skipped)}개 (워커 {workers}개)")
+
+    manifest = load_manifest()
+    start = time.perf_counter()
+    updated = failed = 0
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=init_worker_threads, initargs=(threads,)) as executor:
+        futures = {executor.submit(update_series_model, kind, name, epochs, assume_until): (kind, name)
+                   for kind, name, _ in todo}
+        for done, future in enumerate(as_completed(futures), start=1):
+            kind, name = futures[future]
+            key = manifest_key(kind, name)
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                log(f"[{done}/{len(todo)}] 실패 {key}: {e}")
+                continue
+            updated += 1
+            # 사전 학습이 같은 데이터를 다시 처음부터 학습하지 않도록 manifest 데이터 해시 갱신
+            if key in manifest:
+                manifest[key].update(data_hash=result["data_hash"], updated_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+                save_manifest(manifest)
+            extended = ", 스케일러 범위를 벗어나 전체 재학습" if result["retrained"] else ""
+            log(f"[{done}/{len(todo)}] 갱신 {key}: 새 달 {result['new_months']}개, loss {result['final_loss']:.4f}, "
+                f"{result['total_seconds']:.1f}초{extended}")
+
+    seconds = time.perf_counter() - start
+    log(f"완료: 갱신 {updated}개, 실패 {failed}개, 건너뜀 {len(skipped)}개 ({seconds:.1f}초)")
+    return {"updated": updated, "failed": failed, "skipped": len(skipped), "seconds": seconds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="새 달 데이터로 저장된 예측 모델 증분 갱신")
+    parser.add_argument("--kinds", nargs="+", choices=MODEL_KINDS, default=list(MODEL_KINDS))
+    parser.add_argument("--workers", type=int, default=None, help="병렬 워커 수 (기본: CPU 코어 수)")
+    parser.add_argument("--epochs", type=int, default=UPDATE_EPOCHS)
+    parser.add_argument("--assume-until", default=None,
+                        help="학습 이력이 없는 모델의 학습 기준월 (예: 2025-01)")
+    parser.add_argument("--dry-run", action="store_true", help="갱신 대상만 출력")
+    args = parser.parse_args(argv)
+
+    if args.dry_run:
+        todo, skipped = plan_updates(args.kinds, args.assume_until)
+        for kind, name, new_months in todo:
+            print(f"갱신 예정 {manifest_key(kind, name)}: 새 달 {new_months}개")
+        print(f"갱신 대상 {len(todo)}개 / 건너뜀 {len(skipped)}개")
+        return 0
+
+    summary = update_models(args.kinds, workers=args.workers, epochs=args.epochs, assume_until=args.assume_until)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
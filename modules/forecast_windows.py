@@ -0,0 +1,79 @@
+# modules/forecast_windows.py
+# ----------------------------
+# LSTM 학습 윈도우 공용 유틸
+# - sliding_window_view로 (윈도우 수, time_steps) 입력을 복사 없이 만드는 읽기 전용 뷰
+# - 여러 시계열의 윈도우를 하나의 학습 텐서로 쌓기 (윈도우별 시계열 번호 포함)
+# - 시계열 하나의 정규화(MinMaxScaler) + 윈도우를 (시계열 해시, time_steps)별로 캐시 (LRU, 모든 세션 공유)
+# ----------------------------
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from core.lazy_import import lazy_import
+from modules.forecast_series import series_hash
+
+sk_preprocessing = lazy_import("sklearn.preprocessing")
+
+MAX_WINDOW_ENTRIES = 1024
+
+_lock = threading.Lock()
+_entries = OrderedDict()   # (시계열 해시, time_steps) -> {"scaler", "scaled", "X", "y"}
+
+
+def sliding_windows(values, time_steps: int):
+    """1차원 값 -> (입력 윈도우 (N, time_steps), 타깃 (N,)), N = len(values) - time_steps
+
+    윈도우 i는 values[i:i + time_steps], 타깃은 바로 다음 값 values[i + time_steps] (복사 없는 읽기 전용 뷰).
+    """
+    values = np.asarray(values)
+    if len(values) <= time_steps:
+        return np.empty((0, time_steps), dtype=values.dtype), values[:0]
+    return np.lib.stride_tricks.sliding_window_view(values[:-1], time_steps), values[time_steps:]
+
+
+def stack_windows(series_values, time_steps: int):
+    """여러 시계열(각각 정규화된 1차원 배열)의 윈도우를 하나의 학습 텐서로
+
+    Returns:
+        (X (N, time_steps, 1), y (N, 1), 시계열 번호 (N,)) - 시계열 번호는 series_values의 위치
+    """
+    parts = [sliding_windows(values, time_steps) for values in series_values]
+    X = np.concatenate([windows for windows, _ in parts])[:, :, None]
+    y = np.concatenate([targets for _, targets in parts])[:, None]
+    series_id = np.repeat(np.arange(len(parts), dtype="int32"), [len(targets) for _, targets in parts])
+    return X, y, series_id
+
+
+def series_windows(series, time_steps: int) -> dict:
+    """시계열 하나('y' 컬럼)의 정규화 + 학습 윈도우 - 같은 데이터/길이면 다시 계산하지 않음
+
+    Returns:
+        {"scaler": 시계열 전체에 맞춘 MinMaxScaler, "scaled": (길이,) 정규화 값,
+         "X": (N, time_steps, 1), "y": (N, 1)} - 공유 객체이므로 수정하지 말 것
+    """
+    key = (series_hash(series), int(time_steps))
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            return entry
+
+    values = series['y'].to_numpy(dtype="float64").reshape(-1, 1)
+    scaler = sk_preprocessing.MinMaxScaler().fit(values)
+    # scaler.transform과 같은 계산 (입력 검증 오버헤드 없이)
+    scaled = values[:, 0] * scaler.scale_[0] + scaler.min_[0]
+    scaled.flags.writeable = False
+    X, y = sliding_windows(scaled, time_steps)
+    entry = {"scaler": scaler, "scaled": scaled, "X": X[:, :, None], "y": y[:, None]}
+    with _lock:
+        _entries[key] = entry
+        while len(_entries) > MAX_WINDOW_ENTRIES:
+            _entries.popitem(last=False)
+    return entry
+
+
+def clear_window_cache():
+    with _lock:
+        _entries.clear()
@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import altair as alt
+from modules.data_cube import get_cube
+from modules.data_registry import cached_by_version
 
 #                       ---------
 #                      | 재고 관리 |
@@ -12,55 +14,32 @@ import altair as alt
 # 1. 데이터 전처리 함수로 분리
 #    예시: 생산/판매 데이터를 불러오고 처리하는 부분
 def load_inventory_data():
-    # 생산 데이터
-    hyundai_prod = pd.read_csv("data/processed/hyundai-by-plant.csv")
-    kia_prod = pd.read_csv("data/processed/kia-by-plant.csv")
-    hyundai_prod["브랜드"] = "현대"
-    kia_prod["브랜드"] = "기아"
-    prod_df = pd.concat([hyundai_prod, kia_prod], ignore_index=True)
-
-    # 판매 데이터
-    hyundai_sales = pd.read_csv("data/processed/hyundai-by-car.csv")
-    kia_sales = pd.read_csv("data/processed/kia-by-car.csv")
-    hyundai_sales["브랜드"] = "현대"
-    kia_sales["브랜드"] = "기아"
-    sales_df = pd.concat([hyundai_sales, kia_sales], ignore_index=True)
-
-    return prod_df, sales_df
+    # 브랜드/차종/연도별 생산·판매 합계 (사전 집계 큐브, 읽기 전용)
+    cube = get_cube()
+    prod_sum = cube.total("plant", by=["브랜드", "차종", "연도"])
+    sales_sum = cube.total("car", by=["브랜드", "차종", "연도"])
+    return prod_sum, sales_sum
 # -----------------------------------
 
 # 2. 재고 계산 함수
-def calculate_inventory(prod_df, sales_df):
-    month_cols_prod = [col for col in prod_df.columns if "-" in col and col[:4].isdigit()]
-    prod_df[month_cols_prod] = prod_df[month_cols_prod].apply(pd.to_numeric, errors='coerce')
-    prod_long = prod_df.melt(
-        id_vars=[col for col in prod_df.columns if col not in month_cols_prod],
-        var_name="연월",
-        value_name="생산량"
-    )
-    prod_long["연도"] = prod_long["연월"].str[:4].astype(int)
-    prod_sum = prod_long.groupby(["브랜드", "차종", "연도"])["생산량"].sum().reset_index()
-    prod_sum["누적생산"] = prod_sum["생산량"]
-
-    month_cols_sales = [col for col in sales_df.columns if "-" in col and col[:4].isdigit()]
-    sales_df[month_cols_sales] = sales_df[month_cols_sales].apply(pd.to_numeric, errors='coerce')
-    sales_long = sales_df.melt(
-        id_vars=[col for col in sales_df.columns if col not in month_cols_sales],
-        var_name="연월",
-        value_name="판매량"
-    )
-    sales_long["연도"] = sales_long["연월"].str[:4].astype(int)
-    sales_sum = sales_long.groupby(["브랜드", "차종", "연도"])["판매량"].sum().reset_index()
-    sales_sum["누적판매"] = sales_sum["판매량"]
+def calculate_inventory(prod_sum, sales_sum):
+    prod_sum = prod_sum.reset_index(name="누적생산")
+    sales_sum = sales_sum.reset_index(name="누적판매")
 
     inventory_df = pd.merge(
-        prod_sum[["브랜드", "차종", "연도", "누적생산"]],
-        sales_sum[["브랜드", "차종", "연도", "누적판매"]],
+        prod_sum,
+        sales_sum,
         on=["브랜드", "차종", "연도"],
         how="outer"
     ).fillna(0)
     inventory_df["재고변동"] = inventory_df["누적생산"] - inventory_df["누적판매"]
     return inventory_df
+
+# 데이터 버전별로 한 번만 계산해 세션 간 공유
+@cached_by_version
+def get_inventory_df():
+    prod_sum, sales_sum = load_inventory_data()
+    return calculate_inventory(prod_sum, sales_sum)
 # -----------------------------------
 
 # 3. KPI 계산 함수
@@ -105,8 +84,7 @@ def draw_inventory_distribution_chart(filtered_df):
 # -----------------------------------
 
 def inventory_ui():
-    prod_df, sales_df = load_inventory_data()
-    inventory_df = calculate_inventory(prod_df, sales_df)
+    inventory_df = get_inventory_df()
 
   
     # KPI + 필터 전체를 하나의 카드 스타일 박스로 감싸기
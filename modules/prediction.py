@@ -1,26 +1,19 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-from sklearn.preprocessing import MinMaxScaler
-import tensorflow as tf
-from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras.optimizers import Adam
-from tensorflow.keras.layers import Input, Dense, LSTM
 import matplotlib.pyplot as plt
 from matplotlib import font_manager, rc
 import platform
 import os
-import joblib
-from sklearn.metrics import r2_score
-import matplotlib.dates as mdates
-import io
-import joblib
-import matplotlib.pyplot as plt
-import time
-from matplotlib import font_manager, rc
-import matplotlib.pyplot as plt
-import os
-import platform
+from modules.data_registry import load_raw
+from modules.forecast_jobs import get_job, submit_training_job
+from modules.forecast_cache import get_forecast_cache_stats, invalidate_forecasts
+from modules.forecast_classic import CLASSIC_METHODS
+from modules.forecast_hierarchy import RECONCILIATION_METHODS, coherence_gap, forecast_hierarchy
+from modules.forecast_lstm import INTERVAL_COLUMNS, INTERVAL_LEVEL
+from modules.forecast_models import get_cache_stats
+from modules.forecast_plots import forecast_figure, forecast_png, get_plot_cache_stats, save_png
+from modules.forecast_series import load_series
+from modules.forecast_service import ModelNotReadyError, get_forecast
 
 
 # 한글 폰트 설정 함수
@@ -45,142 +38,99 @@ def set_korean_font():
         st.warning(f"폰트 설정 중 오류 발생: {e}")
     plt.rcParams["axes.unicode_minus"] = False
 
-# 호출
-set_korean_font()
+_font_ready = False
+
+def ensure_korean_font():
+    # 폰트 설정은 예측 화면이 처음 열릴 때 한 번만 수행
+    global _font_ready
+    if not _font_ready:
+        set_korean_font()
+        _font_ready = True
+
+
+def render_training_job(kind, name):
+    # 저장된 모델이 없으면 백그라운드 학습 작업을 제출하고 진행 상황만 주기적으로 갱신 (화면은 막히지 않음)
+    job_id = submit_training_job(kind, name)
+    st.info(f"저장된 모델이 없어 백그라운드 학습을 시작했습니다. (작업 ID: {job_id}) 학습이 끝나면 예측 버튼을 다시 눌러주세요.")
+
+    @st.fragment(run_every=2)
+    def job_status():
+        job = get_job(job_id)
+        if job is None:
+            st.warning("작업 정보를 찾을 수 없습니다.")
+        elif job["status"] == "failed":
+            st.error(f"모델 학습 실패: {job['error']}")
+        elif job["status"] == "done":
+            result = job["result"]
+            st.success(f"학습 완료: {result['epochs_run']} epoch, {result['total_seconds']:.1f}초 - 예측 버튼을 다시 눌러주세요.")
+        else:
+            st.progress(job["progress"])
+            if job["status"] == "queued":
+                st.caption("다른 학습 작업이 끝나기를 기다리는 중입니다...")
+            else:
+                loss = f"{job['loss']:.4f}" if job["loss"] is not None else "-"
+                st.caption(f"Epoch {job['epoch']}/{job['epochs']} - loss: {loss}")
+
+    job_status()
+
+
+# 예측 엔진 선택지: 표시 이름 -> 엔진 키 (통계 모델은 학습/TensorFlow 없이 바로 예측)
+LSTM_ENGINE = "LSTM (시계열별)"
+GLOBAL_ENGINE = "LSTM (글로벌)"
+FORECAST_ENGINES = {LSTM_ENGINE: "lstm", GLOBAL_ENGINE: "global"}
+FORECAST_ENGINES.update({label: method for method, label in CLASSIC_METHODS.items()})
+
+
+def run_forecast(engine, kind, name, series, forecast_months, value_col, intervals=False):
+    # 선택한 엔진으로 예측 -> 연도/월/예측값 DataFrame (모델이 아직 없으면 None)
+    # 예측/캐시 로직은 HTTP API와 공유 (modules/forecast_service.py)
+    method = FORECAST_ENGINES[engine]
+    try:
+        return get_forecast(method, kind, name, forecast_months, intervals, series=series, value_col=value_col)
+    except ModelNotReadyError as e:
+        if method == "lstm":
+            render_training_job(kind, name)
+        else:
+            st.warning(str(e))
+        return None
+
+
+def show_forecast_chart(series, forecast_df, name, value_col, quantity, engine_label, engine_tag, save_filename):
+    # 화면: 인터랙티브 차트 / 다운로드·저장: 예측 내용별로 한 번만 그린 PNG (modules/forecast_plots.py)
+    title = f"{name} {engine_label} 기반 {quantity} 예측"
+    labels = (value_col, title, f"실제 {quantity}", quantity, engine_label)
+    st.plotly_chart(forecast_figure(series, forecast_df, *labels), use_container_width=True)
+    png = forecast_png(series, forecast_df, *labels)
+    st.download_button(
+        label="예측 그래프 이미지 다운로드",
+        data=png,
+        file_name=f"{name}_{engine_tag}_예측.png",
+        mime="image/png"
+    )
+    if st.session_state.get("save_forecast_png"):
+        st.caption(f"그래프 저장: {save_png(png, save_filename)}")
 
 
 def send_predictions_to_recommendations(predictions):
     st.session_state.predictions = predictions
 
 def prediction_ui():
+    ensure_korean_font()
     st.title("AI 판매 예측 시스템")
-    tab1, tab2, tab3 = st.tabs(["지역별 수출량 예측", "차종별 판매량 예측", "공장별 판매량 예측"])
+    engine = st.selectbox("예측 엔진", list(FORECAST_ENGINES), key="forecast_engine")
+    engine_label = engine.split(" (")[0]
+    # 다운로드/저장 파일 이름용 엔진 키 (엔진별 결과가 서로 덮어쓰지 않도록)
+    engine_tag = FORECAST_ENGINES[engine]
+    show_intervals = st.checkbox(f"{INTERVAL_LEVEL:.0%} 예측 구간 표시", value=True, key="forecast_intervals",
+                                 disabled=engine != LSTM_ENGINE,
+                                 help="시계열별 LSTM 모델의 한 단계 앞 오차를 재표집해 계산합니다.")
+    st.checkbox("예측 그래프를 images/result/에도 저장", value=False, key="save_forecast_png")
+    tab1, tab2, tab3, tab4 = st.tabs(["지역별 수출량 예측", "차종별 판매량 예측", "공장별 판매량 예측", "전체 계층 예측"])
 
 
     with tab1:
         # 1. 지역별 예측 시스템
-        # 1-1. 데이터 준비 함수
-        def prepare_lstm_data(series, time_steps=12):
-            values = series['y'].values.reshape(-1, 1)
-            scaler = MinMaxScaler()
-            scaled = scaler.fit_transform(values)
-            X, y = [], []
-            for i in range(time_steps, len(scaled)):
-                X.append(scaled[i-time_steps:i])
-                y.append(scaled[i])
-            return np.array(X), np.array(y), scaler
-
-        # 1-2. 모델 정의 및 학습
-        def train_lstm_model(X, y, units=50, epochs=600, batch_size=16, region_name=None):
-            input_shape = (X.shape[1], X.shape[2])
-            model = Sequential([
-                Input(shape=input_shape),
-                LSTM(units=units, activation='relu'),
-                Dense(1)
-            ])
-            model.compile(optimizer='adam', loss='mse')
-            
-            # 조기 종료를 위한 콜백 클래스 정의
-            class EarlyStoppingByLoss(tf.keras.callbacks.Callback):
-                def __init__(self, region_name):
-                    super(EarlyStoppingByLoss, self).__init__()
-                    self.region_name = region_name
-                    
-                def on_epoch_end(self, epoch, logs=None):
-                    current_loss = logs.get('loss')
-                    if current_loss is not None and current_loss <= 0.01:
-                        print(f"\n조기 종료: epoch {epoch+1}에서 loss가 0.01 이하({current_loss:.4f})로 떨어짐")
-                        # 모델 저장
-                        model_path = get_model_path(self.region_name)
-                        scaler_path = get_scaler_path(self.region_name)
-                        self.model.save(model_path)
-                        print(f"모델이 {model_path}에 저장되었습니다.")
-                        self.model.stop_training = True
-            
-            # 콜백 인스턴스 생성
-            early_stopping = EarlyStoppingByLoss(region_name)
-            
-            history = model.fit(
-                X, y, 
-                epochs=epochs, 
-                batch_size=batch_size, 
-                verbose=1,
-                callbacks=[early_stopping]
-            )
-            losses = []
-            
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            loss_chart = st.empty()
-
-
-            for epoch in range(epochs):
-                history = model.fit(X, y, epochs=1, batch_size=batch_size, verbose=0)
-                loss = history.history['loss'][0]
-                losses.append(loss)
-                
-                if epoch % 10 == 0 or epoch == epochs - 1:
-                    progress = (epoch + 1) / epochs
-                    progress_bar.progress(progress)
-                    status_text.text(f"Epoch {epoch+1}/{epochs} - loss: {loss:.4f}")
-    
-                time.sleep(0.1)  # 애니메이션 효과를 위한 짧은 대기 시간
-
-            return model
-  
-
-
-        # 1-3. 미래 예측
-        def forecast_lstm(model, series, forecast_months, scaler, time_steps=12):
-            data = scaler.transform(series['y'].values.reshape(-1, 1))
-            last_sequence = data[-time_steps:]
-
-            predictions = []
-            for _ in range(forecast_months):
-                input_seq = last_sequence.reshape(1, time_steps, 1)
-                pred = model.predict(input_seq, verbose=0)
-                predictions.append(pred[0, 0])
-                last_sequence = np.append(last_sequence[1:], pred, axis=0)
-
-            forecast_scaled = np.array(predictions).reshape(-1, 1)
-            forecast_values = scaler.inverse_transform(forecast_scaled)
-
-            last_date = series.index[-1]
-            future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), periods=forecast_months, freq='MS')
-
-            result = pd.DataFrame({
-                '연도': future_dates.year,
-                '월': future_dates.month,
-                '예측 수출량': forecast_values.flatten()
-            })
-            return result
-
         # 1-4. 시각화 함수
-        def plot_lstm_forecast(series, forecast_df, region_name, forecast_months):
-            forecast_index = pd.to_datetime(forecast_df['연도'].astype(str) + '-' + forecast_df['월'].astype(str))
-            forecast_values = forecast_df['예측 수출량'].values
-
-            fig1, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(series.index, series['y'], label='실제 수출량', color='black')
-            ax.plot(forecast_index, forecast_values, label='LSTM 예측', color='red', linestyle='--')
-            ax.axvline(x=series.index[-1], color='gray', linestyle=':', label='예측 시작점')
-            ax.set_title(f"{region_name} LSTM 기반 수출량 예측")
-            ax.set_xlabel("날짜")
-            ax.set_ylabel("수출량")
-            ax.legend()
-            ax.grid(True)
-            fig1.tight_layout()
-
-            st.pyplot(fig1)
-            plt.close(fig1)
-
-            # 저장 경로 생성
-            save_path = f"images/result/{region_name} LSTM 지역별 수출량 예측.png"
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            fig1.savefig(save_path, dpi=300)
-
-            return save_path
-
         def add_download_button(forecast_df, region_name, filename="lstm_forecast.csv"):
             csv = forecast_df.to_csv(index=False).encode('utf-8-sig')
             st.download_button(
@@ -195,50 +145,27 @@ def prediction_ui():
             forecast_df['연도'] = forecast_df['연도'].astype(int)
             forecast_df['월'] = forecast_df['월'].astype(int)
             forecast_df['예측 수출량'] = forecast_df['예측 수출량'].round()
+            for col in INTERVAL_COLUMNS:
+                if col in forecast_df:
+                    forecast_df[col] = forecast_df[col].round()
 
             # 증감률(%) 계산 및 포맷 처리
             pct_change = forecast_df['예측 수출량'].pct_change() * 100
             pct_change = pct_change.round(2)
             forecast_df['전월 대비 증감률(%)'] = pct_change.apply(lambda x: f"{x:.2f}" if pd.notnull(x) else '-')
             
-            st.subheader("예측 결과 표 (LSTM 기반)")
+            st.subheader(f"예측 결과 표 ({engine} 기반)")
             col1, col2 = st.columns([1, 0.9])
             with col1:
                 st.dataframe(forecast_df, use_container_width=True, hide_index=True)
-                filename = "LSTM_수출예측.csv"
+                filename = f"{engine_tag}_수출예측.csv"
                 add_download_button(forecast_df, region_name, filename)
             with col2:
-                img_path = plot_lstm_forecast(region_data, lstm_forecast, region_name, forecast_months)
-                if os.path.exists(img_path):
-                    with open(img_path, "rb") as img_file:
-                        st.download_button(
-                            label="예측 그래프 이미지 다운로드",
-                            data=img_file,
-                            file_name=f"{region_name}_LSTM_예측.png",
-                            mime="image/png"
-                        )
-
-        # 모델 및 스케일러 경로 함수
-        def get_model_path(region_name):
-            return f"models/lstm_region_{region_name}_model.h5"
-
-        def get_scaler_path(region_name):
-            return f"models/lstm_region_{region_name}_scaler.pkl"
-
-        def ensure_model(region_name):
-            model_path = get_model_path(region_name)
-            scaler_path = get_scaler_path(region_name)
-
-            if os.path.exists(model_path) and os.path.exists(scaler_path):
-                print(f"저장된 모델과 스케일러가 존재합니다: {model_path}")
-                return True
-            else:
-                print(f"모델 또는 스케일러가 존재하지 않아 새로 학습합니다.")
-                return False
+                show_forecast_chart(region_data, lstm_forecast, region_name, '예측 수출량', '수출량', engine_label,
+                                    engine_tag, f"{region_name} {engine_tag} 지역별 수출량 예측.png")
 
         # 1. 지역별 수출량 예측
-        file_path = "data/processed/hyundai-by-region.csv"  # 현대만 할 거니까~
-        df = pd.read_csv(file_path)
+        df = load_raw("현대", "region")  # 현대만 할 거니까~
 
         with st.expander("원본 데이터 확인") :
             st.dataframe(df)
@@ -258,155 +185,15 @@ def prediction_ui():
             if region_name == "선택하세요":
                 st.error("지역명을 선택해주세요.")
             else:
-                region_data = df[df['지역명'] == region_name].iloc[:, 1:].T
-                region_data.columns = ['y']
-                region_data.index = pd.to_datetime(region_data.index, format='%Y-%m', errors='coerce')
-                region_data = region_data.asfreq('MS')
-                region_data['y'] = pd.to_numeric(region_data['y'], errors='coerce')
-                region_data = region_data.dropna()
-
-                status = ensure_model(region_name)
-
-                if status:
-                    lstm_model = load_model(get_model_path(region_name), compile=False)
-                    scaler = joblib.load(get_scaler_path(region_name))
-                else:
-                    st.info("모델생성을 새로 시작중입니다. 모델생성이 1분 이상 소요될 수 있습니다")
-                    with st.spinner("모델을 학습 중입니다... 잠시만 기다려주세요."):
-                        X, y, scaler = prepare_lstm_data(region_data)
-                        lstm_model = train_lstm_model(X, y, region_name=region_name)
-                        joblib.dump(scaler, get_scaler_path(region_name))
-                        # 모델이 조기 종료되지 않은 경우에만 여기서 저장
-                        if not os.path.exists(get_model_path(region_name)):
-                            lstm_model.save(get_model_path(region_name))
-
-                lstm_forecast = forecast_lstm(lstm_model, region_data, forecast_months, scaler)
-                send_predictions_to_recommendations({"type": "region","name": region_name,"forecast": lstm_forecast.to_dict()})
-                # plot_lstm_forecast(region_data, lstm_forecast, region_name, forecast_months)
-                display_lstm_forecast_table(lstm_forecast, region_name)
+                region_data = load_series("region", region_name)
+
+                lstm_forecast = run_forecast(engine, "region", region_name, region_data, forecast_months, '예측 수출량', show_intervals)
+                if lstm_forecast is not None:
+                    send_predictions_to_recommendations({"type": "region","name": region_name,"forecast": lstm_forecast.to_dict()})
+                    display_lstm_forecast_table(lstm_forecast, region_name)
     with tab2:
         # 2. 차종별 판매량 예측
-        def prepare_lstm_data(series, time_steps=12):
-            values = series['y'].values.reshape(-1, 1)
-            scaler = MinMaxScaler()
-            scaled = scaler.fit_transform(values)
-
-            X, y = [], []
-            for i in range(time_steps, len(scaled)):
-                X.append(scaled[i-time_steps:i])
-                y.append(scaled[i])
-            X, y = np.array(X), np.array(y)
-            return X, y, scaler
-
-        # 2. 모델 정의 및 학습
-        def train_lstm_model(X, y, units=50, epochs=600, batch_size=16, car_name=None):
-            input_shape = (X.shape[1], X.shape[2])
-            model = Sequential([
-                Input(shape=input_shape),
-                LSTM(units=units, activation='relu'),
-                Dense(1)
-            ])
-            model.compile(optimizer='adam', loss='mse')
-            
-            # 조기 종료를 위한 콜백 클래스 정의
-            class EarlyStoppingByLoss(tf.keras.callbacks.Callback):
-                def __init__(self, car_name):
-                    super(EarlyStoppingByLoss, self).__init__()
-                    self.car_name = car_name
-                    
-                def on_epoch_end(self, epoch, logs=None):
-                    current_loss = logs.get('loss')
-                    if current_loss is not None and current_loss <= 0.01:
-                        print(f"\n조기 종료: epoch {epoch+1}에서 loss가 0.01 이하({current_loss:.4f})로 떨어짐")
-                        # 모델 저장
-                        model_path = get_model_path(self.car_name)
-                        scaler_path = get_scaler_path(self.car_name)
-                        self.model.save(model_path)
-                        print(f"모델이 {model_path}에 저장되었습니다.")
-                        self.model.stop_training = True
-            
-            # 콜백 인스턴스 생성
-            early_stopping = EarlyStoppingByLoss(car_name)
-            
-            history = model.fit(
-                X, y, 
-                epochs=epochs, 
-                batch_size=batch_size, 
-                verbose=1,
-                callbacks=[early_stopping]
-            )
-            losses = []
-            
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            loss_chart = st.empty()
-
-
-            for epoch in range(epochs):
-                history = model.fit(X, y, epochs=1, batch_size=batch_size, verbose=0)
-                loss = history.history['loss'][0]
-                losses.append(loss)
-                
-                if epoch % 10 == 0 or epoch == epochs - 1:
-                    progress = (epoch + 1) / epochs
-                    progress_bar.progress(progress)
-                    status_text.text(f"Epoch {epoch+1}/{epochs} - loss: {loss:.4f}")
-    
-                time.sleep(0.1)  # 애니메이션 효과를 위한 짧은 대기 시간
-
-            return model
-
-        # 3. 미래 예측
-        def forecast_lstm(model, series, forecast_months, scaler, time_steps=12):
-            data = scaler.transform(series['y'].values.reshape(-1, 1))
-            last_sequence = data[-time_steps:]
-
-            predictions = []
-            for _ in range(forecast_months):
-                input_seq = last_sequence.reshape(1, time_steps, 1)
-                pred = model.predict(input_seq, verbose=0)
-                predictions.append(pred[0, 0])
-                last_sequence = np.append(last_sequence[1:], pred, axis=0)
-
-            forecast_scaled = np.array(predictions).reshape(-1, 1)
-            forecast_values = scaler.inverse_transform(forecast_scaled)
-
-            last_date = series.index[-1]
-            future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), periods=forecast_months, freq='MS')
-
-            result = pd.DataFrame({
-                '연도': future_dates.year,
-                '월': future_dates.month,
-                '예측 판매량': forecast_values.flatten()
-            })
-            return result
-
         # 4. 시각화 함수
-        def plot_lstm_forecast(series, forecast_df, car_name, forecast_months, save_path=None):
-            forecast_index = pd.to_datetime(forecast_df['연도'].astype(str) + '-' + forecast_df['월'].astype(str))
-            forecast_values = forecast_df['예측 판매량'].values
-
-            fig2, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(series.index, series['y'], label='실제 판매량', color='black')
-            ax.plot(forecast_index, forecast_values, label='LSTM 예측', color='red', linestyle='--')
-            ax.axvline(x=series.index[-1], color='gray', linestyle=':', label='예측 시작점')
-            ax.set_title(f"{car_name} LSTM 기반 판매량 예측")
-            ax.set_xlabel("날짜")
-            ax.set_ylabel("판매량")
-            ax.legend()
-            ax.grid(True)
-            fig2.tight_layout()
-
-            st.pyplot(fig2)
-            plt.close(fig2)
-
-            # 저장 경로 생성
-            save_path = f"images/result/{car_name} LSTM 지역별 수출량 예측.png"
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            fig2.savefig(save_path, dpi=300)
-
-            return save_path
-
         def add_download_button(forecast_df, car_name, filename="lstm_forecast.csv"):
             csv = forecast_df.to_csv(index=False).encode('utf-8-sig')
             st.download_button(
@@ -421,32 +208,27 @@ def prediction_ui():
             forecast_df['연도'] = forecast_df['연도'].astype(int)
             forecast_df['월'] = forecast_df['월'].astype(int)
             forecast_df['예측 판매량'] = forecast_df['예측 판매량'].round()
+            for col in INTERVAL_COLUMNS:
+                if col in forecast_df:
+                    forecast_df[col] = forecast_df[col].round()
 
             # 증감률(%) 계산 및 포맷 처리
             pct_change = forecast_df['예측 판매량'].pct_change() * 100
             pct_change = pct_change.round(2)
             forecast_df['전월 대비 증감률(%)'] = pct_change.apply(lambda x: f"{x:.2f}" if pd.notnull(x) else '-')
             
-            st.subheader("예측 결과 표 (LSTM 기반)")
+            st.subheader(f"예측 결과 표 ({engine} 기반)")
             col1, col2 = st.columns([1, 0.9])
             with col1:
                 st.dataframe(forecast_df, use_container_width=True, hide_index=True)
-                filename = "LSTM_판매예측.csv"
+                filename = f"{engine_tag}_판매예측.csv"
                 add_download_button(forecast_df, car_name, filename)
             with col2:
-                img_path = plot_lstm_forecast(car_data, lstm_forecast, car_name, forecast_months)
-                if os.path.exists(img_path):
-                    with open(img_path, "rb") as img_file:
-                        st.download_button(
-                            label="예측 그래프 이미지 다운로드",
-                            data=img_file,
-                            file_name=f"{car_name}_LSTM_예측.png",
-                            mime="image/png"
-                        )
+                show_forecast_chart(car_data, lstm_forecast, car_name, '예측 판매량', '판매량', engine_label,
+                                    engine_tag, f"{car_name} {engine_tag} 차종별 판매량 예측.png")
 
         # 5. 실행 예시
-        file_path = "data/processed/hyundai-by-car.csv"
-        df = pd.read_csv(file_path)
+        df = load_raw("현대", "car").copy()
 
         with st.expander("원본 데이터 확인") :
             st.dataframe(df)
@@ -472,31 +254,7 @@ def prediction_ui():
             if "선택하세요" in car_name :
                 st.error("차종과 거래 구분을 선택해주세요.")
             else:   
-                car_data = df[df['차종'] == car_name].iloc[:, 1:].T
-                car_data.columns = ['y']
-                car_data.index = pd.to_datetime(car_data.index)
-                car_data = car_data.asfreq('MS')
-                car_data['y'] = pd.to_numeric(car_data['y'], errors='coerce')
-                car_data = car_data.dropna()
-
-                def get_model_path(car_name):
-                    return f"models/lstm_car_{car_name}_model.h5"
-
-                def get_scaler_path(car_name):
-                    return f"models/lstm_car_{car_name}_scaler.pkl"
-
-                def ensure_model(car_name):
-                    model_path = get_model_path(car_name)
-                    scaler_path = get_scaler_path(car_name)
-
-                    if os.path.exists(model_path) and os.path.exists(scaler_path):
-                        print(f"저장된 모델과 스케일러가 존재합니다: {model_path}")
-                        return True
-                    else:
-                        print(f" 모델 또는 스케일러가 존재하지 않아 새로 학습합니다.")
-                        return False
-
-                status = ensure_model(car_name)
+                car_data = load_series("car", car_name)
 
                 # ✅ 특정 기간 값이 모두 0인지 확인
                 zero_check_range = car_data.loc["2024-09":"2025-02", "y"]
@@ -504,147 +262,13 @@ def prediction_ui():
                     st.error(" 이 차는 더 이상 생산하지 않습니다.")
                     st.stop
                 else :
-                    if status:
-                        lstm_model = load_model(get_model_path(car_name), compile=False)
-                        scaler = joblib.load(get_scaler_path(car_name))
-                    else:
-                        st.info("모델생성을 새로 시작중입니다. 모델생성이 1분 이상 소요될 수 있습니다")
-                        with st.spinner("모델을 학습 중입니다... 잠시만 기다려주세요."):
-                            X, y, scaler = prepare_lstm_data(car_data)
-                            lstm_model = train_lstm_model(X, y, car_name=car_name)
-                            joblib.dump(scaler, get_scaler_path(car_name))
-                            # 모델이 조기 종료되지 않은 경우에만 여기서 저장
-                            if not os.path.exists(get_model_path(car_name)):
-                                lstm_model.save(get_model_path(car_name))
-
-                    lstm_forecast = forecast_lstm(lstm_model, car_data, forecast_months, scaler)
-                    send_predictions_to_recommendations({ "type": "car","name": car_name,"forecast": lstm_forecast.to_dict()})
-                    # plot_lstm_forecast(car_data, lstm_forecast, car_name, forecast_months)
-                    display_lstm_forecast_table(lstm_forecast, car_name)
+                    lstm_forecast = run_forecast(engine, "car", car_name, car_data, forecast_months, '예측 판매량', show_intervals)
+                    if lstm_forecast is not None:
+                        send_predictions_to_recommendations({ "type": "car","name": car_name,"forecast": lstm_forecast.to_dict()})
+                        display_lstm_forecast_table(lstm_forecast, car_name)
     with tab3:
         # 공장별 판매량 예측
-        # 1. 데이터 준비 함수
-        def prepare_lstm_data(series, time_steps=12):
-            values = series['y'].values.reshape(-1, 1)
-            scaler = MinMaxScaler()
-            scaled = scaler.fit_transform(values)
-
-            X, y = [], []
-            for i in range(time_steps, len(scaled)):
-                X.append(scaled[i-time_steps:i])
-                y.append(scaled[i])
-            X, y = np.array(X), np.array(y)
-            return X, y, scaler
-
-        # 2. 모델 정의 및 학습
-        def train_lstm_model(X, y, units=50, epochs=600, batch_size=16, plant_name=None):
-            input_shape = (X.shape[1], X.shape[2])
-            model = Sequential([
-                Input(shape=input_shape),
-                LSTM(units=units, activation='relu'),
-                Dense(1)
-            ])
-            model.compile(optimizer='adam', loss='mse')
-            
-            # 조기 종료를 위한 콜백 클래스 정의
-            class EarlyStoppingByLoss(tf.keras.callbacks.Callback):
-                def __init__(self, plant_name):
-                    super(EarlyStoppingByLoss, self).__init__()
-                    self.plant_name = plant_name
-                    
-                def on_epoch_end(self, epoch, logs=None):
-                    current_loss = logs.get('loss')
-                    if current_loss is not None and current_loss <= 0.01:
-                        print(f"\n조기 종료: epoch {epoch+1}에서 loss가 0.01 이하({current_loss:.4f})로 떨어짐")
-                        # 모델 저장
-                        model_path = get_model_path(self.plant_name)
-                        scaler_path = get_scaler_path(self.plant_name)
-                        self.model.save(model_path)
-                        print(f"모델이 {model_path}에 저장되었습니다.")
-                        self.model.stop_training = True
-            
-            # 콜백 인스턴스 생성
-            early_stopping = EarlyStoppingByLoss(plant_name)
-            
-            history = model.fit(
-                X, y, 
-                epochs=epochs, 
-                batch_size=batch_size, 
-                verbose=1,
-                callbacks=[early_stopping]
-            )
-            losses = []
-            
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            loss_chart = st.empty()
-
-
-            for epoch in range(epochs):
-                history = model.fit(X, y, epochs=1, batch_size=batch_size, verbose=0)
-                loss = history.history['loss'][0]
-                losses.append(loss)
-                
-                if epoch % 10 == 0 or epoch == epochs - 1:
-                    progress = (epoch + 1) / epochs
-                    progress_bar.progress(progress)
-                    status_text.text(f"Epoch {epoch+1}/{epochs} - loss: {loss:.4f}")
-    
-                time.sleep(0.1)  # 애니메이션 효과를 위한 짧은 대기 시간
-
-            return model
-
-        # 3. 미래 예측
-        def forecast_lstm(model, series, forecast_months, scaler, time_steps=12):
-            data = scaler.transform(series['y'].values.reshape(-1, 1))
-            last_sequence = data[-time_steps:]
-
-            predictions = []
-            for _ in range(forecast_months):
-                input_seq = last_sequence.reshape(1, time_steps, 1)
-                pred = model.predict(input_seq, verbose=0)
-                predictions.append(pred[0, 0])
-                last_sequence = np.append(last_sequence[1:], pred, axis=0)
-
-            forecast_scaled = np.array(predictions).reshape(-1, 1)
-            forecast_values = scaler.inverse_transform(forecast_scaled)
-
-            last_date = series.index[-1]
-            future_dates = pd.date_range(start=last_date + pd.DateOffset(months=1), periods=forecast_months, freq='MS')
-
-            result = pd.DataFrame({
-                '연도': future_dates.year,
-                '월': future_dates.month,
-                '예측 판매량': forecast_values.flatten()
-            })
-            return result
-
         # 4. 시각화 함수
-        def plot_lstm_forecast(series, forecast_df, plant_name, save_path=None):
-            forecast_index = pd.to_datetime(forecast_df['연도'].astype(str) + '-' + forecast_df['월'].astype(str))
-            forecast_values = forecast_df['예측 판매량'].values
-
-            fig3, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(series.index, series['y'], label='실제 판매량', color='black')
-            ax.plot(forecast_index, forecast_values, label='LSTM 예측', color='red', linestyle='--')
-            ax.axvline(x=series.index[-1], color='gray', linestyle=':', label='예측 시작점')
-            ax.set_title(f"{plant_name} LSTM 기반 판매량 예측")
-            ax.set_xlabel("날짜")
-            ax.set_ylabel("판매량")
-            ax.legend()
-            ax.grid(True)
-            fig3.tight_layout()
-
-            st.pyplot(fig3)
-            plt.close(fig3)
-
-            # 저장 경로 설정 및 디렉토리 생성
-            save_path = f"images/result/{plant_name} LSTM 공장별 판매량 예측.png"
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            fig3.savefig(save_path, dpi=300)
-
-            return save_path
-
         def add_download_button(forecast_df, plant_name, filename="lstm_forecast.csv"):
             csv = forecast_df.to_csv(index=False).encode('utf-8-sig')
             st.download_button(
@@ -659,32 +283,27 @@ def prediction_ui():
             forecast_df['연도'] = forecast_df['연도'].astype(int)
             forecast_df['월'] = forecast_df['월'].astype(int)
             forecast_df['예측 판매량'] = forecast_df['예측 판매량'].round()
+            for col in INTERVAL_COLUMNS:
+                if col in forecast_df:
+                    forecast_df[col] = forecast_df[col].round()
 
             # 증감률(%) 계산 및 포맷 처리
             pct_change = forecast_df['예측 판매량'].pct_change() * 100
             pct_change = pct_change.round(2)
             forecast_df['전월 대비 증감률(%)'] = pct_change.apply(lambda x: f"{x:.2f}" if pd.notnull(x) else '-')
 
-            st.subheader("예측 결과 표 (LSTM 기반)")
+            st.subheader(f"예측 결과 표 ({engine} 기반)")
             col1, col2 = st.columns([1, 0.9])
             with col1:
                 st.dataframe(forecast_df, use_container_width=True, hide_index=True)
-                filename = "LSTM_판매예측.csv"
+                filename = f"{engine_tag}_판매예측.csv"
                 add_download_button(forecast_df, plant_name, filename)
             with col2:
-                img_path = plot_lstm_forecast(plant_data, lstm_forecast, plant_name, forecast_months)
-                if os.path.exists(img_path):
-                    with open(img_path, "rb") as img_file:
-                        st.download_button(
-                            label="예측 그래프 이미지 다운로드",
-                            data=img_file,
-                            file_name=f"{plant_name}_LSTM_예측.png",
-                            mime="image/png"
-                        )
+                show_forecast_chart(plant_data, lstm_forecast, plant_name, '예측 판매량', '판매량', engine_label,
+                                    engine_tag, f"{plant_name} {engine_tag} 공장별 판매량 예측.png")
 
         # 5. 실행 예시
-        file_path = "data/processed/hyundai-by-plant.csv"
-        df = pd.read_csv(file_path)
+        df = load_raw("현대", "plant").copy()
 
         with st.expander("원본 데이터 확인") :
             st.dataframe(df)
@@ -735,31 +354,7 @@ def prediction_ui():
             if "선택하세요" in plant_name:
                 st.error("공장, 차종, 거래 구분을 선택해주세요.")
             else:
-                plant_data = df[df['공장명(국가)'] == plant_name].iloc[:, 1:].T
-                plant_data.columns = ['y']
-                plant_data.index = pd.to_datetime(plant_data.index)
-                plant_data = plant_data.asfreq('MS')
-                plant_data['y'] = pd.to_numeric(plant_data['y'], errors='coerce')
-                plant_data = plant_data.dropna()
-
-                def get_model_path(plant_name):
-                    return f"models/lstm_plant_{plant_name}_model.h5"
-
-                def get_scaler_path(plant_name):
-                    return f"models/lstm_plant_{plant_name}_scaler.pkl"
-
-                def ensure_model(plant_name):
-                    model_path = get_model_path(plant_name)
-                    scaler_path = get_scaler_path(plant_name)
-
-                    if os.path.exists(model_path) and os.path.exists(scaler_path):
-                        print(f"저장된 모델과 스케일러가 존재합니다: {model_path}")
-                        return True
-                    else:
-                        print(f"모델 또는 스케일러가 존재하지 않아 새로 학습합니다.")
-                        return False
-
-                status = ensure_model(plant_name)
+                plant_data = load_series("plant", plant_name)
 
                 # ✅ 특정 기간 값이 모두 0인지 확인
                 zero_check_range = plant_data.loc["2024-09":"2025-02", "y"]
@@ -767,21 +362,60 @@ def prediction_ui():
                     st.error("이 차는 더 이상 생산하지 않습니다.")
                     st.stop
                 else :
-                    if status:
-                        lstm_model = load_model(get_model_path(plant_name), compile=False)
-                        scaler = joblib.load(get_scaler_path(plant_name))
-                    else:
-                        st.info("모델생성을 새로 시작중입니다. 모델생성이 1분 이상 소요될 수 있습니다")
-                        with st.spinner("모델을 학습 중입니다... 잠시만 기다려주세요."):
-                            X, y, scaler = prepare_lstm_data(plant_data)
-                            lstm_model = train_lstm_model(X, y, plant_name=plant_name)
-                            joblib.dump(scaler, get_scaler_path(plant_name))
-                            # 모델이 조기 종료되지 않은 경우에만 여기서 저장
-                            if not os.path.exists(get_model_path(plant_name)):
-                                lstm_model.save(get_model_path(plant_name))
-                                
-
-                    lstm_forecast = forecast_lstm(lstm_model, plant_data, forecast_months, scaler)
-                    send_predictions_to_recommendations({"type": "plant","name": plant_name,"forecast": lstm_forecast.to_dict()})
-                    # plot_lstm_forecast(plant_data, lstm_forecast, plant_name, forecast_months)
-                    display_lstm_forecast_table(lstm_forecast, plant_name)
\ No newline at end of file
+                    lstm_forecast = run_forecast(engine, "plant", plant_name, plant_data, forecast_months, '예측 판매량', show_intervals)
+                    if lstm_forecast is not None:
+                        send_predictions_to_recommendations({"type": "plant","name": plant_name,"forecast": lstm_forecast.to_dict()})
+                        display_lstm_forecast_table(lstm_forecast, plant_name)
+
+    with tab4:
+        # 4. 계층 예측: 현대·기아 전체 지역 → 대륙 → 브랜드 → 전체를 한 번에 예측 후 정합화
+        st.caption("모든 지역을 한 번에 예측하고, 지역 합계 = 대륙 = 브랜드 = 전체가 되도록 정합화합니다. (통계 엔진 사용)")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            hier_method = st.selectbox("예측 방법", list(CLASSIC_METHODS), format_func=CLASSIC_METHODS.get,
+                                       key="hier_method")
+        with col2:
+            hier_recon = st.selectbox("정합화 방법", list(RECONCILIATION_METHODS),
+                                      format_func=RECONCILIATION_METHODS.get, key="hier_recon")
+        with col3:
+            hier_months = st.number_input("몇 개월 뒤까지 예측할까요?", min_value=1, max_value=24, value=12, key="hier_month")
+
+        if st.button("전체 계층 예측 시작"):
+            hier_forecast = forecast_hierarchy(int(hier_months), hier_method, hier_recon, include_base=True)
+            reconciled = hier_forecast[hier_forecast["구분"] == "정합"].drop(columns="구분")
+            base = hier_forecast[hier_forecast["구분"] == "개별"].drop(columns="구분")
+            month_cols = [c for c in reconciled.columns if c[:4].isdigit()]
+            st.caption(f"부모-자식 합계 최대 차이: 정합화 전 {coherence_gap(base):,.0f}대 → 정합화 후 {coherence_gap(reconciled):,.0f}대")
+
+            top = reconciled[reconciled["레벨"].isin(["전체", "브랜드"])]
+            st.line_chart(top.set_index("브랜드")[month_cols].T)
+            st.dataframe(reconciled, use_container_width=True, hide_index=True)
+            st.download_button(
+                label="계층 예측 결과 CSV 다운로드",
+                data=reconciled.to_csv(index=False).encode('utf-8-sig'),
+                file_name=f"계층예측_{hier_method}_{hier_recon}.csv",
+                mime='text/csv'
+            )
+
+    # 모델 캐시 현황 (모든 세션 공유)
+    with st.expander("🧠 모델 캐시 상태"):
+        stats = get_cache_stats()
+        st.caption(
+            f"캐시된 모델 {stats['models']}개 · 적중 {stats['hits']}회 / 미스 {stats['misses']}회 "
+            f"(적중률 {stats['hit_rate']:.0%}) · 제거 {stats['evictions']}회 · "
+            f"메모리 {stats['bytes'] / 1024 ** 2:.1f}MB / {stats['budget_bytes'] / 1024 ** 2:.0f}MB"
+        )
+        forecast_stats = get_forecast_cache_stats()
+        st.caption(
+            f"예측 결과 캐시 {forecast_stats['entries']}개 · 메모리 적중 {forecast_stats['hits']}회 / "
+            f"디스크 적중 {forecast_stats['disk_hits']}회 / 미스 {forecast_stats['misses']}회 "
+            f"(적중률 {forecast_stats['hit_rate']:.0%})"
+        )
+        plot_stats = get_plot_cache_stats()
+        st.caption(
+            f"그래프 이미지 캐시 {plot_stats['entries']}개 ({plot_stats['bytes'] / 1024 ** 2:.1f}MB) · "
+            f"적중 {plot_stats['hits']}회 / 렌더링 {plot_stats['misses']}회"
+        )
+        if st.button("예측 결과 캐시 비우기"):
+            removed = invalidate_forecasts()
+            st.success(f"저장된 예측 결과 {removed}개를 삭제했습니다.")
@@ -3,19 +3,18 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import re
 import time
+from modules.data_cube import get_cube
+from modules.data_long import query_long
+from modules.data_registry import cached_by_version, load_dataset
 
 # 생산관리 
 
-# 데이터 로딩
-@st.cache_data
+# 데이터 로딩 (공용 레지스트리 기반, 데이터 버전별로 한 번만 가공)
+@cached_by_version
 def load_data():
-    hyundai = pd.read_csv("data/processed/hyundai-by-plant.csv")
-    kia = pd.read_csv("data/processed/kia-by-plant.csv")
-
-    hyundai["브랜드"] = "현대"
-    kia["브랜드"] = "기아"
+    hyundai = load_dataset("현대", "plant").copy()
+    kia = load_dataset("기아", "plant").copy()
 
     for df in [hyundai, kia]:
         if "차종" not in df.columns:
@@ -39,11 +38,15 @@ def production_ui():
         brand = st.selectbox("브랜드 선택", df["브랜드"].unique())
         year = st.selectbox("연도 선택", list(range(2025, 2015, -1)), index=1)
         factory = st.selectbox("공장 선택", df[df["브랜드"] == brand]["공장명(국가)"].unique())
-        month_cols = [col for col in df.columns if str(col).startswith(str(year))]
 
-        filtered = df[(df["브랜드"] == brand) & (df["공장명(국가)"] == factory)]
-        df_melted = filtered.melt(id_vars=["차종"], value_vars=month_cols, var_name="월", value_name="생산량")
-        df_melted = df_melted[df_melted["생산량"] > 0]
+        # long 저장소에서 해당 브랜드/공장/연도 행만 조회 (월 순서 유지)
+        filtered = query_long("plant", brand=brand, year=year, **{"공장명(국가)": factory})
+        df_melted = (
+            filtered.loc[filtered["값"] > 0, ["차종", "연월", "값", "기간"]]
+            .sort_values("기간", kind="stable")
+            .rename(columns={"연월": "월", "값": "생산량"})
+            .drop(columns="기간")
+        )
 
         if df_melted.empty:
             st.warning("데이터가 없습니다.")
@@ -105,10 +108,14 @@ def production_ui():
         st.subheader("공장별 생산량 비교")
         brand = st.selectbox("브랜드", df["브랜드"].unique(), key="brand_tab2")
         year = st.selectbox("연도", list(range(2025, 2015, -1)), index=1)
-        month_cols = [col for col in df.columns if str(col).startswith(str(year))]
 
-        subset = df[df["브랜드"] == brand]
-        melted = subset.melt(id_vars=["공장명(국가)"], value_vars=month_cols, var_name="월", value_name="생산량")
+        subset = query_long("plant", brand=brand, year=year)
+        melted = (
+            subset[["공장명(국가)", "연월", "값", "기간"]]
+            .sort_values("기간", kind="stable")
+            .rename(columns={"연월": "월", "값": "생산량"})
+            .drop(columns="기간")
+        )
         factory_totals = melted.groupby("공장명(국가)")["생산량"].sum().reset_index()
 
         fig = px.bar(
@@ -131,29 +138,10 @@ def production_ui():
 
         brand = st.selectbox("브랜드 선택", df["브랜드"].unique(), key="brand_tab3")
         factory = st.selectbox("공장 선택", df[df["브랜드"] == brand]["공장명(국가)"].unique(), key="factory_tab3")
-        df_target = df[(df["브랜드"] == brand) & (df["공장명(국가)"] == factory)]
-        year_month_totals = []
-        for y in sorted({c[:4] for c in df.columns if re.match(r"\d{4}-\d{2}", c)}):
-            for m in range(1, 13):
-                col = f"{y}-{m:02d}"
-                if col in df.columns:
-                    total = df_target[col].sum()
-                    year_month_totals.append({"연도": y, "월": m, "총생산": total})
-
-        df_year_month = pd.DataFrame(year_month_totals)
-        
-        # 추가 정보 계산
-        annual_totals = df_year_month.groupby("연도")["총생산"].sum().reset_index()
-
-        year_month_totals = []
-        for y in sorted({c[:4] for c in df.columns if re.match(r"\d{4}-\d{2}", c)}):
-            for m in range(1, 13):
-                col = f"{y}-{m:02d}"
-                if col in df.columns:
-                    total = df_target[col].sum()
-                    year_month_totals.append({"연도": y, "월": m, "총생산": total})
-
-        df_year_month = pd.DataFrame(year_month_totals)
+        # 사전 집계 큐브에서 공장별 (연도, 월) 합계 조회
+        factory_totals = get_cube().total("plant", brand=brand, by=["공장명(국가)", "연도", "월"])
+        df_year_month = factory_totals.loc[factory].rename("총생산").reset_index()
+        df_year_month["연도"] = df_year_month["연도"].astype(str)
         
         fig_animated = px.scatter(df_year_month, x="연도", y="총생산", 
                                 size="총생산", color="총생산",
@@ -178,9 +166,7 @@ def production_ui():
         factory = st.selectbox("공장", df[df["브랜드"] == brand]["공장명(국가)"].unique(), key="factory_tab4")
         goal = st.number_input("목표 생산량 (대)", min_value=100000, step=100000, value=500000)
 
-        month_cols = [col for col in df.columns if str(col).startswith(str(year))]
-        filtered = df[(df["브랜드"] == brand) & (df["공장명(국가)"] == factory)]
-        actual = filtered[month_cols].sum(numeric_only=True).sum()
+        actual = get_cube().total("plant", brand=brand, year=year, by="공장명(국가)").get(factory, 0)
         rate = round((actual / goal) * 100, 2) if goal > 0 else 0
 
 
@@ -1,9 +1,13 @@
 import streamlit as st
 import re
 import requests
-from huggingface_hub import InferenceClient
 from bs4 import BeautifulSoup
 import json
+from core.lazy_import import lazy_import
+from modules.forecast_lstm import INTERVAL_COLUMNS, INTERVAL_LEVEL
+
+# huggingface_hub은 AI 분석 실행 시점에만 로드
+huggingface_hub = lazy_import("huggingface_hub")
 
 TEXT_MODEL_ID = "google/gemma-2-9b-it"
 
@@ -89,6 +93,17 @@ def format_news_for_prompt(news_items):
     
     return formatted_news
 
+def format_prediction_intervals(forecast):
+    # 예측 구간(하한/상한)이 있으면 월별 범위를 덧붙여 예측값이 확정치가 아님을 전달
+    lower, upper = forecast.get(INTERVAL_COLUMNS[0]), forecast.get(INTERVAL_COLUMNS[1])
+    if not lower or not upper:
+        return ""
+    years, months = list(forecast.get('연도', {}).values()), list(forecast.get('월', {}).values())
+    lines = [f"- {y}년 {m}월: {lo:,.0f} ~ {hi:,.0f}"
+             for y, m, lo, hi in zip(years, months, lower.values(), upper.values())]
+    return f"\n{INTERVAL_LEVEL:.0%} 예측 구간 (불확실성 범위):\n" + "\n".join(lines) + "\n"
+
+
 def format_predictions_for_api(predictions):
     if not predictions:
         return {}
@@ -110,6 +125,7 @@ def format_predictions_for_api(predictions):
             for i in range(len(years)):
                 result += f"| {years.get(str(i), '')} | {months.get(str(i), '')} | {exports.get(str(i), '')} |\n"
         
+        result += format_prediction_intervals(forecast)
         return result
     
     elif pred_type == 'car':
@@ -127,6 +143,7 @@ def format_predictions_for_api(predictions):
             for i in range(len(years)):
                 result += f"| {years.get(str(i), '')} | {months.get(str(i), '')} | {sales.get(str(i), '')} |\n"
         
+        result += format_prediction_intervals(forecast)
         return result
     
     elif pred_type == 'plant':
@@ -144,6 +161,7 @@ def format_predictions_for_api(predictions):
             for i in range(len(years)):
                 result += f"| {years.get(str(i), '')} | {months.get(str(i), '')} | {production.get(str(i), '')} |\n"
         
+        result += format_prediction_intervals(forecast)
         return result
     
     return str(predictions)
@@ -181,7 +199,7 @@ def generate_text_via_api(prompt: str, predictions: dict, news_items: list, mode
     full_prompt = f"{system_prompt}\n\n[예측 데이터]\n{predictions_formatted}\n\n[최신 뉴스]\n{news_text}\n\n[사용자 질문]\n{prompt}"
     
     try:
-        client = InferenceClient(model=model_name, token=token)
+        client = huggingface_hub.InferenceClient(model=model_name, token=token)
         response = client.text_generation(
             prompt=f"다음 요청에 맞는 분석을 전문가처럼 1000자 내외로 요약해줘:\n{full_prompt}",
             max_new_tokens=1000,